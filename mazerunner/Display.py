@@ -10,6 +10,7 @@ from PyQt5.QtWidgets import QMainWindow, QApplication, QPushButton, QWidget, QTa
 import mazerunner.utils.Config as Config
 from mazerunner.MazeGeneratorScene import MazeGeneratorScene
 from mazerunner.MazeRunnerScene import MazeRunnerScene
+from mazerunner.generators.Generators import GENERATORS
 
 
 class App(QMainWindow):
@@ -66,8 +67,9 @@ class TabWidget(QWidget):
         self.runner_search_combobox = QComboBox(self.runner_tab)
         self.runner_search_combobox.setGeometry(110, 11, 200, 28)
         # New solvers need to be added to this list and added to start_search in maze-runner/MazeRunner.py
-        search_options = ['Breadth First Search', 'Bidirectional BFS', 'Depth First Search', 'Bidirectional DFS',
-                          'Greedy Best First', 'A*', 'Random Sampling']
+        search_options = ['Breadth First Search', 'Wavefront BFS', 'Bidirectional BFS', 'Depth First Search',
+                          'Bidirectional DFS', 'Greedy Best First', 'A*', 'Junction Graph Dijkstra',
+                          'Junction Graph A*', 'Random Sampling', 'Lazy Random Sampling', 'Parallel BFS']
         self.runner_search_combobox.addItems(search_options)
 
         self.runner_start_button = QPushButton(self.runner_tab)
@@ -114,31 +116,36 @@ class TabWidget(QWidget):
         self.generator_rows_line_edit.setValidator(QIntValidator(1, 99))
         self.generator_rows_line_edit.setText(str(Config.DEFAULT_MAZE_ROWS))
 
+        self.generator_algorithm_combobox = QComboBox(self.generator_tab)
+        self.generator_algorithm_combobox.setGeometry(305, 11, 200, 28)
+        # New generators need to be added to GENERATORS in maze-runner/generators/Generators.py
+        self.generator_algorithm_combobox.addItems(list(GENERATORS))
+
         self.generator_start_button = QPushButton(self.generator_tab)
-        self.generator_start_button.setGeometry(QRect(305, 10, 90, 30))
+        self.generator_start_button.setGeometry(QRect(515, 10, 90, 30))
         self.generator_start_button.setText("Generate")
         self.generator_start_button.clicked.connect(self.start_generation_on_click)
 
         self.generator_save_button = QPushButton(self.generator_tab)
-        self.generator_save_button.setGeometry(QRect(405, 10, 90, 30))
+        self.generator_save_button.setGeometry(QRect(615, 10, 90, 30))
         self.generator_save_button.setText("Save Maze")
         self.generator_save_button.clicked.connect(self.save_maze_on_click)
 
         self.generator_pause_button = QPushButton(self.generator_tab)
-        self.generator_pause_button.setGeometry(QRect(505, 10, 90, 30))
+        self.generator_pause_button.setGeometry(QRect(715, 10, 90, 30))
         self.generator_pause_button.setText("Pause")
         self.generator_pause_button.setCheckable(True)
         self.generator_pause_button.clicked.connect(self.toggle_pause_generator)
 
         self.generator_render_progress_button = QPushButton(self.generator_tab)
-        self.generator_render_progress_button.setGeometry(QRect(605, 10, 150, 30))
+        self.generator_render_progress_button.setGeometry(QRect(815, 10, 150, 30))
         self.generator_render_progress_button.setText("Show Progress")
         self.generator_render_progress_button.setCheckable(True)
         self.generator_render_progress_button.setChecked(True)
         self.generator_render_progress_button.clicked.connect(self.toggle_render_generator)
 
         self.generator_console_label = QLabel(self.generator_tab)
-        self.generator_console_label.setGeometry(765, 10, 1000, 30)
+        self.generator_console_label.setGeometry(975, 10, 1000, 30)
         self.generator_console_label.setText('')
 
         # Add tabs to layout
@@ -174,6 +181,10 @@ class TabWidget(QWidget):
         if not self.runner_scene.maze_loaded:
             self.runner_console_label.setText('Maze not loaded.')
             self.fade_label(self.runner_console_label)
+        elif self.runner_scene.maze_stats is not None:
+            stats = self.runner_scene.maze_stats
+            self.runner_console_label.setText('Dead ends: {}, diameter: {}, path length: {}'.format(
+                stats['dead_ends'], stats.get('diameter', '-'), stats['path_length']))
 
     @pyqtSlot(name="runner_start_search")
     def start_search_on_click(self):
@@ -204,7 +215,8 @@ class TabWidget(QWidget):
         """ Starts the generation of a maze of the size defined by the user. """
         self.generator_scene.set_maze_dimensions(int(self.generator_columns_line_edit.text()),
                                                  int(self.generator_rows_line_edit.text()))
-        self.generator_scene.start_generation_on_click(self.generator_pause_button.isChecked())
+        self.generator_scene.start_generation_on_click(self.generator_pause_button.isChecked(),
+                                                       self.generator_algorithm_combobox.currentText())
 
     @pyqtSlot(name="generator_save_maze")
     def save_maze_on_click(self):
@@ -1,124 +1,159 @@
 from PyQt5.QtCore import QLineF, QRectF
 
 import mazerunner.utils.Config as Config
+from mazerunner.MazeGrid import VISITED, IN_QUEUE, CHANGED
 
 
 class GeneratorCell:
-    """ Object representing a cell on the generator grid. Each cell starts with walls on its lower or right edge and
-    these are removed by the generation algorithm. Its x and y coordinates define where in the grid the cell resides.
+    """ Object representing a cell on the generator grid. The cell is a view of a single cell of a MazeGrid, which holds
+    its walls and its status flags as a single bitfield, and stores the display items used to render it. Its x and y
+    coordinates define where in the grid the cell resides. Cells use slots and generate their lines and fill only when
+    they are drawn, so a cell costs little more than its references to the items in the scene.
     """
 
-    def __init__(self, x, y, scene):
-        # Coordinates of the cell
-        self.x = x
-        self.y = y
+    __slots__ = ('grid', 'index', 'scene', 'line_items', 'rect_item')
+
+    def __init__(self, grid, index, scene):
+        # The grid which holds the state of this cell and its position in it
+        self.grid = grid
+        self.index = index
         # The parent scene which contains this cell
         self.scene = scene
-        # Whether the cell walls should be rendered
-        self.walls = {'bottom': True,
-                      'right': True
-                      }
-        # Whether or not the cell has been visited
-        self._visited = False
-        # Whether the cell has been added to the queue, used for rendering
-        self._in_queue = False
-        # Whether it has been changed since last render
-        self.changed = False
-        # The cell walls
-        self._lines = []
-        self.generate_lines()
-        # Store reference to line objects in order to remove them later
-        self.line_items = []
-        # The cell fill rect, pen and brush
-        self.fill_rect = []
+        # Store reference to line objects in order to remove them later, a list is only allocated once there are some
+        self.line_items = ()
         self.rect_item = None
 
-    def generate_lines(self):
-        """ Populates the lines array with the cell walls defined by self.walls."""
-        del self._lines[:]
+    @property
+    def x(self):
+        """ Returns the column of the cell. """
+        return self.index % self.grid.columns
+
+    @property
+    def y(self):
+        """ Returns the row of the cell. """
+        return self.index // self.grid.columns
 
+    def generate_lines(self):
+        """ Returns a list of lines for the cell walls held by the grid."""
+        lines = []
+        x, y = self.grid.get_coordinates(self.index)
         side_length = self.scene.cell_dimension
-        xc = self.x * side_length  # x position of top left corner
-        yc = self.y * side_length  # y position of top left corner
+        xc = x * side_length  # x position of top left corner
+        yc = y * side_length  # y position of top left corner
 
         """
-        Due to the way the cells are created, each cell can only have a bottom or right wall to ensure internal walls 
+        Due to the way the cells are created, each cell can only have a bottom or right wall to ensure internal walls
         are not duplicated. That is a cell (3, 4) with a right wall would mean cell (4, 4) has a left wall. Thus to
-        complete the grid, left and top walls are also returned for external walls, namely row and 
+        complete the grid, left and top walls are also returned for external walls, namely row and
         column 0. For an (n x m) grid this saves 2(n-1)(m-1) lines from being rendered.
         """
 
-        if self.walls.get('bottom'):
-            self._lines.append(QLineF(xc, yc + side_length, xc + side_length, yc + side_length))  # Bottom
-        if self.walls.get('right'):
-            self._lines.append(QLineF(xc + side_length, yc, xc + side_length, yc + side_length))  # Right
-        if self.y == 0:
-            self._lines.append(QLineF(xc, yc, xc + side_length, yc))  # Top, only cells in the first row
-        if self.x == 0:
-            self._lines.append(QLineF(xc, yc, xc, yc + side_length))  # Left, only cells in the first column
+        if self.grid.has_bottom_wall(self.index):
+            lines.append(QLineF(xc, yc + side_length, xc + side_length, yc + side_length))  # Bottom
+        if self.grid.has_right_wall(self.index):
+            lines.append(QLineF(xc + side_length, yc, xc + side_length, yc + side_length))  # Right
+        if y == 0:
+            lines.append(QLineF(xc, yc, xc + side_length, yc))  # Top, only cells in the first row
+        if x == 0:
+            lines.append(QLineF(xc, yc, xc, yc + side_length))  # Left, only cells in the first column
+        return lines
 
     def generate_fill(self):
-        """ Sets the fill rectangle, pen and brush based on the cell's state. """
-        del self.fill_rect[:]
-        if self._in_queue:
+        """ Returns the fill rectangle, pen and brush based on the cell's state, or an empty list if the cell is not
+        filled. """
+        if self.in_queue:
             # In queue
-            self.set_fill_rect(Config.CELL_QUEUE_PEN, Config.CELL_QUEUE_BRUSH)
-        elif self._visited:
+            return self.create_fill_rect(Config.CELL_QUEUE_PEN, Config.CELL_QUEUE_BRUSH)
+        elif self.visited:
             # Visited
-            self.set_fill_rect(Config.CELL_VISITED_PEN, Config.CELL_VISITED_BRUSH)
+            return self.create_fill_rect(Config.CELL_VISITED_PEN, Config.CELL_VISITED_BRUSH)
+        return []
 
     def get_fill_rect(self):
         """ Returns a QRect which defines the cell's colour based on its current status. """
-        self.generate_fill()
-        return self.fill_rect
+        return self.generate_fill()
 
-    def set_fill_rect(self, pen, brush):
-        """ Creates a rect to fill the cell with the given pen and brush and sets it as the fill_rect. """
+    def create_fill_rect(self, pen, brush):
+        """ Returns a rect to fill the cell with the given pen and brush. """
         side_length = self.scene.cell_dimension
-        rect = QRectF(self.x * side_length + 1, self.y * side_length + 1, side_length - 1, side_length - 1)
-        self.fill_rect = [rect, pen, brush]
+        x, y = self.grid.get_coordinates(self.index)
+        rect = QRectF(x * side_length + 1, y * side_length + 1, side_length - 1, side_length - 1)
+        return [rect, pen, brush]
+
+    @property
+    def walls(self):
+        """ Returns the walls of this cell as a dictionary. """
+        return {'bottom': self.grid.has_bottom_wall(self.index),
+                'right': self.grid.has_right_wall(self.index)
+                }
 
     def set_wall(self, wall, value):
         """ Sets the render value for wall. Wall must be in {bottom, right} and value must be boolean. """
-        self.walls[wall] = value
-        self.changed = True
+        if wall == 'bottom':
+            self.grid.set_bottom_wall(self.index, value)
+        else:
+            self.grid.set_right_wall(self.index, value)
+
+    def get_flag(self, flag):
+        """ Returns whether the given status flag is set for this cell. """
+        return bool(self.grid.has_flag(self.index, flag))
+
+    def put_flag(self, flag, value):
+        """ Sets or clears the given status flag for this cell. """
+        if value:
+            self.grid.set_flag(self.index, flag)
+        else:
+            self.grid.clear_flag(self.index, flag)
 
     @property
     def visited(self):
         """ Returns the visited status of this cell. """
-        return self._visited
+        return self.get_flag(VISITED)
 
     @visited.setter
     def visited(self, value):
         """ Sets the visited status to value. """
-        self._visited = value
-        self.changed = True
+        self.put_flag(VISITED, value)
 
     @property
     def in_queue(self):
         """ Returns the queue status of this cell. """
-        return self._in_queue
+        return self.get_flag(IN_QUEUE)
 
     @in_queue.setter
     def in_queue(self, value):
         """ Sets queue status to value. """
-        self._in_queue = value
-        self.changed = True
+        self.put_flag(IN_QUEUE, value)
+
+    @property
+    def changed(self):
+        """ Returns whether the cell has been changed since the last render. """
+        return self.get_flag(CHANGED)
+
+    @changed.setter
+    def changed(self, value):
+        """ Sets the changed status to value. """
+        if value:
+            self.grid.flags[self.index] |= CHANGED
+        else:
+            self.grid.flags[self.index] &= ~CHANGED
 
     @property
     def lines(self):
         """ Returns the line's to render the cell's walls. """
-        self.generate_lines()
-        return self._lines
+        return self.generate_lines()
 
     def add_line_item(self, line):
         """ Stores a QGraphicsLineItem. These are generated by QGraphicsScene.addLine and a reference must be stored in
         order to remove it from the scene. """
-        self.line_items.append(line)
+        if self.line_items:
+            self.line_items.append(line)
+        else:
+            self.line_items = [line]
 
     def clear_line_items(self):
         """ Clears the stored QGraphicsLineItems. """
-        del self.line_items[:]
+        self.line_items = ()
 
     def __repr__(self):
         """ Override the string representation. """
@@ -0,0 +1,105 @@
+""" An archive holding many mazes in a single compressed file.
+
+The archive is a zip file with one member per maze, in the binary format described in MazeFile, compressed on its
+own. The zip central directory serves as the index: the comment of each member holds its entry, a JSON object with
+the dimensions, content hash, generator algorithm, seed and statistics of the maze. Opening an archive only reads the
+central directory, and reading a maze decompresses only its member, so any maze can be found and loaded without
+touching the others. Mazes are named by their dimensions and hash, and a maze already in the archive is not added
+again.
+"""
+import json
+import zipfile
+
+from mazerunner.MazeFile import decode_binary, encode_binary, hash_walls
+from mazerunner.MazeStats import get_stats
+
+ARCHIVE_EXTENSION = '.zip'
+COMPRESSION = zipfile.ZIP_DEFLATED
+
+
+class MazeArchive:
+    """ A maze archive opened for reading, with mode 'r', or for reading and appending, with mode 'a', which creates
+    the archive if it does not exist. Use as a context manager or call close, the index of an archive opened for
+    appending is only written when it is closed. """
+
+    def __init__(self, filename, mode='r', compression=COMPRESSION):
+        self.file = zipfile.ZipFile(filename, mode, compression=compression)
+        # Entries by member name, in the order they were added
+        self.entries = {}
+        for info in self.file.infolist():
+            try:
+                entry = json.loads(info.comment)
+            except ValueError:
+                # Not a maze added by append
+                continue
+            entry['name'] = info.filename
+            entry['file_size'] = info.file_size
+            entry['compressed_size'] = info.compress_size
+            self.entries[info.filename] = entry
+        self.names_by_hash = {entry['hash']: name for name, entry in self.entries.items()}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.close()
+
+    def close(self):
+        """ Closes the archive, writing its index if any mazes were added. """
+        self.file.close()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def find(self, **criteria):
+        """ Returns the entries, in the order they were added, whose values match all of the given criteria, such as
+        columns=60 or algorithm="Kruskal's". """
+        return [entry for entry in self.entries.values()
+                if all(entry.get(key) == value for key, value in criteria.items())]
+
+    def read(self, name, verify=False):
+        """ Returns the maze with the given member name as a MazeGrid, or None if it is not a valid maze. If verify is
+        true the walls are checked against the hash in the maze header. """
+        return decode_binary(bytearray(self.file.read(name)), verify)
+
+    def append(self, grid, algorithm=None, seed=None, stats=None):
+        """ Adds the maze to the archive along with the algorithm and seed it was generated with, if they are known,
+        and returns the name of its member. The statistics of the maze are computed if they are not given. If a maze
+        with the same walls is already in the archive, nothing is added and the name of that maze is returned. """
+        digest = hash_walls(grid.bottom, grid.right).hex()
+        if digest in self.names_by_hash:
+            return self.names_by_hash[digest]
+        entry = {
+            'columns': grid.columns,
+            'rows': grid.rows,
+            'hash': digest,
+            'algorithm': algorithm,
+            'seed': seed,
+            'stats': get_stats(grid) if stats is None else stats,
+        }
+        name = "maze-{}x{}-{}.maze".format(grid.columns, grid.rows, digest)
+        info = zipfile.ZipInfo(name)
+        info.compress_type = self.file.compression
+        info.comment = json.dumps(entry, separators=(',', ':')).encode()
+        self.file.writestr(info, b''.join(encode_binary(grid)))
+        info = self.file.getinfo(name)
+        entry['name'] = name
+        entry['file_size'] = info.file_size
+        entry['compressed_size'] = info.compress_size
+        self.entries[name] = entry
+        self.names_by_hash[digest] = name
+        return name
+
+
+def is_archive(filename):
+    """ Returns true if the file is a maze archive rather than a single maze. """
+    return zipfile.is_zipfile(filename)
+
+
+def read_archived_maze(filename, name):
+    """ Returns the maze with the given member name from the archive as a MazeGrid, or None if it is not a valid maze
+    or not in the archive. """
+    with MazeArchive(filename) as archive:
+        if name not in archive.entries:
+            return None
+        return archive.read(name)
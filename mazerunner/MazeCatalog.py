@@ -0,0 +1,169 @@
+""" A persistent catalog of the mazes in a directory, so mazes can be listed and filtered without opening them.
+
+The catalog is a JSON file, CATALOG_NAME, kept in the maze directory. It holds an entry for each text and binary maze
+file in the directory with its dimensions, content hash and statistics, as computed by MazeStats. Each entry also
+records the modification time and size of its file when it was read. A refresh only reads files which are new or whose
+time or size has changed, and only recomputes the statistics of a file whose walls match no maze already catalogued.
+Loading a maze in the runner only updates the entry of that file, so a large maze elsewhere in the directory is not
+read until the next refresh. Maze archives are not catalogued, as they hold their own index.
+"""
+import json
+import os
+from operator import itemgetter
+
+from mazerunner.MazeFile import hash_walls, read_maze, write_atomically
+from mazerunner.MazeStats import get_stats
+
+CATALOG_NAME = 'catalog.json'
+CATALOG_VERSION = 1
+MAZE_EXTENSIONS = ('.txt', '.maze')
+# Statistics held in the stats of each entry, which find looks up there rather than in the entry itself
+STATS_KEYS = ('dead_ends', 'diameter', 'path_length')
+
+
+class MazeCatalog:
+    """ The catalog of a maze directory. The catalog file is loaded when the catalog is created, call refresh to bring
+    it up to date with the directory and save it. """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.filename = os.path.join(directory, CATALOG_NAME)
+        # Entries by file name, relative to the directory
+        self.entries = {}
+        # Modification time and size of the files which are not valid mazes, so they are not read again until changed
+        self.invalid = {}
+        try:
+            with open(self.filename, 'rb') as file:
+                catalog = json.load(file)
+            if catalog.get('version') == CATALOG_VERSION:
+                self.entries = catalog['entries']
+                self.invalid = catalog.get('invalid', {})
+        except (OSError, ValueError):
+            # A missing or unreadable catalog is rebuilt by the next refresh
+            pass
+
+    def refresh(self):
+        """ Updates the catalog to match the maze files in the directory and saves it if anything changed. Returns the
+        number of files which were read. """
+        entries = {}
+        invalid = {}
+        # Statistics of the catalogued mazes by hash, reused for files which were touched, copied or renamed
+        stats_by_hash = {entry['hash']: entry['stats'] for entry in self.entries.values()}
+        read = 0
+        with os.scandir(self.directory) as scan:
+            for item in scan:
+                if not item.name.endswith(MAZE_EXTENSIONS) or not item.is_file():
+                    continue
+                status = item.stat()
+                version = [status.st_mtime_ns, status.st_size]
+                if self.invalid.get(item.name) == version:
+                    invalid[item.name] = version
+                    continue
+                entry = self.entries.get(item.name)
+                if entry is None or [entry['mtime'], entry['file_size']] != version:
+                    read += 1
+                    entry = create_entry(item.path, stats_by_hash)
+                    if entry is None:
+                        invalid[item.name] = version
+                        continue
+                    entry['mtime'], entry['file_size'] = version
+                entries[item.name] = entry
+        changed = read > 0 or entries.keys() != self.entries.keys() or invalid.keys() != self.invalid.keys()
+        self.entries = entries
+        self.invalid = invalid
+        if changed:
+            self.save()
+        return read
+
+    def update(self, name, grid=None):
+        """ Brings the entry of the maze file with the given name, relative to the directory, up to date and saves the
+        catalog if it changed, without looking at any other file. The file is only read if it is new or has changed
+        since it was catalogued, and grid may be given if it has already been read. Returns the entry, or None if the
+        file is not a valid maze. """
+        path = os.path.join(self.directory, name)
+        status = os.stat(path)
+        version = [status.st_mtime_ns, status.st_size]
+        entry = self.entries.get(name)
+        if entry is not None and [entry['mtime'], entry['file_size']] == version:
+            return entry
+        if self.invalid.get(name) == version:
+            return None
+        stats_by_hash = {entry['hash']: entry['stats'] for entry in self.entries.values()}
+        entry = create_entry(path, stats_by_hash, grid)
+        if entry is None:
+            self.entries.pop(name, None)
+            self.invalid[name] = version
+        else:
+            entry['mtime'], entry['file_size'] = version
+            self.entries[name] = entry
+            self.invalid.pop(name, None)
+        self.save()
+        return entry
+
+    def save(self):
+        """ Writes the catalog file. """
+        catalog = {'version': CATALOG_VERSION, 'entries': self.entries, 'invalid': self.invalid}
+        write_atomically(self.filename, [json.dumps(catalog, separators=(',', ':')).encode()])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, name):
+        """ Returns the entry of the maze file with the given name, relative to the directory, or None if it is not
+        catalogued. """
+        return self.entries.get(name)
+
+    def find(self, **criteria):
+        """ Returns the entries whose values, or statistics, match all of the given criteria, such as columns=60 or
+        dead_ends=10, in the order they were catalogued. """
+        entry_keys = [key for key in criteria if key not in STATS_KEYS]
+        stats_keys = [key for key in criteria if key in STATS_KEYS]
+        get_entry_values = create_getter(entry_keys)
+        get_stats_values = create_getter(stats_keys)
+        entry_values = tuple(criteria[key] for key in entry_keys)
+        stats_values = tuple(criteria[key] for key in stats_keys)
+        return [entry for entry in self.entries.values()
+                if get_entry_values(entry) == entry_values and get_stats_values(entry['stats']) == stats_values]
+
+
+def create_entry(filename, stats_by_hash, grid=None):
+    """ Returns the catalog entry for the maze file, without its modification time and size, or None if it is not a
+    valid maze. Statistics are taken from stats_by_hash if a maze with the same walls has already been catalogued. The
+    file is read unless its maze is given as grid. """
+    if grid is None:
+        grid = read_maze(filename)
+    if grid is None:
+        return None
+    digest = hash_walls(grid.bottom, grid.right).hex()
+    stats = stats_by_hash.get(digest)
+    if stats is None:
+        stats = stats_by_hash[digest] = get_stats(grid)
+    return {
+        'columns': grid.columns,
+        'rows': grid.rows,
+        'hash': digest,
+        'stats': stats,
+    }
+
+
+def create_getter(keys):
+    """ Returns a function which returns a tuple of the values of the given keys in a dictionary. """
+    if not keys:
+        return lambda dictionary: ()
+    if len(keys) == 1:
+        getter = itemgetter(keys[0])
+        return lambda dictionary: (getter(dictionary),)
+    return itemgetter(*keys)
+
+
+def get_catalogued_stats(filename, grid=None):
+    """ Returns the statistics of the maze file from the catalog of its directory, or None if the file is not a valid
+    maze or the catalog cannot be written. Only the entry of this file is brought up to date, so other new or changed
+    files in the directory, however large, are left for the next refresh. grid may be given if the file has already
+    been read, so that it is not read again. """
+    catalog = MazeCatalog(os.path.dirname(os.path.abspath(filename)))
+    try:
+        entry = catalog.update(os.path.basename(filename), grid)
+    except OSError:
+        return None
+    return None if entry is None else entry['stats']
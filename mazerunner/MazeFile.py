@@ -0,0 +1,260 @@
+""" Reading and writing of maze files. Two formats are supported and told apart by their first bytes.
+
+The text format has the dimensions of the maze on the first line in the format "columns rows" (two integers separated
+by a space). Then there are columns x rows lines, each containing 2 binary digits indicating whether the cell has a
+bottom or right wall.
+
+The binary format starts with a fixed header, HEADER, holding the magic bytes MAGIC, the format version, the size of
+the header, the number of columns and rows and a hash of the walls. The header is followed by the bottom and then the
+right wall bitmaps, packed exactly as MazeGrid holds them. All integers are little endian.
+"""
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+
+from mazerunner.MazeGrid import MazeGrid, get_bitmap_length
+
+MAGIC = b'MAZE'
+VERSION = 1
+# Magic bytes, version, header size, columns, rows and the content hash of the walls
+HEADER = struct.Struct('<4sHHII16s')
+HASH_SIZE = 16
+# Number of bytes of a text maze decoded at a time
+TEXT_CHUNK_SIZE = 1 << 20
+# Whitespace which may appear within the lines of a text maze
+SPACES = b' \t\r\x0b\x0c'
+# Number of bytes of a file read at a time to hash its walls
+HASH_CHUNK_SIZE = 1 << 16
+# Longest line accepted in a text maze, which stops a file without line breaks from being read in whole
+MAX_LINE_LENGTH = 1024
+
+
+def read_maze(filename):
+    """ Returns the maze in the given file, in either format, as a MazeGrid, or None if the file is not a valid
+    maze. """
+    with open(filename, 'rb') as file:
+        magic = file.read(len(MAGIC))
+    if magic == MAGIC:
+        return read_binary(filename)
+    return read_text(filename)
+
+
+def read_text(filename):
+    """ Returns the maze in the given text file as a MazeGrid, or None if the file is malformed, the dimensions are not
+    positive or the number of cells does not match them. The file is read in chunks of TEXT_CHUNK_SIZE bytes and the
+    digits of each chunk are packed straight into the wall bitmaps, so the memory used is bounded by the size of the
+    grid rather than the file. The search arrays of the grid are not allocated. """
+    with open(filename, 'rb') as file:
+        try:
+            columns, rows = [int(x) for x in file.readline().split()]
+        except ValueError:
+            return None
+        if columns <= 0 or rows <= 0:
+            return None
+        grid = MazeGrid(columns, rows, walls=False, search=False)
+        index = 0
+        # Digits of the cells which have been read but not packed, and the start of a line split across two chunks
+        pending = b''
+        partial = b''
+        while True:
+            chunk = file.read(TEXT_CHUNK_SIZE)
+            if chunk:
+                data = partial + chunk
+                end = data.rfind(b'\n') + 1
+                data, partial = data[:end], data[end:]
+                if len(partial) > MAX_LINE_LENGTH:
+                    return None
+            else:
+                data = partial + b'\n'
+            compact = data.translate(None, SPACES)
+            digits = compact.translate(None, b'\n')
+            if not has_two_digits_per_line(compact, digits):
+                return None
+            digits = pending + digits
+            cells = len(digits) >> 1
+            if index + cells > grid.size:
+                return None
+            # Cells are packed eight at a time so that each chunk fills whole bytes, except at the end of the file
+            packed = cells if not chunk else cells & ~7
+            pack_digits(grid.bottom, index, digits[0:2 * packed:2])
+            pack_digits(grid.right, index, digits[1:2 * packed:2])
+            index += packed
+            pending = digits[2 * packed:]
+            if not chunk:
+                break
+
+    if index != grid.size:
+        return None
+    return grid
+
+
+def read_binary(filename, verify=False):
+    """ Returns the maze in the given binary file as a MazeGrid, or None if the file is not a valid maze. The file is
+    memory mapped copy on write and the wall bitmaps of the grid are views of the mapping, so no walls are read until
+    they are used and changes to the grid are never written back. The search arrays of the grid are not allocated.
+    If verify is true the walls are checked against the hash in the header, which reads the whole file. """
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < HEADER.size:
+            return None
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    return decode_binary(memoryview(mapping), verify)
+
+
+def decode_binary(data, verify=False):
+    """ Returns the maze held in data, a writable bytes-like object in the binary format, as a MazeGrid, or None if it
+    is not a valid maze. The wall bitmaps of the grid are views of data rather than copies. """
+    if len(data) < HEADER.size:
+        return None
+    magic, version, header_size, columns, rows, digest = HEADER.unpack_from(data)
+    length = get_bitmap_length(columns * rows)
+    if magic != MAGIC or version != VERSION or header_size < HEADER.size or len(data) != header_size + 2 * length:
+        return None
+    view = memoryview(data)
+    bottom = view[header_size:header_size + length]
+    right = view[header_size + length:header_size + 2 * length]
+    if verify and hash_walls(bottom, right) != digest:
+        return None
+    return MazeGrid(columns, rows, bitmaps=(bottom, right), search=False)
+
+
+def write_text(grid, filename):
+    """ Writes the maze to the given file in the text format. The whole file is built in memory from the wall bitmaps
+    and written at once, as by write_atomically. """
+    size = grid.size
+    # Each cell is a line break followed by two binary digits, ordered bottom, right, where a 1 represents a wall
+    cells = bytearray(3 * size)
+    cells[0::3] = b'\n' * size
+    cells[1::3] = unpack_digits(grid.bottom, size)
+    cells[2::3] = unpack_digits(grid.right, size)
+    write_atomically(filename, [b"%d %d" % (grid.columns, grid.rows), cells])
+
+
+def write_binary(grid, filename):
+    """ Writes the maze to the given file in the binary format, as by write_atomically. """
+    write_atomically(filename, encode_binary(grid))
+
+
+def encode_binary(grid):
+    """ Returns the maze in the binary format as a list of bytes-like parts, the header and the two wall bitmaps. """
+    header = HEADER.pack(MAGIC, VERSION, HEADER.size, grid.columns, grid.rows, hash_walls(grid.bottom, grid.right))
+    return [header, grid.bottom, grid.right]
+
+
+def write_text_rows(filename, columns, rows, walls):
+    """ Writes a maze to the given file in the text format one row at a time, as by open_atomically. walls is an
+    iterable yielding a (bottom, right) pair for each row, holding a '0' or '1' digit for each cell in the row, so only
+    one row is held in memory at a time. """
+    with open_atomically(filename) as file:
+        file.write(b"%d %d" % (columns, rows))
+        line = bytearray(3 * columns)
+        line[0::3] = b'\n' * columns
+        for bottom, right in walls:
+            line[1::3] = bottom
+            line[2::3] = right
+            file.write(line)
+
+
+def write_binary_rows(filename, columns, rows, walls):
+    """ Writes a maze to the given file in the binary format one row at a time, as by open_atomically. walls is an
+    iterable as for write_text_rows. The two bitmaps are written through two handles to the file, each at its own
+    position, with the digits which do not yet fill a byte carried over to the next row. The header, which holds the
+    hash of the walls, is written last and the right bitmap is read back to hash it, so only a row of each bitmap is
+    held in memory at a time. """
+    length = get_bitmap_length(columns * rows)
+    digest = hashlib.blake2b(digest_size=HASH_SIZE)
+    with open_atomically(filename) as file, open(file.name, 'r+b') as right_file:
+        file.write(bytes(HEADER.size))
+        right_file.seek(HEADER.size + length)
+        bottom_pending = right_pending = b''
+        for bottom, right in walls:
+            bottom_pending += bottom
+            right_pending += right
+            whole = len(bottom_pending) & ~7
+            packed = digits_to_bytes(bottom_pending[:whole])
+            digest.update(packed)
+            file.write(packed)
+            right_file.write(digits_to_bytes(right_pending[:whole]))
+            bottom_pending = bottom_pending[whole:]
+            right_pending = right_pending[whole:]
+        packed = digits_to_bytes(bottom_pending)
+        digest.update(packed)
+        file.write(packed)
+        right_file.write(digits_to_bytes(right_pending))
+        right_file.seek(HEADER.size + length)
+        for chunk in iter(lambda: right_file.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, HEADER.size, columns, rows, digest.digest()))
+
+
+def write_atomically(filename, parts):
+    """ Writes the parts, bytes-like objects, to the given file, as by open_atomically. """
+    with open_atomically(filename) as file:
+        file.writelines(parts)
+
+
+@contextmanager
+def open_atomically(filename):
+    """ Returns a context manager which opens a temporary file in the same directory as filename for reading and
+    writing in binary mode, then renames it to filename when the block is left. The file is therefore either replaced
+    whole or, if the block raises an exception, left as it was. """
+    directory, name = os.path.split(os.fspath(filename))
+    descriptor, temporary = tempfile.mkstemp(dir=directory or '.', prefix=name, suffix='.tmp')
+    os.close(descriptor)
+    try:
+        # Temporary files are only readable by their owner, so give the file the mode open would have created it with
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temporary, 0o666 & ~umask)
+        with open(temporary, 'w+b') as file:
+            yield file
+        os.replace(temporary, filename)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def has_two_digits_per_line(compact, digits):
+    """ Returns true if compact, whole lines of a text maze with the spaces removed, holds only blank lines and lines of
+    two digits. digits is compact without its line breaks. Without blank lines every third byte is a line break, which
+    is checked with a single slice, otherwise the lines are split and checked one at a time. """
+    if digits.translate(None, b'01'):
+        return False
+    if len(compact) == 3 * (len(compact) - len(digits)):
+        return not compact[2::3].translate(None, b'\n')
+    return all(len(line) == 2 for line in compact.split())
+
+
+def unpack_digits(bitmap, size):
+    """ Returns the first size bits of the bitmap as a string of '0' and '1' digits, the reverse of pack_digits. """
+    bits = len(bitmap) * 8
+    # The digits of the whole bitmap as a number are reversed so that the lowest bit of the first byte comes first
+    return format(int.from_bytes(bitmap, 'little'), '0{}b'.format(bits)).encode('ascii')[::-1][:size]
+
+
+def pack_digits(bitmap, index, digits):
+    """ Packs a string of '0' and '1' digits into the bitmap, starting at a bit index which is a multiple of eight. """
+    if digits:
+        packed = digits_to_bytes(digits)
+        bitmap[index >> 3:(index >> 3) + len(packed)] = packed
+
+
+def digits_to_bytes(digits):
+    """ Returns a string of '0' and '1' digits packed into bytes, eight digits to a byte with the first as the lowest
+    bit of the first byte. The bits after the last digit are zero. """
+    if not digits:
+        return b''
+    # The digits are reversed so that the first becomes the lowest bit of the first byte
+    return int(digits[::-1], 2).to_bytes(get_bitmap_length(len(digits)), 'little')
+
+
+def hash_walls(bottom, right):
+    """ Returns the hash identifying a maze by its wall bitmaps. Mazes with the same dimensions and walls have the same
+    hash. """
+    digest = hashlib.blake2b(digest_size=HASH_SIZE)
+    digest.update(bottom)
+    digest.update(right)
+    return digest.digest()
@@ -4,7 +4,9 @@ from PyQt5.QtCore import QCoreApplication
 from PyQt5.QtWidgets import QGraphicsScene
 
 import mazerunner.utils.Config as Config
+from mazerunner.GeneratorCell import GeneratorCell
 from mazerunner.MazeGenerator import MazeGenerator
+from mazerunner.generators.Generators import DEFAULT_ALGORITHM
 
 
 class MazeGeneratorScene(QGraphicsScene):
@@ -17,6 +19,8 @@ class MazeGeneratorScene(QGraphicsScene):
         self.cell_dimension = Config.DEFAULT_CELL_DIMENSION
         self.render_progress = True
         self.generator = MazeGenerator(self)
+        # Cells which render the grid held by the generator
+        self.cells = []
 
     def init_grid(self):
         """ Initialise the grid display. """
@@ -26,26 +30,33 @@ class MazeGeneratorScene(QGraphicsScene):
         self.setSceneRect(0, Config.WINDOW_HEIGHT * Config.MAZE_WINDOW_VERTICAL_OFFSET_FACTOR, width, height)
         self.setItemIndexMethod(QGraphicsScene.NoIndex)
 
-        cells = self.generator.cells
-        for cell in cells:
+        grid = self.generator.grid
+        self.cells = [GeneratorCell(grid, index, self) for index in range(grid.size)]
+        for cell in self.cells:
             lines = cell.lines
             for line in lines:
                 cell.add_line_item(self.addLine(line, Config.CELL_WALL_PEN))
-            fill = cell.fill_rect
+            fill = cell.get_fill_rect()
             if len(fill) > 0:
-                cell.set_rect_item(self.addRect(fill[0], fill[1], fill[2]))
+                cell.rect_item = self.addRect(fill[0], fill[1], fill[2])
+            cell.changed = False
 
-    def start_generation_on_click(self, paused):
-        """ Start maze generation. """
+    def start_generation_on_click(self, paused, algorithm=DEFAULT_ALGORITHM):
+        """ Start maze generation with the named algorithm. Only the depth first search is animated, other algorithms
+        carve the whole maze at once. """
         self.generator.running = False
         self.delete_grid()
         self.set_cell_dimension()
         self.generator = MazeGenerator(self)
+        if algorithm != DEFAULT_ALGORITHM or (not self.render_progress and not paused):
+            # Only the depth first search is animated, and there is no need to when nothing would be drawn
+            self.generator.carve(algorithm)
         self.init_grid()
         self.update_scene()
-        self.generator.running = True
-        self.generator.paused = paused
-        self.generator.generate()
+        if not self.generator.finished:
+            self.generator.running = True
+            self.generator.paused = paused
+            self.generator.generate()
 
     def update_scene(self):
         """ If rendering is not suppressed or if the generator has finished, the display is updated. """
@@ -57,7 +68,7 @@ class MazeGeneratorScene(QGraphicsScene):
     def update_grid(self):
         """ For any cell which has been changed since the last update, delete its items and redraw it to its current
         state. """
-        for cell in self.generator.cells:
+        for cell in self.cells:
             if cell.changed:
                 # Remove old display items
                 old_lines = cell.line_items
@@ -78,7 +89,7 @@ class MazeGeneratorScene(QGraphicsScene):
 
     def delete_grid(self):
         """ Deletes all items for every cell. """
-        for cell in self.generator.cells:
+        for cell in self.cells:
             old_lines = cell.line_items
             for line in old_lines:
                 self.removeItem(line)
@@ -88,7 +99,7 @@ class MazeGeneratorScene(QGraphicsScene):
 
     def save_maze_on_click(self):
         """ Save the generated maze to a file. """
-        self.generator.save_maze()
+        self.generator.save_maze(Config.MAZE_FILE_FORMAT, Config.MAZE_ARCHIVE_NAME)
 
     def set_maze_dimensions(self, columns, rows):
         """ Sets the dimensions of the maze to the given columns and rows. """
@@ -0,0 +1,303 @@
+from array import array
+from math import floor
+
+from mazerunner.utils.JunctionGraph import JunctionGraph
+
+""" Status flags packed into a single byte per cell. """
+VISITED = 1
+IN_QUEUE = 2
+F_VISITED = 4
+B_VISITED = 8
+SOLUTION = 16
+START = 32
+GOAL = 64
+# Whether the cell has been changed since it was last rendered
+CHANGED = 128
+
+# Value of a parent entry for cells which have not been reached by a search
+NO_PARENT = -1
+# Largest search generation, after which the per search arrays are allocated again
+MAX_GENERATION = 0xFFFF
+
+# Translation table applied to the flags when a search is reset. Start and goal flags survive a reset, every cell is
+# marked as changed so it is redrawn.
+RESET_FLAGS = bytes((flags & (START | GOAL)) | CHANGED for flags in range(256))
+
+
+class MazeGrid:
+    """ Headless representation of a maze which does not depend on Qt. Each cell can only have a wall on its bottom or
+    right edge, so the walls of the grid are stored as two packed bitmaps holding one bit per cell. The status of each
+    cell during a search is held in flat arrays indexed by the cell index, y * columns + x.
+
+    Existing (bottom, right) bitmaps, such as views of a memory mapped file, can be passed in as bitmaps and are used
+    without being copied. If search is false the status flags and the per search arrays are not allocated until
+    reset_search is called, or a flag is set, which keeps opening a very large maze cheap.
+
+    Each search is numbered by generation. A cell has been reached by the current search, or by its backward search,
+    if its entry in reached, or b_reached, equals the generation, and only then do its parent and cost entries hold
+    values from the current search. Resetting a search increments the generation rather than clearing the arrays.
+    """
+
+    def __init__(self, columns, rows, walls=True, bitmaps=None, search=True):
+        self.columns = columns
+        self.rows = rows
+        self.size = columns * rows
+        # Packed wall bitmaps, bit (index & 7) of byte (index >> 3) is set if the cell has that wall
+        if bitmaps is None:
+            self.bottom = create_bitmap(self.size, walls)
+            self.right = create_bitmap(self.size, walls)
+        else:
+            self.bottom, self.right = bitmaps
+        # Compressed sparse row index of open neighbours, built on demand and discarded whenever a wall changes
+        self.offsets = None
+        self.adjacency = None
+        self._adjacency_view = None
+        # Graph of the junctions and dead ends, built on demand and discarded with the neighbour index
+        self.junction_graph = None
+        # Per search state
+        self.flags = None
+        self.parent = None
+        self.b_parent = None
+        self.cost = None
+        self.generation = 0
+        self.reached = None
+        self.b_reached = None
+        if search:
+            self.reset_search()
+
+    def reset_search(self):
+        """ Resets the status of all cells to allow a new search to begin. The flags are translated in a single pass,
+        which also marks every cell to be redrawn, and the per search arrays are left as they are and only allocated
+        again when the generation runs out. """
+        if self.flags is None:
+            self.create_flags()
+        else:
+            self.flags[:] = self.flags.translate(RESET_FLAGS)
+        if self.reached is None or self.generation == MAX_GENERATION:
+            # The forward search of a bidirectional solver uses parent, the backward search uses b_parent
+            self.parent = array('i', [NO_PARENT]) * self.size
+            self.b_parent = array('i', [NO_PARENT]) * self.size
+            self.cost = array('i', [0]) * self.size
+            self.reached = array('H', [0]) * self.size
+            self.b_reached = array('H', [0]) * self.size
+            self.generation = 0
+        self.generation += 1
+
+    def create_flags(self):
+        """ Allocates the status flags with every cell marked to be redrawn. """
+        self.flags = bytearray([CHANGED]) * self.size
+
+    def get_cell_index(self, x, y):
+        """ Returns the array index for the cell at position (x, y). """
+        return y * self.columns + x
+
+    def get_coordinates(self, index):
+        """ Returns the (x, y) position of the cell at the given index. """
+        y, x = divmod(index, self.columns)
+        return x, y
+
+    def has_bottom_wall(self, index):
+        """ Returns true if the cell at the given index has a bottom wall. """
+        return self.bottom[index >> 3] >> (index & 7) & 1
+
+    def has_right_wall(self, index):
+        """ Returns true if the cell at the given index has a right wall. """
+        return self.right[index >> 3] >> (index & 7) & 1
+
+    def set_bottom_wall(self, index, value):
+        """ Sets or removes the bottom wall of the cell at the given index. """
+        set_bit(self.bottom, index, value)
+        if self.flags is not None:
+            self.flags[index] |= CHANGED
+        self.clear_adjacency()
+
+    def set_right_wall(self, index, value):
+        """ Sets or removes the right wall of the cell at the given index. """
+        set_bit(self.right, index, value)
+        if self.flags is not None:
+            self.flags[index] |= CHANGED
+        self.clear_adjacency()
+
+    def remove_wall_between(self, index, other_index):
+        """ Removes the wall separating two adjacent cells. """
+        difference = other_index - index
+        if difference == 1:  # Moved right, remove this cells right wall
+            self.set_right_wall(index, False)
+        elif difference == -1:  # Moved left, remove other cells right wall
+            self.set_right_wall(other_index, False)
+        elif difference > 0:  # Moved down, remove this cells bottom wall
+            self.set_bottom_wall(index, False)
+        else:  # Moved up, remove other cells bottom wall
+            self.set_bottom_wall(other_index, False)
+
+    def build_adjacency(self):
+        """ Builds a compressed sparse row index of the open neighbours of every cell. The neighbours of the cell at
+        index are stored in adjacency[offsets[index]:offsets[index + 1]], so each search can reuse them without
+        checking any walls. """
+        columns = self.columns
+        size = self.size
+        bottom = self.bottom
+        right = self.right
+        offsets = array('i', [0]) * (size + 1)
+        adjacency = array('i')
+        append = adjacency.append
+        for index in range(size):
+            # Same order as compute_neighbours: above, right, below, left
+            above = index - columns
+            if above >= 0 and not bottom[above >> 3] >> (above & 7) & 1:
+                append(above)
+            x = index % columns
+            if x < columns - 1 and not right[index >> 3] >> (index & 7) & 1:
+                append(index + 1)
+            if index + columns < size and not bottom[index >> 3] >> (index & 7) & 1:
+                append(index + columns)
+            if x > 0 and not right[(index - 1) >> 3] >> ((index - 1) & 7) & 1:
+                append(index - 1)
+            offsets[index + 1] = len(adjacency)
+        self.offsets = offsets
+        self.adjacency = adjacency
+        self._adjacency_view = memoryview(adjacency)
+
+    def clear_adjacency(self):
+        """ Discards the neighbour index and the junction graph, they are rebuilt the next time they are needed. """
+        if self.adjacency is not None:
+            self.offsets = None
+            self.adjacency = None
+            self._adjacency_view = None
+        self.junction_graph = None
+
+    def get_junction_graph(self):
+        """ Returns the junction graph of the maze, in which each corridor is contracted into a single edge, building
+        it if the walls have changed since it was last built. """
+        if self.junction_graph is None:
+            self.junction_graph = JunctionGraph(self)
+        return self.junction_graph
+
+    def get_neighbours(self, index):
+        """ Returns the indices of cells which are adjacent to the cell at index and not separated from it by a wall.
+        This is a read only view into the neighbour index, so no list is allocated for each call. """
+        if self.adjacency is None:
+            self.build_adjacency()
+        offsets = self.offsets
+        return self._adjacency_view[offsets[index]:offsets[index + 1]]
+
+    def compute_neighbours(self, index):
+        """ Returns a list of the indices of cells which are adjacent to the cell at index and not separated from it by
+        a wall, computed from the wall bitmaps. """
+        cells = []
+        columns = self.columns
+        x = index % columns
+
+        # Above, check cell above's bottom wall
+        above = index - columns
+        if above >= 0 and not self.has_bottom_wall(above):
+            cells.append(above)
+        # Right
+        if x < columns - 1 and not self.has_right_wall(index):
+            cells.append(index + 1)
+        # Below
+        below = index + columns
+        if below < self.size and not self.has_bottom_wall(index):
+            cells.append(below)
+        # Left, check cell to the left's right wall
+        if x > 0 and not self.has_right_wall(index - 1):
+            cells.append(index - 1)
+        return cells
+
+    def line_of_sight(self, x1, y1, x2, y2):
+        """ Returns true if the straight line from (x1, y1) to (x2, y2) does not cross any wall. Coordinates are
+        measured in cells, so the cell at (x, y) covers the square from (x, y) to (x + 1, y + 1), and both points must
+        lie within the grid. Only the wall on each cell edge the line crosses is checked, first on the vertical edges
+        and then on the horizontal edges. A line through a corner touches the walls on both sides of it, so it is
+        blocked by any of them, and the result is the same in either direction. """
+        columns = self.columns
+        rows = self.rows
+        return not (crosses_walls(self.right, x1, y1, x2, y2, columns, rows, 1, columns) or
+                    crosses_walls(self.bottom, y1, x1, y2, x2, rows, columns, columns, 1))
+
+    def get_adjacent(self, index):
+        """ Returns a list of the indices of all cells which share an edge with the cell at index, regardless of walls.
+        """
+        cells = []
+        columns = self.columns
+        x = index % columns
+
+        if index >= columns:  # Above
+            cells.append(index - columns)
+        if x < columns - 1:  # Right
+            cells.append(index + 1)
+        if index + columns < self.size:  # Below
+            cells.append(index + columns)
+        if x > 0:  # Left
+            cells.append(index - 1)
+        return cells
+
+    def has_flag(self, index, flag):
+        """ Returns true if the cell at index has the given status flag set. """
+        return self.flags is not None and self.flags[index] & flag
+
+    def set_flag(self, index, flag):
+        """ Sets the given status flag on the cell at index and marks it as changed. """
+        if self.flags is None:
+            self.create_flags()
+        self.flags[index] |= flag | CHANGED
+
+    def clear_flag(self, index, flag):
+        """ Clears the given status flag on the cell at index and marks it as changed. """
+        if self.flags is None:
+            self.create_flags()
+        self.flags[index] = self.flags[index] & ~flag | CHANGED
+
+    def __repr__(self):
+        return "MazeGrid({}x{})".format(self.columns, self.rows)
+
+
+def get_bitmap_length(size):
+    """ Returns the number of bytes in a packed bitmap holding size bits. """
+    return (size + 7) >> 3
+
+
+def create_bitmap(size, value):
+    """ Creates a packed bitmap holding size bits, all set to value. Padding bits in the final byte are always zero. """
+    length = get_bitmap_length(size)
+    if not value:
+        return bytearray(length)
+    bitmap = bytearray(b'\xff') * length
+    if size & 7:
+        bitmap[-1] = (1 << (size & 7)) - 1
+    return bitmap
+
+
+def set_bit(bitmap, index, value):
+    """ Sets bit index of the packed bitmap to value. """
+    if value:
+        bitmap[index >> 3] |= 1 << (index & 7)
+    else:
+        bitmap[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+
+def crosses_walls(bitmap, a1, b1, a2, b2, limit_a, limit_b, stride_a, stride_b):
+    """ Returns true if the line from (a1, b1) to (a2, b2) crosses a wall on one of the lines a = k for integer k,
+    where the wall on line k from b = m to m + 1 is bit (k - 1) * stride_a + m * stride_b of the bitmap. The line is
+    always followed from its end with the lower a, so swapping its ends gives the same crossings. Where it crosses line
+    k at a whole b, the end of two walls, both are checked. SampleRoadmap.crosses_walls does the same with arrays. """
+    if a2 < a1:
+        a1, b1, a2, b2 = a2, b2, a1, b1
+    low = floor(a1)
+    high = floor(a2)
+    if high == low:
+        return False
+    rise = b2 - b1
+    run = a2 - a1
+    for line in range(low + 1, high + 1):
+        b = b1 + (line - a1) * rise / run
+        cell = floor(b)
+        column = (min(line, limit_a) - 1) * stride_a
+        wall = column + min(max(cell, 0), limit_b - 1) * stride_b
+        if bitmap[wall >> 3] >> (wall & 7) & 1:
+            return True
+        if b == cell:
+            wall = column + min(max(cell - 1, 0), limit_b - 1) * stride_b
+            if bitmap[wall >> 3] >> (wall & 7) & 1:
+                return True
+    return False
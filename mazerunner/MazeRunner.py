@@ -1,28 +1,33 @@
-from pathlib import Path
-
-from PyQt5.QtWidgets import QFileDialog
-
-from mazerunner.RunnerCell import RunnerCell
+import mazerunner.utils.Config as Config
+from mazerunner.MazeArchive import read_archived_maze
+from mazerunner.MazeFile import read_maze
+from mazerunner.MazeGrid import START, GOAL
 from mazerunner.solvers.AStarSolver import AStarSolver
 from mazerunner.solvers.BFSSolver import BFSSolver
 from mazerunner.solvers.BiBFSSolver import BiBFSSolver
 from mazerunner.solvers.BiDFSSolver import BiDFSSolver
 from mazerunner.solvers.DFSSolver import DFSSolver
 from mazerunner.solvers.GreedySolver import GreedySolver
+from mazerunner.solvers.JunctionGraphSolver import JunctionGraphSolver, JunctionAStarSolver
+from mazerunner.solvers.LazySampleSolver import LazySampleSolver
+from mazerunner.solvers.ParallelBFSSolver import ParallelBFSSolver
 from mazerunner.solvers.RandomSampleSolver import RandomSampleSolver
+from mazerunner.solvers.WavefrontSolver import WavefrontSolver
 
 
 class MazeRunner:
-    """ Generates a maze using depth first search. """
+    """ Runs the selected solver on a loaded maze. The maze is held in a MazeGrid and the display, if there is one, is
+    only used to render the progress of the search. """
 
-    def __init__(self, display):
+    def __init__(self, display=None):
         self.display = display
-        self.cells = []
+        self.grid = None
         # Class instance of solver, is set in start_search
         self.solver = None
         self.running = False
         self.paused = False
         self.solved = False
+        # Indices of the start and goal cells
         self.start_cell = None
         self.goal_cell = None
 
@@ -30,6 +35,10 @@ class MazeRunner:
         """ Calls the appropriate search function based on the search option. """
         if search_option == 'Breadth First Search':
             self.solver = BFSSolver(self)
+        elif search_option == 'Wavefront BFS':
+            self.solver = WavefrontSolver(self)
+        elif search_option == 'Parallel BFS':
+            self.solver = ParallelBFSSolver(self, Config.BFS_WORKERS)
         elif search_option == 'Bidirectional BFS':
             self.solver = BiBFSSolver(self)
         elif search_option == 'Depth First Search':
@@ -40,73 +49,43 @@ class MazeRunner:
             self.solver = GreedySolver(self)
         elif search_option == 'A*':
             self.solver = AStarSolver(self)
+        elif search_option == 'Junction Graph Dijkstra':
+            self.solver = JunctionGraphSolver(self)
+        elif search_option == 'Junction Graph A*':
+            self.solver = JunctionAStarSolver(self)
         elif search_option == 'Random Sampling':
             self.solver = RandomSampleSolver(self)
-        elif search_option == 'Random Sampling':
-            self.solver = RandomSampleSolver(self)
+        elif search_option == 'Lazy Random Sampling':
+            self.solver = LazySampleSolver(self)
         self.running = True
         self.solver.start()
 
     def reset_search(self):
         """ Resets the status of all cells to allow a new search to begin. """
         self.solved = False
-        for cell in self.cells:
-            cell.reset()
+        self.grid.reset_search()
 
     def get_neighbours(self, cell):
-        """ Returns a list of cells which are adjacent to cell. """
-        cells = []
-        x = cell.x
-        y = cell.y
-
-        # Above, check cell above's bottom wall
-        if y > 0 and not self.cells[self.get_cell_index(x, y - 1)].walls.get('bottom'):
-            cells.append(self.cells[self.get_cell_index(x, y - 1)])
-        # Right
-        if x < self.display.columns - 1 and not cell.walls.get('right'):
-            cells.append(self.cells[self.get_cell_index(x + 1, y)])
-        # Below
-        if y < self.display.rows - 1 and not cell.walls.get('bottom'):
-            cells.append(self.cells[self.get_cell_index(x, y + 1)])
-        # Left, check cell to the left's right wall
-        if x > 0 and not self.cells[self.get_cell_index(x - 1, y)].walls.get('right'):
-            cells.append(self.cells[self.get_cell_index(x - 1, y)])
-        return cells
-
-    def load_maze(self):
-        """ Load a maze from a file. The expected format for the file has the dimensions of the maze on the first line
-        in the format "columns rows" (two integers separated by a space). Then there are columns x rows lines, each
-        containing 2 binary digits indicating whether the cell has a bottom or right wall. In total the file will have
-        columns x rows + 1 lines
-        """
-        # Allow user to select filename
-        dialog = QFileDialog()
-        path = Path('./mazes')
-        filename = dialog.getOpenFileName(dialog, "Load maze", str(path.resolve()), '*.txt')[0]
-        if not filename:
-            # No filename chosen
-            return False
-
-        self.display.delete_grid()
-        del self.cells[:]
-
-        with open(filename, 'r') as file:
-            lines = file.readlines()
-            columns, rows = [int(x) for x in lines[0].split()]
-            self.display.set_maze_dimensions(columns, rows)
-
-            x, y = 0, 0
-            for line in lines[1:]:
-                line = line.strip()
-                cell = RunnerCell(x, y, int(line[0]), int(line[1]), self.display)
-                self.cells.append(cell)
-
-                x = (x + 1) % columns
-                if not x:
-                    y = (y + 1)
-
-        if len(self.cells) != columns * rows:
+        """ Returns the indices of cells which are adjacent to cell. """
+        return self.grid.get_neighbours(cell)
+
+    def update_display(self, path=None):
+        """ Updates the display, if there is one, to show the progress of the search. """
+        if self.display is not None:
+            self.display.update_scene(path)
+
+    def load_maze(self, filename, name=None):
+        """ Load a maze from a file in either of the formats described in MazeFile, or the maze with the given member
+        name from a maze archive. Returns false if the file is not a valid maze. The neighbour index of the maze is
+        built when it is first searched. """
+        grid = read_maze(filename) if name is None else read_archived_maze(filename, name)
+        if grid is None:
             return False
+        self.grid = grid
+        self.solver = None
+        self.solved = False
+        self.start_cell = None
+        self.goal_cell = None
         return True
 
     def recommence(self):
@@ -115,12 +94,23 @@ class MazeRunner:
 
     def initialise_start_and_goal_cells(self):
         """ Sets the start cell to be the upper leftmost cell, and the goal cell to be the lower rightmost. """
-        self.start_cell = self.cells[0]
-        self.start_cell.start = True
-        self.goal_cell = self.cells[
-            self.get_cell_index(self.display.columns - 1, self.display.rows - 1)]
-        self.goal_cell.end = True
+        self.set_start_cell(0)
+        self.set_goal_cell(self.grid.size - 1)
+
+    def set_start_cell(self, index):
+        """ Sets the cell at index as the start cell for the search. """
+        if self.start_cell is not None:
+            self.grid.clear_flag(self.start_cell, START)
+        self.start_cell = index
+        self.grid.set_flag(index, START)
+
+    def set_goal_cell(self, index):
+        """ Sets the cell at index as the goal cell for the search. """
+        if self.goal_cell is not None:
+            self.grid.clear_flag(self.goal_cell, GOAL)
+        self.goal_cell = index
+        self.grid.set_flag(index, GOAL)
 
     def get_cell_index(self, x, y):
         """ Returns the array index for the cell at position (x, y). """
-        return y * self.display.columns + x
+        return self.grid.get_cell_index(x, y)
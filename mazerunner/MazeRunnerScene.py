@@ -1,10 +1,14 @@
 from math import floor
+from pathlib import Path
 
 from PyQt5.QtCore import QLineF, QCoreApplication, Qt
-from PyQt5.QtWidgets import QGraphicsScene
+from PyQt5.QtWidgets import QGraphicsScene, QFileDialog, QInputDialog
 
 import mazerunner.utils.Config as Config
+from mazerunner.MazeArchive import MazeArchive, is_archive
+from mazerunner.MazeCatalog import get_catalogued_stats
 from mazerunner.MazeRunner import MazeRunner
+from mazerunner.RunnerCell import RunnerCell
 
 
 class MazeRunnerScene(QGraphicsScene):
@@ -13,12 +17,16 @@ class MazeRunnerScene(QGraphicsScene):
     def __init__(self):
         super().__init__()
         self.runner = MazeRunner(self)
+        # Cells which render the grid held by the runner
+        self.cells = []
         self.path = []
         self.columns = Config.DEFAULT_MAZE_COLUMNS
         self.rows = Config.DEFAULT_MAZE_ROWS
         self.cell_dimension = Config.DEFAULT_CELL_DIMENSION
         self.render_progress = True
         self.maze_loaded = False
+        # Statistics of the loaded maze from the catalog or archive index, if known
+        self.maze_stats = None
 
     def init_grid(self):
         """ Initialise the grid display. """
@@ -27,8 +35,11 @@ class MazeRunnerScene(QGraphicsScene):
         height = self.rows * self.cell_dimension
         self.setSceneRect(0, Config.WINDOW_HEIGHT * Config.MAZE_WINDOW_VERTICAL_OFFSET_FACTOR, width, height)
         self.setItemIndexMethod(QGraphicsScene.NoIndex)
-        for cell in self.runner.cells:
+        grid = self.runner.grid
+        self.cells = [RunnerCell(grid, index, self) for index in range(grid.size)]
+        for cell in self.cells:
             self.draw_cell(cell)
+            cell.changed = False
 
     def draw_cell(self, cell):
         fill = cell.get_fill_rect()
@@ -42,14 +53,16 @@ class MazeRunnerScene(QGraphicsScene):
         """ Start a new search. """
         self.delete_grid()
         self.runner.reset_search()
-        for cell in self.runner.cells:
+        for cell in self.cells:
+            cell.clear_display()
             self.draw_cell(cell)
+            cell.changed = False
         self.runner.start_search(search_option)
 
     def update_grid(self):
         """ For any cell which has been changed since the last update, delete its items and redraw it to its current
         state. """
-        for cell in self.runner.cells:
+        for cell in self.cells:
             if cell.changed:
                 old_lines = cell.line_items
                 for line in old_lines:
@@ -64,7 +77,7 @@ class MazeRunnerScene(QGraphicsScene):
 
     def delete_grid(self):
         """ Deletes all items. """
-        for cell in self.runner.cells:
+        for cell in self.cells:
             old_lines = cell.line_items
             for line in old_lines:
                 self.removeItem(line)
@@ -78,8 +91,10 @@ class MazeRunnerScene(QGraphicsScene):
             self.runner.solver.clear_display_items()
 
     def draw_path(self, path):
-        """ Draws a line connecting each of the cells in the given path. """
+        """ Draws a line connecting each of the cells, given by index, in the given path. """
         for cell, next_cell in zip(path[:-1], path[1:]):
+            cell = self.cells[cell]
+            next_cell = self.cells[next_cell]
             first_xc = (cell.x + 0.5) * self.cell_dimension  # x position of first center
             first_yc = (cell.y + 0.5) * self.cell_dimension  # y position of first center
             second_xc = (next_cell.x + 0.5) * self.cell_dimension  # x position of second center
@@ -100,12 +115,55 @@ class MazeRunnerScene(QGraphicsScene):
     def load_maze_on_click(self):
         """ Attempt to load a maze from a file and draw it on screen. """
         self.runner.running = False
-        if self.runner.load_maze():
-            self.init_grid()
+        # Allow user to select filename
+        dialog = QFileDialog()
+        path = Path('./mazes')
+        filename = dialog.getOpenFileName(dialog, "Load maze", str(path.resolve()),
+                                           'Mazes (*.txt *.maze *.zip)')[0]
+        if not filename:
+            # No filename chosen
+            return
+        name = None
+        stats = None
+        if is_archive(filename):
+            name, stats = self.select_archived_maze(filename)
+            if name is None:
+                return
+
+        self.delete_grid()
+        del self.cells[:]
+        if self.runner.load_maze(filename, name):
+            if name is None:
+                # Only this maze is catalogued, reusing the grid which was just read
+                stats = get_catalogued_stats(filename, self.runner.grid)
+            self.set_maze_dimensions(self.runner.grid.columns, self.runner.grid.rows)
             self.runner.initialise_start_and_goal_cells()
+            self.init_grid()
             self.maze_loaded = True
+            self.maze_stats = stats
             self.update()
             QCoreApplication.processEvents()
+        else:
+            self.maze_loaded = False
+            self.maze_stats = None
+
+    def select_archived_maze(self, filename):
+        """ Allow the user to select a maze from an archive. Returns the member name and statistics of the maze, or
+        (None, None) if no maze was selected. An archive may hold many mazes of the same size and algorithm, so each
+        label starts with the position of its maze in the archive, which keeps the labels unique. """
+        with MazeArchive(filename) as archive:
+            entries = list(archive.entries.values())
+        if not entries:
+            return None, None
+        labels = ["{}: {}x{} {} seed {} (path {})".format(
+            position + 1, entry['columns'], entry['rows'], entry['algorithm'] or 'unknown',
+            '-' if entry.get('seed') is None else entry['seed'], entry['stats'].get('path_length'))
+            for position, entry in enumerate(entries)]
+        label, selected = QInputDialog.getItem(None, "Load maze", "Maze", labels, 0, False)
+        if not selected:
+            return None, None
+        entry = entries[labels.index(label)]
+        return entry['name'], entry['stats']
 
     def set_maze_dimensions(self, columns, rows):
         """ Sets the dimensions of the maze to the given columns and rows. """
@@ -135,17 +193,13 @@ class MazeRunnerScene(QGraphicsScene):
     def set_start_cell(self, x, y):
         """ Sets the start cell for the search. """
         index = self.calculate_cell_index_from_coordinates(x, y)
-        self.runner.start_cell.start = False
-        self.runner.start_cell = self.runner.cells[index]
-        self.runner.start_cell.start = True
+        self.runner.set_start_cell(index)
         self.update_scene()
 
     def set_goal_cell(self, x, y):
         """ Sets the goal cell for the search. """
         index = self.calculate_cell_index_from_coordinates(x, y)
-        self.runner.goal_cell.goal = False
-        self.runner.goal_cell = self.runner.cells[index]
-        self.runner.goal_cell.goal = True
+        self.runner.set_goal_cell(index)
         self.update_scene()
 
     def calculate_cell_index_from_coordinates(self, x, y):
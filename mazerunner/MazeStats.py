@@ -0,0 +1,58 @@
+""" Statistics describing the shape of a maze, computed from a MazeGrid without Qt. """
+from collections import deque
+
+
+def get_stats(grid):
+    """ Returns a dictionary of statistics of the maze: the number of dead ends, the diameter and the number of cells
+    on the shortest path from the upper leftmost to the lower rightmost cell, which are the default start and goal, or
+    None if there is no such path. """
+    distances = get_distances(grid, 0)
+    goal_distance = distances[grid.size - 1]
+    return {
+        'dead_ends': count_dead_ends(grid),
+        'diameter': get_diameter(grid, distances),
+        'path_length': goal_distance + 1 if goal_distance >= 0 else None,
+    }
+
+
+def count_dead_ends(grid):
+    """ Returns the number of cells which have exactly one open neighbour. """
+    if grid.adjacency is None:
+        grid.build_adjacency()
+    offsets = grid.offsets
+    return sum(1 for index in range(grid.size) if offsets[index + 1] - offsets[index] == 1)
+
+
+def get_path_length(grid, start, goal):
+    """ Returns the number of cells on the shortest path from start to goal, including both, or None if goal cannot be
+    reached. """
+    distances = get_distances(grid, start)
+    return distances[goal] + 1 if distances[goal] >= 0 else None
+
+
+def get_diameter(grid, distances=None):
+    """ Returns the number of steps on the longest shortest path between two cells reachable from the upper leftmost
+    cell. Found with two breadth first searches, the second from the cell furthest from the first, which is exact for
+    a perfect maze, where the open cells form a tree, and a lower bound otherwise. distances may be passed if the
+    distances from the upper leftmost cell are already known. """
+    if distances is None:
+        distances = get_distances(grid, 0)
+    furthest = max(range(grid.size), key=distances.__getitem__)
+    return max(get_distances(grid, furthest))
+
+
+def get_distances(grid, start):
+    """ Returns a list holding the number of steps from start to each cell, or -1 for cells which cannot be reached,
+    found with a breadth first search. """
+    distances = [-1] * grid.size
+    distances[start] = 0
+    queue = deque([start])
+    get_neighbours = grid.get_neighbours
+    while queue:
+        index = queue.popleft()
+        distance = distances[index] + 1
+        for neighbour in get_neighbours(index):
+            if distances[neighbour] < 0:
+                distances[neighbour] = distance
+                queue.append(neighbour)
+    return distances
@@ -0,0 +1,45 @@
+""" Mazes shared by the benchmarks: the mazes bundled in mazes/. Larger mazes are made with
+mazerunner.generators.Generators.generate_maze, the same generators the application uses. """
+import io
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from mazerunner.MazeGrid import VISITED
+from mazerunner.MazeRunner import MazeRunner
+
+MAZE_DIRECTORY = Path(__file__).resolve().parent.parent / 'mazes'
+
+
+def load_bundled_mazes():
+    """ Returns a list of (name, grid) pairs for each maze in the maze directory, ordered by size. """
+    mazes = []
+    for path in MAZE_DIRECTORY.glob('*.txt'):
+        runner = MazeRunner()
+        runner.load_maze(str(path))
+        runner.grid.build_adjacency()
+        mazes.append(("{}x{}".format(runner.grid.columns, runner.grid.rows), runner.grid))
+    return sorted(mazes, key=lambda maze: maze[1].size)
+
+
+def create_runner(grid):
+    """ Returns a runner without a display for the given grid, searching from the top left to the bottom right. """
+    runner = MazeRunner()
+    runner.grid = grid
+    runner.reset_search()
+    runner.initialise_start_and_goal_cells()
+    return runner
+
+
+def run_solver(runner, solver_class):
+    """ Runs a solver to completion on the runner's grid and returns it. The printed path is discarded. """
+    runner.reset_search()
+    runner.solver = solver_class(runner)
+    runner.running = True
+    with redirect_stdout(io.StringIO()):
+        runner.solver.start()
+    return runner.solver
+
+
+def count_visited(grid):
+    """ Returns the number of cells which were expanded by the last search on the grid. """
+    return sum(1 for flags in grid.flags if flags & VISITED)
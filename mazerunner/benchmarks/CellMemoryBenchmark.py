@@ -0,0 +1,107 @@
+""" Measures the memory used per cell to hold a maze for rendering, comparing the slotted cells which view a MazeGrid
+with the original cell layout, where every cell held its walls, status and geometry as instance attributes.
+
+Run from the repository root with: python -m mazerunner.benchmarks.CellMemoryBenchmark
+
+Only allocations made by Python are counted, the C++ side of the Qt geometry objects held by the original cells is not.
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+
+from PyQt5.QtCore import QLineF
+
+import mazerunner.utils.Config as Config
+from mazerunner.MazeGrid import MazeGrid
+from mazerunner.MazeRunner import MazeRunner
+from mazerunner.RunnerCell import RunnerCell
+
+MAZE_DIRECTORY = Path(__file__).resolve().parent.parent / 'mazes'
+
+
+class BenchmarkScene:
+    """ Provides the cell dimension which cells read from the scene they are drawn in. """
+    cell_dimension = Config.DEFAULT_CELL_DIMENSION
+
+
+class OriginalRunnerCell:
+    """ Reproduces the attributes held by each RunnerCell before cells became views of a MazeGrid. """
+
+    def __init__(self, x, y, bottom, right, scene):
+        self.x = x
+        self.y = y
+        self.scene = scene
+        self.walls = {'bottom': bottom,
+                      'right': right
+                      }
+        self._visited = False
+        self._in_queue = False
+        self.changed = False
+        self._lines = []
+        side_length = scene.cell_dimension
+        xc = x * side_length
+        yc = y * side_length
+        if bottom:
+            self._lines.append(QLineF(xc, yc + side_length, xc + side_length, yc + side_length))
+        if right:
+            self._lines.append(QLineF(xc + side_length, yc, xc + side_length, yc + side_length))
+        if y == 0:
+            self._lines.append(QLineF(xc, yc, xc + side_length, yc))
+        if x == 0:
+            self._lines.append(QLineF(xc, yc, xc, yc + side_length))
+        self.line_items = []
+        self.fill_rect = []
+        self.rect_item = None
+        self._f_visited = False
+        self._b_visited = False
+        self.parent = None
+        self.f_parent = None
+        self.b_parent = None
+        self._solution = False
+        self.cost = 0
+        self._start = x == 0 and y == 0
+        self._goal = False
+
+
+def measure(create):
+    """ Returns the object created by create and the number of bytes allocated while doing so. """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = create()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def grid_bytes(grid):
+    """ Returns the number of bytes held by the arrays of a grid. """
+    arrays = [grid.bottom, grid.right, grid.flags, grid.parent, grid.b_parent, grid.cost, grid.reached,
+              grid.b_reached, grid.offsets, grid.adjacency]
+    return sum(sys.getsizeof(array) for array in arrays if array is not None)
+
+
+def benchmark(name, grid):
+    """ Prints the bytes per cell of the original cells and of the grid with its slotted cells. """
+    scene = BenchmarkScene()
+    grid.build_adjacency()
+    original, original_bytes = measure(lambda: [
+        OriginalRunnerCell(index % grid.columns, index // grid.columns, grid.has_bottom_wall(index),
+                           grid.has_right_wall(index), scene) for index in range(grid.size)])
+    del original
+    cells, cell_bytes = measure(lambda: [RunnerCell(grid, index, scene) for index in range(grid.size)])
+    del cells
+    slotted_bytes = cell_bytes + grid_bytes(grid)
+    print("{:<24} {:>10} cells  before {:>8.1f} B/cell  after {:>6.1f} B/cell (grid only {:>5.1f} B/cell)".format(
+        name, grid.size, original_bytes / grid.size, slotted_bytes / grid.size, grid_bytes(grid) / grid.size))
+
+
+def main():
+    runner = MazeRunner()
+    maze = next(MAZE_DIRECTORY.glob('maze-60x30-*.txt'))
+    runner.load_maze(str(maze))
+    benchmark('60x30 (bundled)', runner.grid)
+    benchmark('1000x1000', MazeGrid(1000, 1000))
+
+
+if __name__ == '__main__':
+    main()
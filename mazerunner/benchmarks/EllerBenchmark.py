@@ -0,0 +1,43 @@
+""" Measures streaming tall mazes generated with Eller's algorithm to a file, in both formats. The peak memory should
+stay the same however many rows the maze has.
+
+Run from the repository root with: python -m mazerunner.benchmarks.EllerBenchmark
+
+The peak memory allocated while writing is measured in a separate run, as tracing allocations slows it down. Each file
+is opened afterwards to check it holds a perfect maze of the right size.
+"""
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+from mazerunner.MazeFile import read_maze
+from mazerunner.generators.EllerGenerator import write_eller
+
+COLUMNS = 100
+ROWS = [1000, 10000, 100000]
+FORMATS = [('text', '.txt'), ('binary', '.maze')]
+
+
+def main():
+    print("{:>12} {:<7} {:>12} {:>10} {:>10}".format('maze', 'format', 'size (MB)', 'time (s)', 'peak (MB)'))
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in ROWS:
+            for file_format, extension in FORMATS:
+                filename = Path(directory) / ("maze" + extension)
+                start = perf_counter()
+                write_eller(filename, COLUMNS, rows, 0, file_format)
+                elapsed = perf_counter() - start
+                tracemalloc.start()
+                write_eller(filename, COLUMNS, rows, 0, file_format)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                grid = read_maze(filename)
+                assert grid.columns == COLUMNS and grid.rows == rows
+                print("{:>12} {:<7} {:>12.2f} {:>10.2f} {:>10.3f}".format(
+                    "{}x{}".format(COLUMNS, rows), file_format, filename.stat().st_size / 1e6, elapsed, peak / 1e6))
+                filename.unlink()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+""" Measures the headless maze generators. The depth first generator is compared with MazeGenerator, with a display
+which draws nothing, then every generator is timed, its peak memory measured and the shape of its mazes described.
+
+Run from the repository root with: python -m mazerunner.benchmarks.GeneratorBenchmark
+
+MazeGenerator is skipped above GUI_SIZE_LIMIT, where it takes minutes. The peak memory allocated by each generator is
+measured in a separate run, as tracing allocations slows it down, and includes the MazeGrid it returns.
+"""
+import tracemalloc
+from time import perf_counter
+
+from mazerunner.MazeGenerator import MazeGenerator
+from mazerunner.MazeStats import get_stats
+from mazerunner.generators.Generators import GENERATORS, generate_maze
+from mazerunner.generators.DepthFirstGenerator import generate_depth_first
+
+SIZES = [100, 500, 1000, 2000, 5000]
+GUI_SIZE_LIMIT = 1000
+ALGORITHM_SIZES = [500, 1000, 2000]
+STATS_SIZE = 500
+
+
+class HiddenDisplay:
+    """ Display for MazeGenerator which holds the dimensions of the maze and draws nothing. """
+
+    def __init__(self, columns, rows):
+        self.columns = columns
+        self.rows = rows
+
+    def update_scene(self):
+        pass
+
+
+def generate_with_gui_generator(columns, rows):
+    """ Runs MazeGenerator to completion and returns its grid. """
+    generator = MazeGenerator(HiddenDisplay(columns, rows))
+    generator.running = True
+    generator.generate()
+    return generator.grid
+
+
+def time_call(function, *args):
+    """ Returns the time taken to call the function. """
+    start = perf_counter()
+    function(*args)
+    return perf_counter() - start
+
+
+def measure_peak(function, *args):
+    """ Returns the peak memory allocated while calling the function. """
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def compare_with_gui_generator():
+    print("{:>11} {:>17} {:>14} {:>10}".format('maze', 'MazeGenerator (s)', 'headless (s)', 'speedup'))
+    for side in SIZES:
+        headless_time = time_call(generate_depth_first, side, side, 0, False)
+        if side <= GUI_SIZE_LIMIT:
+            gui_time = time_call(generate_with_gui_generator, side, side)
+            print("{:>11} {:>17.3f} {:>14.3f} {:>10.1f}".format(
+                "{}x{}".format(side, side), gui_time, headless_time, gui_time / headless_time))
+        else:
+            print("{:>11} {:>17} {:>14.3f} {:>10}".format("{}x{}".format(side, side), '-', headless_time, '-'))
+
+
+def compare_algorithms():
+    print("{:<20} {:>11} {:>10} {:>10}".format('algorithm', 'maze', 'time (s)', 'peak (MB)'))
+    for algorithm in GENERATORS:
+        for side in ALGORITHM_SIZES:
+            arguments = (side, side, algorithm, 0, False)
+            elapsed = time_call(generate_maze, *arguments)
+            peak = measure_peak(generate_maze, *arguments)
+            print("{:<20} {:>11} {:>10.2f} {:>10.1f}".format(
+                algorithm, "{}x{}".format(side, side), elapsed, peak / 1e6))
+
+
+def describe_algorithms():
+    print("{:<20} {:>15} {:>10} {:>13}".format('algorithm', 'dead ends (%)', 'diameter', 'path length'))
+    for algorithm in GENERATORS:
+        grid = generate_maze(STATS_SIZE, STATS_SIZE, algorithm, 0)
+        stats = get_stats(grid)
+        print("{:<20} {:>15.1f} {:>10} {:>13}".format(
+            algorithm, 100 * stats['dead_ends'] / grid.size, stats['diameter'], stats['path_length']))
+
+
+def main():
+    compare_with_gui_generator()
+    print()
+    compare_algorithms()
+    print()
+    print("Shape of {0}x{0} mazes".format(STATS_SIZE))
+    describe_algorithms()
+
+
+if __name__ == '__main__':
+    main()
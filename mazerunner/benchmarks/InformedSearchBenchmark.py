@@ -0,0 +1,53 @@
+""" Compares the bucket queue which the informed solvers select for integer costs with the indexed heap.
+
+Run from the repository root with: python -m mazerunner.benchmarks.InformedSearchBenchmark
+
+Each solver is run from the top left to the bottom right cell of the bundled mazes and of generated 1000x1000 mazes.
+"""
+from time import perf_counter
+
+from mazerunner.benchmarks.BenchmarkMazes import load_bundled_mazes, create_runner, run_solver, count_visited
+from mazerunner.generators.Generators import generate_maze
+from mazerunner.solvers.AStarSolver import AStarSolver
+from mazerunner.solvers.GreedySolver import GreedySolver
+from mazerunner.utils.IndexedHeap import IndexedHeap
+
+
+class HeapAStarSolver(AStarSolver):
+    """ A* search which always uses the indexed heap. """
+
+    def create_queue(self, cost):
+        return IndexedHeap()
+
+
+class HeapGreedySolver(GreedySolver):
+    """ Greedy best first search which always uses the indexed heap. """
+
+    def create_queue(self, cost):
+        return IndexedHeap()
+
+
+SOLVERS = [('A*', HeapAStarSolver, AStarSolver), ('Greedy', HeapGreedySolver, GreedySolver)]
+
+
+def main():
+    mazes = load_bundled_mazes()
+    mazes += [("1000x1000 seed {}".format(seed), generate_maze(1000, 1000, seed=seed)) for seed in range(2)]
+    print("{:<20} {:<7} {:>10} {:>10} {:>12} {:>12} {:>8}".format(
+        'maze', 'solver', 'heap (s)', 'bucket (s)', 'heap exp.', 'bucket exp.', 'speedup'))
+    for name, grid in mazes:
+        runner = create_runner(grid)
+        grid.build_adjacency()
+        for solver_name, heap_solver, bucket_solver in SOLVERS:
+            results = []
+            for solver_class in (heap_solver, bucket_solver):
+                start = perf_counter()
+                run_solver(runner, solver_class)
+                results.append((perf_counter() - start, count_visited(grid)))
+            (heap_time, heap_expanded), (bucket_time, bucket_expanded) = results
+            print("{:<20} {:<7} {:>10.4f} {:>10.4f} {:>12} {:>12} {:>7.2f}x".format(
+                name, solver_name, heap_time, bucket_time, heap_expanded, bucket_expanded, heap_time / bucket_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+""" Compares searching the junction graph, in which each corridor is contracted into a single edge, with searching
+every cell using BFSSolver and AStarSolver.
+
+Run from the repository root with: python -m mazerunner.benchmarks.JunctionGraphBenchmark
+
+Each solver is run from the top left to the bottom right cell of the bundled mazes and of generated 1000x1000 mazes.
+The graph is built once per maze and its build time is reported separately, as the grid keeps it between searches in
+the same way as the neighbour index, which is built beforehand for every solver.
+"""
+from time import perf_counter
+
+from mazerunner.benchmarks.BenchmarkMazes import load_bundled_mazes, create_runner, run_solver
+from mazerunner.generators.Generators import generate_maze
+from mazerunner.solvers.AStarSolver import AStarSolver
+from mazerunner.solvers.BFSSolver import BFSSolver
+from mazerunner.solvers.JunctionGraphSolver import JunctionGraphSolver, JunctionAStarSolver
+
+SOLVERS = [BFSSolver, JunctionGraphSolver, AStarSolver, JunctionAStarSolver]
+
+
+def main():
+    mazes = load_bundled_mazes()
+    mazes += [("1000x1000 seed {}".format(seed), generate_maze(1000, 1000, seed=seed)) for seed in range(2)]
+    print("{:<20} {:>8} {:>8} {:>10} {:>8} {:>10} {:>10} {:>8} {:>10} {:>10} {:>8}".format(
+        'maze', 'cells', 'nodes', 'build (s)', 'path', 'BFS (s)', 'Dijk. (s)', 'speedup', 'A* (s)', 'JG A* (s)',
+        'speedup'))
+    for name, grid in mazes:
+        runner = create_runner(grid)
+        grid.build_adjacency()
+        start = perf_counter()
+        graph = grid.get_junction_graph()
+        build_time = perf_counter() - start
+        times = []
+        lengths = set()
+        for solver_class in SOLVERS:
+            start = perf_counter()
+            solver = run_solver(runner, solver_class)
+            times.append(perf_counter() - start)
+            lengths.add(len(solver.path))
+        assert len(lengths) == 1
+        bfs_time, dijkstra_time, a_star_time, junction_a_star_time = times
+        print("{:<20} {:>8} {:>8} {:>10.3f} {:>8} {:>10.4f} {:>10.4f} {:>7.1f}x {:>10.4f} {:>10.4f} {:>7.1f}x".format(
+            name, grid.size, len(graph), build_time, lengths.pop(), bfs_time, dijkstra_time,
+            bfs_time / dijkstra_time, a_star_time, junction_a_star_time, a_star_time / junction_a_star_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+""" Compares the sample roadmap which tests every edge for collisions before searching with the lazy roadmap which only
+tests the edges at the end of candidate paths.
+
+Run from the repository root with: python -m mazerunner.benchmarks.LazyRoadmapBenchmark
+
+The samples are placed on each bundled maze drawn at the cell size the runner scene would use in the default window,
+with the start and goal nodes in the centres of the top left and bottom right cells as the random sample solver does.
+When the samples are too sparse for the goal to be reached, both roadmaps search every node connected to the start.
+Both must find paths of the same length.
+"""
+from math import floor
+from time import perf_counter
+
+import mazerunner.utils.Config as Config
+from mazerunner.benchmarks.BenchmarkMazes import load_bundled_mazes
+from mazerunner.benchmarks.RoadmapBenchmark import MAX_DISTANCE, create_nodes
+from mazerunner.solvers.LazyRoadmap import LazyRoadmap
+from mazerunner.solvers.SampleGraphNode import SampleGraphNode
+from mazerunner.solvers.SampleRoadmap import SampleRoadmap
+from mazerunner.utils.IndexedHeap import IndexedHeap
+
+SAMPLE_COUNTS = [1200, 2400, 4800]
+SEEDS = range(2)
+
+
+def get_cell_dimension(grid):
+    """ Returns the cell side length used by MazeRunnerScene.set_cell_dimension in the default window. """
+    return min(floor(Config.WINDOW_WIDTH * Config.MAZE_WINDOW_WIDTH_REDUCTION_FACTOR / grid.columns),
+               floor(Config.WINDOW_HEIGHT * Config.MAZE_WINDOW_HEIGHT_REDUCTION_FACTOR / grid.rows))
+
+
+def create_problem(grid, cell_dimension, count, seed):
+    """ Returns the start node, goal node and the list of all nodes, ordered by id, for a roadmap of count samples. """
+    start_node = SampleGraphNode(cell_dimension / 2, cell_dimension / 2, 0)
+    goal_node = SampleGraphNode((grid.columns - 0.5) * cell_dimension, (grid.rows - 0.5) * cell_dimension, 1)
+    samples = create_nodes(grid, count, seed, cell_dimension)
+    for sample in samples:
+        sample.id += 2
+    return start_node, goal_node, [start_node, goal_node] + samples
+
+
+def find_distance(adjacency_list, start_node, goal_node):
+    """ Returns the length of the shortest path from start_node to goal_node, as found by dijkstras_search. """
+    queue = IndexedHeap()
+    start_node.distance = 0
+    queue.put(start_node, 0)
+    while not queue.empty():
+        node = queue.get()
+        if node is goal_node:
+            break
+        for other_node in adjacency_list[node.id]:
+            distance = node.distance + node.distance_to(other_node)
+            if distance < other_node.distance:
+                other_node.distance = distance
+                other_node.parent = node
+                queue.put(other_node, distance)
+    return goal_node.distance
+
+
+def main():
+    print("{:>6} {:>8} {:>5} {:>10} {:>13} {:>12} {:>10} {:>9} {:>9}".format(
+        'maze', 'samples', 'seed', 'distance', 'eager checks', 'lazy checks', 'eager (s)', 'lazy (s)', 'matching'))
+    for name, grid in load_bundled_mazes():
+        cell_dimension = get_cell_dimension(grid)
+        for count in SAMPLE_COUNTS:
+            for seed in SEEDS:
+                start_node, goal_node, nodes = create_problem(grid, cell_dimension, count, seed)
+                start = perf_counter()
+                roadmap = SampleRoadmap(grid, cell_dimension, MAX_DISTANCE)
+                eager_checks = sum(1 for _ in roadmap.get_candidate_pairs(nodes))
+                eager_distance = find_distance(roadmap.construct_adjacency_list(nodes), start_node, goal_node)
+                eager_time = perf_counter() - start
+
+                start_node, goal_node, nodes = create_problem(grid, cell_dimension, count, seed)
+                start = perf_counter()
+                lazy = LazyRoadmap(grid, cell_dimension, MAX_DISTANCE)
+                lazy.construct_adjacency_list(nodes)
+                lazy.find_path(start_node, goal_node)
+                lazy_time = perf_counter() - start
+
+                print("{:>6} {:>8} {:>5} {:>10.1f} {:>13} {:>12} {:>10.3f} {:>9.3f} {!s:>9}".format(
+                    name, count, seed, eager_distance, eager_checks, lazy.collision_checks, eager_time, lazy_time,
+                    eager_distance == goal_node.distance))
+
+
+if __name__ == '__main__':
+    main()
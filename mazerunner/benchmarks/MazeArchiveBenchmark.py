@@ -0,0 +1,81 @@
+""" Compares finding and loading a maze from a directory of text mazes with doing so from a maze archive.
+
+Run from the repository root with: python -m mazerunner.benchmarks.MazeArchiveBenchmark
+
+A collection of COUNT small mazes of a few sizes is saved both ways. Finding the mazes of one size in the directory
+means opening every file, while the archive only reads its index. Opening a single maze from the archive includes
+reading the index, which is the cost of random access when the archive is not kept open.
+"""
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from mazerunner.MazeArchive import MazeArchive
+from mazerunner.MazeFile import read_maze, write_text
+from mazerunner.generators.Generators import generate_maze
+
+COUNT = 1000
+DIMENSIONS = [(24, 12), (36, 18), (48, 24), (60, 30)]
+
+
+def find_in_directory(directory, columns, rows):
+    """ Returns the mazes in the directory with the given dimensions, by reading every file. """
+    mazes = []
+    for path in sorted(directory.glob('*.txt')):
+        grid = read_maze(path)
+        if grid.columns == columns and grid.rows == rows:
+            mazes.append(grid)
+    return mazes
+
+
+def find_in_archive(filename, columns, rows):
+    """ Returns the mazes in the archive with the given dimensions, by reading the index and then only those mazes. """
+    with MazeArchive(filename) as archive:
+        return [archive.read(entry['name']) for entry in archive.find(columns=columns, rows=rows)]
+
+
+def open_from_directory(directory, seed):
+    """ Returns the maze generated with the given seed from the directory. """
+    return read_maze(directory / "maze-{}x{}-{}.txt".format(*DIMENSIONS[seed % len(DIMENSIONS)], seed))
+
+
+def open_from_archive(filename, seed):
+    """ Returns the maze generated with the given seed from the archive, which includes reading its index. """
+    with MazeArchive(filename) as archive:
+        return archive.read(archive.find(seed=seed)[0]['name'])
+
+
+def time_call(function, *args):
+    """ Returns the result of calling the function and the time it took. """
+    start = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        archive_filename = directory / 'mazes.zip'
+        start = perf_counter()
+        with MazeArchive(archive_filename, 'a') as archive:
+            for seed in range(COUNT):
+                columns, rows = DIMENSIONS[seed % len(DIMENSIONS)]
+                grid = generate_maze(columns, rows, seed=seed)
+                write_text(grid, directory / "maze-{}x{}-{}.txt".format(columns, rows, seed))
+                archive.append(grid, algorithm='Depth First Search', seed=seed)
+        print("Saved {} mazes in {:.1f}s".format(COUNT, perf_counter() - start))
+        text_size = sum(path.stat().st_size for path in directory.glob('*.txt'))
+        columns, rows = DIMENSIONS[-1]
+        print("{:<10} {:>10} {:>12} {:>12}".format('storage', 'size (MB)', 'find (ms)', 'open (ms)'))
+        for name, size, find, open_maze, location in [
+                ('directory', text_size, find_in_directory, open_from_directory, directory),
+                ('archive', archive_filename.stat().st_size, find_in_archive, open_from_archive, archive_filename)]:
+            mazes, find_time = time_call(find, location, columns, rows)
+            assert len(mazes) == COUNT // len(DIMENSIONS)
+            grid, open_time = time_call(open_maze, location, COUNT - 1)
+            assert grid is not None
+            print("{:<10} {:>10.2f} {:>12.1f} {:>12.2f}".format(name, size / 1e6, find_time * 1e3, open_time * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+""" Measures building, refreshing and querying the catalog of a large maze directory, against finding mazes by
+opening every file.
+
+Run from the repository root with: python -m mazerunner.benchmarks.MazeCatalogBenchmark
+
+COUNT small mazes of a few sizes are saved as binary files. The catalog is built once, which computes the statistics of
+every maze, then refreshed with no changes and after touching and adding a few files.
+"""
+import os
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from mazerunner.MazeCatalog import MazeCatalog
+from mazerunner.MazeFile import read_maze, write_binary
+from mazerunner.generators.Generators import generate_maze
+
+COUNT = 10000
+DIMENSIONS = [(8, 8), (12, 8), (16, 8), (16, 16)]
+CHANGED = 10
+
+
+def save_mazes(directory, start, count):
+    """ Saves count mazes, with seeds from start, to the directory. """
+    for seed in range(start, start + count):
+        columns, rows = DIMENSIONS[seed % len(DIMENSIONS)]
+        grid = generate_maze(columns, rows, seed=seed)
+        write_binary(grid, directory / "maze-{}x{}-{}.maze".format(columns, rows, seed))
+
+
+def find_by_opening(directory, columns, rows):
+    """ Returns the names of the maze files in the directory with the given dimensions, by opening every file. """
+    names = []
+    for path in directory.glob('*.maze'):
+        grid = read_maze(path)
+        if grid.columns == columns and grid.rows == rows:
+            names.append(path.name)
+    return names
+
+
+def report(name, start):
+    """ Prints the time since start in milliseconds. """
+    print("{:<40} {:>10.1f}".format(name, (perf_counter() - start) * 1e3))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        save_mazes(directory, 0, COUNT)
+        print("{:<40} {:>10}".format("{} mazes".format(COUNT), 'time (ms)'))
+        start = perf_counter()
+        MazeCatalog(directory).refresh()
+        report('build catalog', start)
+        start = perf_counter()
+        read = MazeCatalog(directory).refresh()
+        report('refresh, {} files read'.format(read), start)
+        for path in sorted(directory.glob('*.maze'))[:CHANGED]:
+            os.utime(path, ns=(0, 0))
+        save_mazes(directory, COUNT, CHANGED)
+        start = perf_counter()
+        read = MazeCatalog(directory).refresh()
+        report('refresh, {} files read'.format(read), start)
+        start = perf_counter()
+        catalog = MazeCatalog(directory)
+        report('load catalog', start)
+        start = perf_counter()
+        found = catalog.find(columns=16, rows=16)
+        report('find {} mazes in catalog'.format(len(found)), start)
+        start = perf_counter()
+        longest = max(catalog.entries.values(), key=lambda entry: entry['stats']['diameter'])
+        report('find largest diameter, {}'.format(longest['stats']['diameter']), start)
+        start = perf_counter()
+        opened = find_by_opening(directory, 16, 16)
+        report('find {} mazes by opening files'.format(len(opened)), start)
+
+
+if __name__ == '__main__':
+    main()
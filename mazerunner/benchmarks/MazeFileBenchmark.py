@@ -0,0 +1,69 @@
+""" Compares the size of maze files and the time taken to write and open them in the text and binary formats.
+
+Run from the repository root with: python -m mazerunner.benchmarks.MazeFileBenchmark
+
+The walls are random rather than a generated maze, which makes no difference to either format. Opening a binary maze
+maps the file without reading the walls, so reading every wall of the opened maze, and checking it against the walls
+written, is timed separately. The peak memory allocated while opening a maze is measured in a separate run, as
+tracing allocations slows it down.
+"""
+import random
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+from mazerunner.MazeFile import read_maze, write_binary, write_text
+from mazerunner.MazeGrid import MazeGrid, get_bitmap_length
+
+SIZES = [100, 1000, 10000]
+
+
+def create_random_grid(side, seed=0):
+    """ Returns a side x side grid whose walls are chosen at random. The side must be a multiple of eight so that the
+    bitmaps have no padding bits. """
+    generator = random.Random(seed)
+    length = get_bitmap_length(side * side)
+    return MazeGrid(side, side, bitmaps=(bytearray(generator.randbytes(length)),
+                                         bytearray(generator.randbytes(length))), search=False)
+
+
+def benchmark(grid, filename, write):
+    """ Returns the size of the file the grid is written to, the times taken to write it, open it and read every wall
+    of the opened grid, and the peak memory allocated while opening it. """
+    start = perf_counter()
+    write(grid, filename)
+    write_time = perf_counter() - start
+    start = perf_counter()
+    loaded = read_maze(filename)
+    open_time = perf_counter() - start
+    start = perf_counter()
+    matching = bytes(loaded.bottom) == bytes(grid.bottom) and bytes(loaded.right) == bytes(grid.right)
+    read_time = perf_counter() - start
+    assert matching
+    del loaded
+    tracemalloc.start()
+    loaded = read_maze(filename)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del loaded
+    return filename.stat().st_size, write_time, open_time, read_time, peak
+
+
+def main():
+    print("{:>11} {:<7} {:>12} {:>10} {:>10} {:>10} {:>10}".format(
+        'maze', 'format', 'size (MB)', 'write (s)', 'open (ms)', 'read (ms)', 'peak (MB)'))
+    with tempfile.TemporaryDirectory() as directory:
+        for side in SIZES:
+            grid = create_random_grid(side)
+            for name, write, extension in [('text', write_text, '.txt'), ('binary', write_binary, '.maze')]:
+                filename = Path(directory) / "maze-{}x{}{}".format(side, side, extension)
+                size, write_time, open_time, read_time, peak = benchmark(grid, filename, write)
+                print("{:>11} {:<7} {:>12.2f} {:>10.3f} {:>10.2f} {:>10.2f} {:>10.2f}".format(
+                    "{}x{}".format(side, side), name, size / 1e6, write_time, open_time * 1e3, read_time * 1e3,
+                    peak / 1e6))
+                filename.unlink()
+
+
+if __name__ == '__main__':
+    main()
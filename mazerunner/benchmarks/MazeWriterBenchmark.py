@@ -0,0 +1,54 @@
+""" Compares the time taken to save a maze by writing one cell at a time, as save_maze used to, with the writers in
+MazeFile, which build the whole file from the wall bitmaps and write it at once.
+
+Run from the repository root with: python -m mazerunner.benchmarks.MazeWriterBenchmark
+
+The cell by cell writer is skipped above CELL_WRITER_SIZE_LIMIT, where it takes minutes.
+"""
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from mazerunner.MazeFile import write_binary, write_text
+from mazerunner.benchmarks.MazeFileBenchmark import create_random_grid
+
+SIZES = [100, 500, 1000, 2000, 5000]
+CELL_WRITER_SIZE_LIMIT = 2000
+
+
+def write_text_by_cell(grid, filename):
+    """ Writes the maze in the text format with one write per cell. """
+    with open(filename, 'w') as file:
+        file.write("{} {}".format(grid.columns, grid.rows))
+        for index in range(grid.size):
+            file.write("\n{}{}".format(grid.has_bottom_wall(index), grid.has_right_wall(index)))
+
+
+def time_write(grid, filename, write):
+    """ Returns the time taken to write the grid to the file and the contents of the file. """
+    start = perf_counter()
+    write(grid, filename)
+    elapsed = perf_counter() - start
+    return elapsed, filename.read_bytes()
+
+
+def main():
+    print("{:>11} {:>12} {:>12} {:>10} {:>12}".format('maze', 'by cell (s)', 'text (s)', 'speedup', 'binary (s)'))
+    with tempfile.TemporaryDirectory() as directory:
+        for side in SIZES:
+            grid = create_random_grid(side)
+            filename = Path(directory) / "maze.txt"
+            text_time, contents = time_write(grid, filename, write_text)
+            if side <= CELL_WRITER_SIZE_LIMIT:
+                cell_time, expected = time_write(grid, filename, write_text_by_cell)
+                assert contents == expected
+                text_columns = "{:>12.3f} {:>12.3f} {:>10.1f}".format(cell_time, text_time, cell_time / text_time)
+            else:
+                text_columns = "{:>12} {:>12.3f} {:>10}".format('-', text_time, '-')
+            del contents
+            binary_time, _ = time_write(grid, Path(directory) / "maze.maze", write_binary)
+            print("{:>11} {} {:>12.3f}".format("{}x{}".format(side, side), text_columns, binary_time))
+
+
+if __name__ == '__main__':
+    main()
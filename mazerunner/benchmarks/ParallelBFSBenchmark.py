@@ -0,0 +1,47 @@
+""" Measures how the strip parallel breadth first search scales with the number of worker processes, against
+MazeStats.get_distances in a single process.
+
+Run from the repository root with: python -m mazerunner.benchmarks.ParallelBFSBenchmark
+
+Distances are found from the top left cell of 2000x2000 mazes. The workers range from 1, which searches in this
+process, up to the number of cores, doubling each time, and the speedup is relative to one worker. The distances are
+checked against get_distances, whose time includes building the neighbour index of the grid.
+"""
+import os
+from time import perf_counter
+
+from mazerunner.MazeStats import get_distances
+from mazerunner.generators.Generators import generate_maze
+from mazerunner.solvers.ParallelBFSSolver import get_parallel_distances
+
+SIZE = 2000
+ALGORITHMS = ['Depth First Search', "Kruskal's"]
+
+
+def main():
+    cores = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cores:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cores:
+        workers.append(cores)
+    print("{} cores".format(cores))
+    print("{:<32} {:>8} {:>10} {:>8}".format('maze', 'workers', 'time (s)', 'speedup'))
+    for algorithm in ALGORITHMS:
+        name = "{}x{} {}".format(SIZE, SIZE, algorithm)
+        grid = generate_maze(SIZE, SIZE, algorithm, 0, search=False)
+        start = perf_counter()
+        expected = get_distances(grid, 0)
+        print("{:<32} {:>8} {:>10.2f} {:>8}".format(name, 'single', perf_counter() - start, ''))
+        first = None
+        for count in workers:
+            start = perf_counter()
+            distances = get_parallel_distances(grid, 0, count)
+            elapsed = perf_counter() - start
+            assert distances.tolist() == expected
+            first = first or elapsed
+            print("{:<32} {:>8} {:>10.2f} {:>8.2f}".format(name, count, elapsed, first / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+""" Compares the original PriorityQueue with the IndexedHeap used by the informed solvers and the sample graph search.
+
+Run from the repository root with: python -m mazerunner.benchmarks.PriorityQueueBenchmark
+
+For each queue size the queue is filled, then a fixed number of decrease-key operations and pops are timed. The
+original queue has no decrease-key, so it is emulated with contains, delete and put as dijkstras_search used to do.
+Times are reported per operation.
+"""
+import random
+from time import perf_counter
+
+from mazerunner.utils.IndexedHeap import IndexedHeap
+from mazerunner.utils.PriorityQueue import PriorityQueue
+
+SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+OPERATIONS = 200
+
+
+def benchmark_priority_queue(priorities, updates):
+    """ Returns the time per put, decrease-key and get for the original priority queue. """
+    queue = PriorityQueue()
+    start = perf_counter()
+    for key, priority in enumerate(priorities):
+        queue.put((priority, key))
+    put_time = (perf_counter() - start) / len(priorities)
+
+    start = perf_counter()
+    for key, priority in updates:
+        item = (priorities[key], key)
+        if queue.contains(item):
+            queue.delete(item)
+        queue.put((priority, key))
+    decrease_time = (perf_counter() - start) / len(updates)
+
+    start = perf_counter()
+    for _ in range(OPERATIONS):
+        queue.get()
+    get_time = (perf_counter() - start) / OPERATIONS
+    return put_time, decrease_time, get_time
+
+
+def benchmark_indexed_heap(priorities, updates):
+    """ Returns the time per put, decrease-key and get for the indexed heap. """
+    queue = IndexedHeap()
+    start = perf_counter()
+    for key, priority in enumerate(priorities):
+        queue.put(key, priority)
+    put_time = (perf_counter() - start) / len(priorities)
+
+    start = perf_counter()
+    for key, priority in updates:
+        queue.decrease_key(key, priority)
+    decrease_time = (perf_counter() - start) / len(updates)
+
+    start = perf_counter()
+    for _ in range(OPERATIONS):
+        queue.get()
+    get_time = (perf_counter() - start) / OPERATIONS
+    return put_time, decrease_time, get_time
+
+
+def main():
+    random.seed(0)
+    print("{:>9} {:<14} {:>10} {:>14} {:>10}".format('items', 'queue', 'put (us)', 'decrease (us)', 'get (us)'))
+    for size in SIZES:
+        priorities = [random.random() for _ in range(size)]
+        # Each update lowers the priority of a distinct key
+        updates = [(key, priorities[key] / 2) for key in random.sample(range(size), OPERATIONS)]
+        for name, benchmark in [('PriorityQueue', benchmark_priority_queue), ('IndexedHeap', benchmark_indexed_heap)]:
+            times = benchmark(priorities, updates)
+            print("{:>9} {:<14} {:>10.2f} {:>14.2f} {:>10.2f}".format(size, name, *(t * 1e6 for t in times)))
+
+
+if __name__ == '__main__':
+    main()
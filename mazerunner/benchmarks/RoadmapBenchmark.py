@@ -0,0 +1,103 @@
+""" Compares building the sample roadmap one candidate pair at a time with the batched numpy collision tests, and
+both with the same tests split across a pool of worker processes.
+
+Run from the repository root with: python -m mazerunner.benchmarks.RoadmapBenchmark
+
+The nodes are drawn by sample_points as the random sample solver draws them, at whole scene coordinates, so many of
+the lines between them pass exactly through the corners of cells, where the builds must agree. The 1200 sample roadmap
+uses the 60x30 bundled maze, larger sample counts use generated mazes sized to keep the same number of samples per
+cell. The parallel columns use WORKERS processes, including the time taken to start them.
+
+Beforehand, the line of sight between each candidate pair of nodes is checked to be the same in both directions. Every
+build must return the same adjacency list.
+"""
+from math import sqrt
+from time import perf_counter
+
+from mazerunner.benchmarks.BenchmarkMazes import load_bundled_mazes
+from mazerunner.generators.Generators import generate_maze
+from mazerunner.solvers.SampleGraphNode import SampleGraphNode
+from mazerunner.solvers.SampleRoadmap import SampleRoadmap
+from mazerunner.solvers.SampleSequences import sample_points
+
+SAMPLE_COUNTS = [1200, 10000, 50000]
+CELL_DIMENSION = 20
+MAX_DISTANCE = 100
+# Margin from the cell edges of the points drawn by the random sample solver
+SAMPLE_MARGIN = 6
+SYMMETRY_SAMPLES = 3000
+BATCH_SIZE = 65536
+WORKERS = 4
+
+
+def create_nodes(grid, count, seed=0, cell_dimension=CELL_DIMENSION):
+    """ Returns count nodes drawn by sample_points as the random sample solver draws them, at whole scene coordinates
+    clear of the cell edges. """
+    xs, ys = sample_points(count, grid.columns * cell_dimension, grid.rows * cell_dimension, cell_dimension,
+                           SAMPLE_MARGIN, 'random', seed)
+    return [SampleGraphNode(x, y, node_id) for node_id, (x, y) in enumerate(zip(xs, ys))]
+
+
+def count_asymmetric(grid, count):
+    """ Returns the number of candidate pairs of count nodes and the number of those whose line of sight differs
+    between the two directions. """
+    nodes = create_nodes(grid, count)
+    pairs = list(SampleRoadmap(grid, CELL_DIMENSION, MAX_DISTANCE).get_candidate_pairs(nodes))
+    asymmetric = 0
+    for node, other_node in pairs:
+        a = (node.x / CELL_DIMENSION, node.y / CELL_DIMENSION)
+        b = (other_node.x / CELL_DIMENSION, other_node.y / CELL_DIMENSION)
+        if grid.line_of_sight(*a, *b) != grid.line_of_sight(*b, *a):
+            asymmetric += 1
+    return len(pairs), asymmetric
+
+
+def get_edges(adjacency_list):
+    """ Returns the set of edges in an adjacency list as (id, id) pairs. """
+    return {(node_id, other_node.id) for node_id, nodes in enumerate(adjacency_list) for other_node in nodes}
+
+
+def get_ids(adjacency_list):
+    """ Returns the ids of each node's neighbours, in the order they appear in the adjacency list. """
+    return [[other_node.id for other_node in nodes] for nodes in adjacency_list]
+
+
+def time_roadmap(grid, nodes, batch_size=0, workers=1):
+    """ Returns the adjacency list built for the nodes and the time taken to build it. """
+    start = perf_counter()
+    adjacency_list = SampleRoadmap(grid, CELL_DIMENSION, MAX_DISTANCE, batch_size, workers).construct_adjacency_list(
+        nodes)
+    return adjacency_list, perf_counter() - start
+
+
+def main():
+    bundled = load_bundled_mazes()[-1][1]
+    density = SAMPLE_COUNTS[0] / bundled.size
+    pairs, asymmetric = count_asymmetric(bundled, SYMMETRY_SAMPLES)
+    print("Line of sight differs in each direction for {} of {} candidate pairs".format(asymmetric, pairs))
+    assert not asymmetric
+    print("{:>8} {:>9} {:>10} {:>11} {:>10} {:>13} {:>12} {:>9}".format(
+        'samples', 'maze', 'edges', 'scalar (s)', 'batch (s)', 'parallel (s)', 'par. batch', 'matching'))
+    for count in SAMPLE_COUNTS:
+        if count == SAMPLE_COUNTS[0]:
+            grid = bundled
+        else:
+            side = round(sqrt(count / density / 2))
+            grid = generate_maze(2 * side, side, seed=0)
+        nodes = create_nodes(grid, count)
+
+        scalar, scalar_time = time_roadmap(grid, nodes)
+        batch, batch_time = time_roadmap(grid, nodes, BATCH_SIZE)
+        parallel, parallel_time = time_roadmap(grid, nodes, workers=WORKERS)
+        parallel_batch, parallel_batch_time = time_roadmap(grid, nodes, BATCH_SIZE, WORKERS)
+
+        ids = get_ids(scalar)
+        matching = all(get_ids(other) == ids for other in (batch, parallel, parallel_batch))
+        assert matching
+        print("{:>8} {:>9} {:>10} {:>11.3f} {:>10.3f} {:>13.3f} {:>12.3f} {!s:>9}".format(
+            count, "{}x{}".format(grid.columns, grid.rows), len(get_edges(scalar)) // 2, scalar_time, batch_time,
+            parallel_time, parallel_batch_time, matching))
+
+
+if __name__ == '__main__':
+    main()
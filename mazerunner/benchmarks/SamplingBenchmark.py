@@ -0,0 +1,81 @@
+""" Compares the sequences the random sample solver can draw its points from, by the number of samples each needs
+before the start and goal are connected, and times drawing the points in batches against drawing them one at a time.
+
+Run from the repository root with: python -m mazerunner.benchmarks.SamplingBenchmark
+
+The mazes are drawn at the cell size the runner scene would use in the default window. Adding samples only adds
+edges, so the smallest connecting count is found by bisecting over prefixes of a long run of points.
+"""
+from statistics import median
+from time import perf_counter
+
+from mazerunner.benchmarks.BenchmarkMazes import load_bundled_mazes
+from mazerunner.benchmarks.LazyRoadmapBenchmark import get_cell_dimension, find_distance
+from mazerunner.benchmarks.RoadmapBenchmark import MAX_DISTANCE, BATCH_SIZE
+from mazerunner.solvers.SampleGraphNode import SampleGraphNode
+from mazerunner.solvers.SampleRoadmap import SampleRoadmap
+from mazerunner.solvers.SampleSequences import SEQUENCES, sample_points, sample_points_scalar
+
+MAZES = ['24x12', '36x18']
+MAX_SAMPLES = 8000
+SEEDS = range(5)
+MARGIN = 6
+
+
+def is_connected(grid, cell_dimension, xs, ys):
+    """ Returns true if the roadmap of the given points connects the centres of the first and last cells. """
+    nodes = [SampleGraphNode(cell_dimension / 2, cell_dimension / 2, 0),
+             SampleGraphNode((grid.columns - 0.5) * cell_dimension, (grid.rows - 0.5) * cell_dimension, 1)]
+    nodes.extend(SampleGraphNode(x, y, node_id + 2) for node_id, (x, y) in enumerate(zip(xs, ys)))
+    adjacency_list = SampleRoadmap(grid, cell_dimension, MAX_DISTANCE, BATCH_SIZE).construct_adjacency_list(nodes)
+    return find_distance(adjacency_list, nodes[0], nodes[1]) < float("inf")
+
+
+def find_connecting_count(grid, cell_dimension, sequence, seed):
+    """ Returns the smallest number of samples from the sequence which connects the start and goal, or None if
+    MAX_SAMPLES are not enough. """
+    width = grid.columns * cell_dimension
+    height = grid.rows * cell_dimension
+    xs, ys = sample_points(MAX_SAMPLES, width, height, cell_dimension, MARGIN, sequence, seed)
+    if not is_connected(grid, cell_dimension, xs, ys):
+        return None
+    low, high = 0, MAX_SAMPLES
+    while low < high:
+        middle = (low + high) // 2
+        if is_connected(grid, cell_dimension, xs[:middle], ys[:middle]):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def time_drawing(draw):
+    """ Returns the shortest time taken by draw over a few runs. """
+    times = []
+    for _ in range(5):
+        start = perf_counter()
+        draw()
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def main():
+    mazes = dict(load_bundled_mazes())
+    print("{:>6} {:<8} {:>16} {:>16}".format('maze', 'sequence', 'median samples', 'draw 1200 (ms)'))
+    for name in MAZES:
+        grid = mazes[name]
+        cell_dimension = get_cell_dimension(grid)
+        width = grid.columns * cell_dimension
+        height = grid.rows * cell_dimension
+        draw_time = time_drawing(lambda: sample_points_scalar(1200, width, height, cell_dimension, MARGIN))
+        print("{:>6} {:<8} {:>16} {:>16.2f}".format(name, 'scalar', '', draw_time * 1e3))
+        for sequence in SEQUENCES:
+            draw_time = time_drawing(lambda: sample_points(1200, width, height, cell_dimension, MARGIN, sequence))
+            counts = [find_connecting_count(grid, cell_dimension, sequence, seed) for seed in SEEDS]
+            found = [count for count in counts if count is not None]
+            print("{:>6} {:<8} {:>16} {:>16.2f}".format(
+                name, sequence, median(found) if found else '-', draw_time * 1e3))
+
+
+if __name__ == '__main__':
+    main()
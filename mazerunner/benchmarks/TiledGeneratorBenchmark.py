@@ -0,0 +1,45 @@
+""" Measures how tiled maze generation scales with the number of worker processes, against generating the maze whole
+with the depth first generator.
+
+Run from the repository root with: python -m mazerunner.benchmarks.TiledGeneratorBenchmark
+
+The workers range from 1, which generates in this process, up to the number of cores, doubling each time. The speedup
+is relative to one worker, and each maze is checked to be the same whatever the number of workers.
+"""
+import os
+from time import perf_counter
+
+from mazerunner.generators.DepthFirstGenerator import generate_depth_first
+from mazerunner.generators.TiledGenerator import TILE_SIZE, generate_tiled
+
+SIZES = [1000, 2000, 4000]
+SEED = 0
+
+
+def main():
+    cores = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cores:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != cores:
+        workers.append(cores)
+    print("{} cores, tiles of {} cells".format(cores, TILE_SIZE))
+    print("{:>12} {:>8} {:>10} {:>8}".format('maze', 'workers', 'time (s)', 'speedup'))
+    for size in SIZES:
+        start = perf_counter()
+        generate_depth_first(size, size, SEED, search=False)
+        print("{:>12} {:>8} {:>10.2f} {:>8}".format("{}x{}".format(size, size), 'whole', perf_counter() - start, ''))
+        first = None
+        for count in workers:
+            start = perf_counter()
+            grid = generate_tiled(size, size, seed=SEED, search=False, workers=count)
+            elapsed = perf_counter() - start
+            if first is None:
+                first = (elapsed, bytes(grid.bottom), bytes(grid.right))
+            assert (bytes(grid.bottom), bytes(grid.right)) == first[1:]
+            print("{:>12} {:>8} {:>10.2f} {:>8.2f}".format(
+                "{}x{}".format(size, size), count, elapsed, first[0] / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+""" Measures the uninformed solvers and the cost of resetting the search state between runs.
+
+Run from the repository root with: python -m mazerunner.benchmarks.UninformedSearchBenchmark
+
+Each solver is run from the top left to the bottom right cell of the bundled mazes and of generated 1000x1000 mazes,
+taking the best of REPEATS runs. The reset is timed on its own, as MazeRunner.reset_search, before each run.
+"""
+import io
+from contextlib import redirect_stdout
+from time import perf_counter
+
+from mazerunner.benchmarks.BenchmarkMazes import load_bundled_mazes, create_runner, count_visited
+from mazerunner.generators.Generators import generate_maze
+from mazerunner.solvers.BFSSolver import BFSSolver
+from mazerunner.solvers.BiBFSSolver import BiBFSSolver
+from mazerunner.solvers.BiDFSSolver import BiDFSSolver
+from mazerunner.solvers.DFSSolver import DFSSolver
+
+SOLVERS = [('BFS', BFSSolver), ('BiBFS', BiBFSSolver), ('DFS', DFSSolver), ('BiDFS', BiDFSSolver)]
+REPEATS = 3
+
+
+def time_solver(runner, solver_class):
+    """ Returns the time taken to reset the search and the time taken to run the solver to completion. """
+    start = perf_counter()
+    runner.reset_search()
+    reset_time = perf_counter() - start
+    runner.solver = solver_class(runner)
+    runner.running = True
+    with redirect_stdout(io.StringIO()):
+        start = perf_counter()
+        runner.solver.start()
+        solve_time = perf_counter() - start
+    return reset_time, solve_time
+
+
+def main():
+    mazes = load_bundled_mazes()
+    mazes += [("1000x1000 seed {}".format(seed), generate_maze(1000, 1000, seed=seed)) for seed in range(2)]
+    print("{:<20} {:<6} {:>10} {:>10} {:>10} {:>8}".format('maze', 'solver', 'reset (ms)', 'solve (s)', 'expanded',
+                                                            'path'))
+    for name, grid in mazes:
+        runner = create_runner(grid)
+        grid.build_adjacency()
+        for solver_name, solver_class in SOLVERS:
+            times = [time_solver(runner, solver_class) for _ in range(REPEATS)]
+            reset_time = min(time[0] for time in times)
+            solve_time = min(time[1] for time in times)
+            print("{:<20} {:<6} {:>10.3f} {:>10.4f} {:>10} {:>8}".format(
+                name, solver_name, reset_time * 1000, solve_time, count_visited(grid), len(runner.solver.path)))
+
+
+if __name__ == '__main__':
+    main()
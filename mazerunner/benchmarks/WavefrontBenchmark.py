@@ -0,0 +1,51 @@
+""" Compares the wavefront breadth first search with BFSSolver, and its full distance fields with
+MazeStats.get_distances.
+
+Run from the repository root with: python -m mazerunner.benchmarks.WavefrontBenchmark
+
+Each solver is run from the top left to the bottom right cell of the bundled mazes and of 2000x2000 mazes from several
+generators, which differ greatly in how many levels their searches take. The wavefront times include building the
+neighbour table for each search, while the neighbour index of the grid used by BFSSolver and get_distances is built
+beforehand, as it is kept between searches.
+"""
+from time import perf_counter
+
+from mazerunner.MazeStats import get_distances
+from mazerunner.benchmarks.BenchmarkMazes import load_bundled_mazes, create_runner, run_solver
+from mazerunner.generators.Generators import generate_maze
+from mazerunner.solvers.BFSSolver import BFSSolver
+from mazerunner.solvers.WavefrontSolver import WavefrontSolver, get_wavefront_distances
+
+SIZE = 2000
+ALGORITHMS = ['Depth First Search', "Kruskal's", "Prim's", "Wilson's"]
+
+
+def time_call(function, *args):
+    """ Returns the result of calling the function and the time taken. """
+    start = perf_counter()
+    result = function(*args)
+    return result, perf_counter() - start
+
+
+def main():
+    mazes = load_bundled_mazes()
+    mazes += [("{}x{} {}".format(SIZE, SIZE, algorithm), generate_maze(SIZE, SIZE, algorithm, 0))
+              for algorithm in ALGORITHMS]
+    print("{:<32} {:>8} {:>10} {:>10} {:>8} {:>12} {:>12} {:>8}".format(
+        'maze', 'path', 'BFS (s)', 'wave (s)', 'speedup', 'field (s)', 'wave fld (s)', 'speedup'))
+    for name, grid in mazes:
+        runner = create_runner(grid)
+        grid.build_adjacency()
+        bfs, bfs_time = time_call(run_solver, runner, BFSSolver)
+        wavefront, wavefront_time = time_call(run_solver, runner, WavefrontSolver)
+        assert len(bfs.path) == len(wavefront.path)
+        distances, field_time = time_call(get_distances, grid, 0)
+        wavefront_distances, wavefront_field_time = time_call(get_wavefront_distances, grid, 0)
+        assert wavefront_distances.tolist() == distances
+        print("{:<32} {:>8} {:>10.3f} {:>10.3f} {:>7.1f}x {:>12.3f} {:>12.3f} {:>7.1f}x".format(
+            name, len(bfs.path), bfs_time, wavefront_time, bfs_time / wavefront_time, field_time,
+            wavefront_field_time, field_time / wavefront_field_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+""" Generates batches of mazes across a pool of worker processes, without Qt.
+
+A batch is a list of jobs, each an (algorithm, columns, rows, seed) tuple. Every job is generated from its own seed by
+generate_maze, so a maze depends only on its job and the batch gives the same mazes whatever the number of workers.
+Mazes are either written by the workers to files in a directory, named by their dimensions, algorithm and seed, or
+returned to the main process with their statistics and appended to a maze archive in job order.
+
+Run from the repository root with, for example:
+python -m mazerunner.generators.BatchGenerator --algorithm "Kruskal's" --size 60x30 --count 100 --archive mazes.zip
+"""
+import argparse
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from mazerunner.MazeArchive import MazeArchive
+from mazerunner.MazeFile import write_binary, write_text
+from mazerunner.MazeGrid import MazeGrid
+from mazerunner.MazeStats import get_stats
+from mazerunner.generators.Generators import DEFAULT_ALGORITHM, GENERATORS, generate_maze
+
+# Extension of the files written in each format
+EXTENSIONS = {'text': '.txt', 'binary': '.maze'}
+# Number of chunks of jobs handed to each worker, more chunks report progress more often but cost more messages
+CHUNKS_PER_WORKER = 8
+
+# Output of the jobs run by this process, set by initialise_worker
+output_directory = None
+output_format = None
+
+
+def generate_batch(jobs, directory=None, file_format='text', archive=None, workers=1, progress=None):
+    """ Generates the maze of each job and either writes it to a new file in the directory, in the given format,
+    'text' or 'binary', or appends it to the archive, a MazeArchive opened for appending. Returns the list of file
+    names or archive member names, in job order. workers is the number of processes to generate with, if it is 1 the
+    jobs are run in this process. progress, if given, is called with the number of jobs done and the total after each
+    job. """
+    if archive is None:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        arguments = (str(directory), file_format)
+    else:
+        arguments = (None, None)
+    names = []
+    for result in map_jobs(jobs, workers, arguments):
+        if archive is None:
+            names.append(result)
+        else:
+            (algorithm, columns, rows, seed), bottom, right, stats = result
+            grid = MazeGrid(columns, rows, bitmaps=(bytearray(bottom), bytearray(right)), search=False)
+            names.append(archive.append(grid, algorithm=algorithm, seed=seed, stats=stats))
+        if progress is not None:
+            progress(len(names), len(jobs))
+    return names
+
+
+def map_jobs(jobs, workers, arguments):
+    """ Yields the result of run_job for each job, in job order, running them across the given number of worker
+    processes. """
+    if workers == 1:
+        initialise_worker(*arguments)
+        yield from map(run_job, jobs)
+        return
+    chunk_size = max(1, len(jobs) // (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(workers, initializer=initialise_worker, initargs=arguments) as executor:
+        yield from executor.map(run_job, jobs, chunksize=chunk_size)
+
+
+def initialise_worker(directory, file_format):
+    """ Sets the output of the jobs run by this process. If directory is None the mazes are returned rather than
+    written. """
+    global output_directory, output_format
+    output_directory = directory
+    output_format = file_format
+
+
+def run_job(job):
+    """ Generates the maze of the job. If the worker has an output directory, the maze is written there and the file
+    name is returned, otherwise returns the job, the bottom and right wall bitmaps and the statistics of the maze. """
+    algorithm, columns, rows, seed = job
+    grid = generate_maze(columns, rows, algorithm, seed, search=False)
+    if output_directory is None:
+        return job, bytes(grid.bottom), bytes(grid.right), get_stats(grid)
+    filename = os.path.join(output_directory, "maze-{}x{}-{}-{}{}".format(
+        columns, rows, get_slug(algorithm), seed, EXTENSIONS[output_format]))
+    if output_format == 'binary':
+        write_binary(grid, filename)
+    else:
+        write_text(grid, filename)
+    return filename
+
+
+def create_jobs(algorithms, sizes, count, first_seed=0):
+    """ Returns the jobs which generate count mazes of each size, a (columns, rows) pair, with each algorithm, seeded
+    with first_seed, first_seed + 1 and so on. """
+    return [(algorithm, columns, rows, seed)
+            for algorithm in algorithms
+            for columns, rows in sizes
+            for seed in range(first_seed, first_seed + count)]
+
+
+def get_slug(algorithm):
+    """ Returns the name of the algorithm in lower case with runs of other characters replaced by hyphens, for use in
+    file names. """
+    return re.sub('[^a-z0-9]+', '-', algorithm.lower().replace("'", '')).strip('-')
+
+
+def parse_size(text):
+    """ Returns the (columns, rows) pair given as COLUMNSxROWS. """
+    try:
+        columns, rows = (int(value) for value in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected COLUMNSxROWS, got '{}'".format(text))
+    if columns < 1 or rows < 1:
+        raise argparse.ArgumentTypeError("columns and rows must be positive, got '{}'".format(text))
+    return columns, rows
+
+
+def print_progress(done, total):
+    """ Rewrites a line on stderr showing the number of jobs done. """
+    sys.stderr.write("\r{}/{} mazes".format(done, total))
+    if done == total:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a batch of seeded mazes across worker processes.")
+    parser.add_argument('--algorithm', action='append', choices=list(GENERATORS),
+                        help="generator algorithm, may be repeated (default: {})".format(DEFAULT_ALGORITHM))
+    parser.add_argument('--size', action='append', type=parse_size, metavar='COLUMNSxROWS',
+                        help="maze size, may be repeated (default: 24x12)")
+    parser.add_argument('--count', type=int, default=1, help="number of mazes of each algorithm and size")
+    parser.add_argument('--first-seed', type=int, default=0, help="seed of the first maze of each algorithm and size")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument('--format', choices=list(EXTENSIONS), default='text', help="format of the maze files")
+    parser.add_argument('--directory', default='mazes', help="directory the maze files are written to")
+    parser.add_argument('--archive', help="maze archive to append the mazes to instead of writing files")
+    args = parser.parse_args()
+
+    jobs = create_jobs(args.algorithm or [DEFAULT_ALGORITHM], args.size or [(24, 12)], args.count, args.first_seed)
+    workers = max(1, args.workers)
+    if args.archive is None:
+        generate_batch(jobs, args.directory, args.format, workers=workers, progress=print_progress)
+    else:
+        with MazeArchive(args.archive, 'a') as archive:
+            generate_batch(jobs, archive=archive, workers=workers, progress=print_progress)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import random
+from itertools import permutations
+
+from mazerunner.generators.PaddedWalls import OPEN, create_cell_states, create_grid, create_walls, \
+    get_padded_index, get_padded_width
+
+# Cell state of the border, which is never entered, and of the first cell, which is never backtracked from
+BORDER = 5
+
+
+def generate_depth_first(columns, rows, seed=None, search=True):
+    """ Returns a perfect maze of the given dimensions as a MazeGrid, carved by a randomised depth first search from
+    the upper leftmost cell. The same seed always gives the same maze. This does the same as MazeGenerator without a
+    display, so it does not update a scene or set any cell flags for each step.
+
+    Rather than a stack of cells, the search keeps a byte for each cell which is zero until the cell is reached and
+    then records the direction back to the cell it was reached from, so backtracking follows those directions and the
+    stack costs one byte per cell. Each step tries the directions in a random order and moves to the first unvisited
+    neighbour, which picks uniformly among the unvisited neighbours as MazeGenerator does. """
+    generator = random.Random(seed)
+    width = get_padded_width(columns)
+    # Offsets to the neighbours of a cell, indexed by the direction stored in the cell state
+    offsets = (0, -width, 1, width, -1)
+    # Direction stored in a cell reached with each offset, which leads back the other way, indexed by offset + width
+    back = [0] * (2 * width + 1)
+    back[0] = 3
+    back[width + 1] = 4
+    back[2 * width] = 1
+    back[width - 1] = 2
+    orders = list(permutations(offsets[1:]))
+    states = create_cell_states(columns, rows, BORDER)
+    walls = create_walls(columns, rows)
+    next_random = generator.random
+    start = cell = get_padded_index(width, 0, 0)
+    states[start] = BORDER
+    while True:
+        for offset in orders[int(next_random() * 24)]:
+            next_cell = cell + offset
+            if not states[next_cell]:
+                states[next_cell] = back[offset + width]
+                walls[cell + next_cell] = OPEN
+                cell = next_cell
+                break
+        else:
+            if cell == start:
+                break
+            cell += offsets[states[cell]]
+    return create_grid(columns, rows, walls, search)
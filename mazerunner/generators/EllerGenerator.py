@@ -0,0 +1,83 @@
+import random
+
+from mazerunner.MazeFile import pack_digits, write_binary_rows, write_text_rows
+from mazerunner.MazeGrid import MazeGrid
+
+# Digits of a wall which is present and one which has been removed
+WALL = ord('1')
+OPEN = ord('0')
+
+
+def generate_eller_rows(columns, rows, seed=None):
+    """ Yields the walls of a perfect maze of the given dimensions one row at a time, generated with Eller's algorithm.
+    Each row is a (bottom, right) pair of bytearrays holding a '0' or '1' digit for each cell, as read by
+    write_text_rows and write_binary_rows, and is only valid until the next row is generated.
+
+    Only the set each cell of the current row belongs to is kept, where cells in the same set are connected by the
+    rows above. Adjacent cells in different sets are joined at random, then at least one cell of each set is carved
+    down into the next row, and cells which were not carved into start in sets of their own. The last row joins every
+    set. The sets of a row are labelled 0 to columns - 1 and joined with a union-find over those labels, so the memory
+    used depends only on the number of columns. """
+    generator = random.Random(seed)
+    next_random = generator.random
+    labels = list(range(columns))
+    bottom = bytearray(columns)
+    right = bytearray(columns)
+    for y in range(rows):
+        last_row = y == rows - 1
+        bottom[:] = b'1' * columns
+        right[:] = b'1' * columns
+        # Union-find over the labels of this row, the root of each set is its own parent
+        parent = list(range(columns))
+        for x in range(columns - 1):
+            label = labels[x]
+            while parent[label] != label:
+                parent[label] = label = parent[parent[label]]
+            other_label = labels[x + 1]
+            while parent[other_label] != other_label:
+                parent[other_label] = other_label = parent[parent[other_label]]
+            if label != other_label and (last_row or next_random() < 0.5):
+                parent[label] = other_label
+                right[x] = OPEN
+        if last_row:
+            yield bottom, right
+            break
+        # Cells of each set, by the root of its label
+        members = {}
+        for x in range(columns):
+            label = labels[x]
+            while parent[label] != label:
+                label = parent[label]
+            members.setdefault(label, []).append(x)
+        # Relabel the next row, cells carved into keep the set of the cell above and the others start new sets
+        next_labels = [-1] * columns
+        used = bytearray(columns)
+        for label, cells in enumerate(members.values()):
+            carved = [x for x in cells if next_random() < 0.5] or [cells[int(next_random() * len(cells))]]
+            for x in carved:
+                bottom[x] = OPEN
+                next_labels[x] = label
+            used[label] = 1
+        free = (label for label in range(columns) if not used[label])
+        labels = [label if label >= 0 else next(free) for label in next_labels]
+        yield bottom, right
+
+
+def generate_eller(columns, rows, seed=None, search=True):
+    """ Returns the perfect maze generated by generate_eller_rows as a MazeGrid. """
+    bottom = []
+    right = []
+    for row_bottom, row_right in generate_eller_rows(columns, rows, seed):
+        bottom.append(bytes(row_bottom))
+        right.append(bytes(row_right))
+    grid = MazeGrid(columns, rows, walls=False, search=search)
+    pack_digits(grid.bottom, 0, b''.join(bottom))
+    pack_digits(grid.right, 0, b''.join(right))
+    return grid
+
+
+def write_eller(filename, columns, rows, seed=None, file_format='text'):
+    """ Generates a perfect maze with Eller's algorithm and writes it to the given file in the given format, 'text' or
+    'binary', one row at a time as it is generated. The memory used depends only on the number of columns. """
+    write_rows = write_binary_rows if file_format == 'binary' else write_text_rows
+    write_rows(filename, columns, rows, generate_eller_rows(columns, rows, seed))
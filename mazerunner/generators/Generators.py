@@ -0,0 +1,36 @@
+""" Registry of the headless maze generators. Each takes the columns and rows of the maze, a seed and whether to
+allocate the search arrays of the grid, and returns a perfect maze as a MazeGrid without using Qt. """
+import os
+
+from mazerunner.generators.DepthFirstGenerator import generate_depth_first
+from mazerunner.generators.EllerGenerator import generate_eller
+from mazerunner.generators.KruskalGenerator import generate_kruskal
+from mazerunner.generators.PrimGenerator import generate_prim
+from mazerunner.generators.RecursiveDivisionGenerator import generate_recursive_division
+from mazerunner.generators.WilsonGenerator import generate_wilson
+
+DEFAULT_ALGORITHM = 'Depth First Search'
+# Number of random bytes in a new seed
+SEED_BYTES = 4
+
+# New generators need to be added here, which also makes them available in the generator tab
+GENERATORS = {
+    'Depth First Search': generate_depth_first,
+    "Kruskal's": generate_kruskal,
+    "Prim's": generate_prim,
+    "Wilson's": generate_wilson,
+    'Recursive Division': generate_recursive_division,
+    "Eller's": generate_eller,
+}
+
+
+def generate_maze(columns, rows, algorithm=DEFAULT_ALGORITHM, seed=None, search=True):
+    """ Returns a perfect maze of the given dimensions generated by the named algorithm, one of the keys of GENERATORS.
+    The same algorithm and seed always give the same maze. """
+    return GENERATORS[algorithm](columns, rows, seed, search)
+
+
+def create_seed():
+    """ Returns a new seed drawn from the operating system, so it neither depends on nor changes the state of the
+    random module. """
+    return int.from_bytes(os.urandom(SEED_BYTES), 'little')
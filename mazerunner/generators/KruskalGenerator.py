@@ -0,0 +1,44 @@
+import random
+from array import array
+
+from mazerunner.generators.PaddedWalls import OPEN, create_grid, create_walls, get_padded_index, get_padded_width
+
+
+def generate_kruskal(columns, rows, seed=None, search=True):
+    """ Returns a perfect maze of the given dimensions as a MazeGrid, generated with Kruskal's algorithm. Every wall
+    inside the maze is listed, the list is shuffled and each wall in turn is removed if the cells either side of it are
+    not yet connected. Connected cells are tracked with a union-find over the cell indices which halves the paths it
+    follows, so each lookup takes close to constant time. """
+    generator = random.Random(seed)
+    width = get_padded_width(columns)
+    walls = create_walls(columns, rows)
+    # Each wall inside the maze, as the sum of the padded indices of the cells either side of it
+    edges = array('i')
+    for y in range(rows):
+        start = 2 * get_padded_index(width, 0, y)
+        edges.extend(range(start + 1, start + 2 * (columns - 1), 2))
+        if y < rows - 1:
+            edges.extend(range(start + width, start + width + 2 * columns, 2))
+    generator.shuffle(edges)
+    # Parent of each cell in the union-find, the root of each set is its own parent
+    parent = array('i', range(width * (rows + 2)))
+    remaining = columns * rows - 1
+    for edge in edges:
+        if not remaining:
+            break
+        # Odd sums separate a cell from the one to its right, even sums from the one below
+        if edge & 1:
+            cell = edge >> 1
+            other_cell = cell + 1
+        else:
+            cell = (edge - width) >> 1
+            other_cell = cell + width
+        while parent[cell] != cell:
+            parent[cell] = cell = parent[parent[cell]]
+        while parent[other_cell] != other_cell:
+            parent[other_cell] = other_cell = parent[parent[other_cell]]
+        if cell != other_cell:
+            parent[cell] = other_cell
+            walls[edge] = OPEN
+            remaining -= 1
+    return create_grid(columns, rows, walls, search)
@@ -0,0 +1,76 @@
+""" Layout shared by the headless generators, which carve a maze into flat bytearrays before packing its walls into a
+MazeGrid.
+
+Cells are indexed in a grid which is padded by a border of cells on every side, so a neighbour of any cell can be
+found by adding an offset, -width, 1, width or -1, without checking the edges of the maze. The padded width is made
+even, so that the sum of the indices of two adjacent cells identifies the wall between them. For cells a and a + 1 the
+sum 2a + 1 is odd and indexes the right wall of a. For cells a and a + width the sum 2a + width is even and indexes the
+bottom wall of a. The walls are held as b'1' and b'0' digits, ready to be packed by MazeFile.pack_digits.
+"""
+from mazerunner.MazeFile import pack_digits
+from mazerunner.MazeGrid import MazeGrid
+
+# Digit of a wall which has been removed
+OPEN = ord('0')
+
+
+def get_padded_width(columns):
+    """ Returns the width of the padded grid for a maze with the given number of columns, which is always even. """
+    return columns + 2 + (columns & 1)
+
+
+def get_padded_index(width, x, y):
+    """ Returns the index in the padded grid of the cell at (x, y) in the maze. """
+    return (y + 1) * width + x + 1
+
+
+def create_cell_states(columns, rows, border):
+    """ Returns a bytearray holding a byte for each cell of the padded grid, which is zero for cells in the maze and
+    border for the cells around it. """
+    width = get_padded_width(columns)
+    states = bytearray([border]) * (width * (rows + 2))
+    empty = bytes(columns)
+    for y in range(rows):
+        start = get_padded_index(width, 0, y)
+        states[start:start + columns] = empty
+    return states
+
+
+def create_walls(columns, rows):
+    """ Returns a bytearray holding a digit for every wall of the padded grid, all of which are present. """
+    width = get_padded_width(columns)
+    return bytearray(b'1') * (2 * width * (rows + 2) + width)
+
+
+def create_open_walls(columns, rows):
+    """ Returns a bytearray holding a digit for every wall of the padded grid, where only the walls on the right and
+    bottom edges of the maze are present. """
+    width = get_padded_width(columns)
+    walls = bytearray(b'0') * (2 * width * (rows + 2) + width)
+    # Right walls of the last column and bottom walls of the last row, the top and left edges are implied
+    start = 2 * get_padded_index(width, columns - 1, 0) + 1
+    walls[start:start + 2 * width * rows:2 * width] = b'1' * rows
+    start = 2 * get_padded_index(width, 0, rows - 1) + width
+    walls[start:start + 2 * columns:2] = b'1' * columns
+    return walls
+
+
+def get_offsets(width):
+    """ Returns the offsets from a cell to its neighbours above, right, below and left in a padded grid of the given
+    width. """
+    return -width, 1, width, -1
+
+
+def create_grid(columns, rows, walls, search=True):
+    """ Returns a MazeGrid holding the walls carved into the padded grid. """
+    width = get_padded_width(columns)
+    bottom = []
+    right = []
+    for y in range(rows):
+        start = 2 * get_padded_index(width, 0, y)
+        right.append(walls[start + 1:start + 2 * columns:2])
+        bottom.append(walls[start + width:start + width + 2 * columns:2])
+    grid = MazeGrid(columns, rows, walls=False, search=search)
+    pack_digits(grid.bottom, 0, b''.join(bottom))
+    pack_digits(grid.right, 0, b''.join(right))
+    return grid
@@ -0,0 +1,43 @@
+import random
+from array import array
+from itertools import permutations
+
+from mazerunner.generators.PaddedWalls import OPEN, create_cell_states, create_grid, create_walls, \
+    get_offsets, get_padded_index, get_padded_width
+
+# Cell states, cells which are in neither the maze nor the frontier are zero
+FRONTIER = 1
+IN_MAZE = 2
+BORDER = 3
+
+
+def generate_prim(columns, rows, seed=None, search=True):
+    """ Returns a perfect maze of the given dimensions as a MazeGrid, generated with a randomised version of Prim's
+    algorithm. The maze grows from a random cell. The cells next to it form the frontier, and at each step a random
+    frontier cell is joined to a random neighbour already in the maze, then its own neighbours join the frontier. The
+    frontier is an array of cell indices, a cell is removed by moving the last cell into its place. """
+    generator = random.Random(seed)
+    width = get_padded_width(columns)
+    offsets = get_offsets(width)
+    orders = list(permutations(offsets))
+    states = create_cell_states(columns, rows, BORDER)
+    walls = create_walls(columns, rows)
+    next_random = generator.random
+    frontier = array('i', [get_padded_index(width, generator.randrange(columns), generator.randrange(rows))])
+    states[frontier[0]] = FRONTIER
+    while frontier:
+        position = int(next_random() * len(frontier))
+        cell = frontier[position]
+        frontier[position] = frontier[-1]
+        frontier.pop()
+        for offset in orders[int(next_random() * 24)]:
+            if states[cell + offset] == IN_MAZE:
+                walls[2 * cell + offset] = OPEN
+                break
+        states[cell] = IN_MAZE
+        for offset in offsets:
+            neighbour = cell + offset
+            if not states[neighbour]:
+                states[neighbour] = FRONTIER
+                frontier.append(neighbour)
+    return create_grid(columns, rows, walls, search)
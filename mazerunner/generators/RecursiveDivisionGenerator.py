@@ -0,0 +1,39 @@
+import random
+
+from mazerunner.generators.PaddedWalls import OPEN, create_grid, create_open_walls, get_padded_index, \
+    get_padded_width
+
+
+def generate_recursive_division(columns, rows, seed=None, search=True):
+    """ Returns a perfect maze of the given dimensions as a MazeGrid, generated by recursive division. The maze starts
+    without any walls inside it. Each chamber is divided in two by a wall across its shorter side, or either side if it
+    is square, with a single passage through it, and both halves are divided in turn until they are one cell wide.
+    Chambers are held on an explicit stack and each dividing wall is written as one slice of the wall digits. """
+    generator = random.Random(seed)
+    randrange = generator.randrange
+    width = get_padded_width(columns)
+    walls = create_open_walls(columns, rows)
+    # Chambers to divide as (x, y, columns, rows)
+    chambers = [(0, 0, columns, rows)]
+    while chambers:
+        x, y, chamber_columns, chamber_rows = chambers.pop()
+        if chamber_columns < 2 or chamber_rows < 2:
+            continue
+        if chamber_rows > chamber_columns or (chamber_rows == chamber_columns and generator.random() < 0.5):
+            # Horizontal wall along the bottom of row wall_y
+            wall_y = y + randrange(chamber_rows - 1)
+            start = 2 * get_padded_index(width, x, wall_y) + width
+            walls[start:start + 2 * chamber_columns:2] = b'1' * chamber_columns
+            walls[start + 2 * randrange(chamber_columns)] = OPEN
+            chambers.append((x, y, chamber_columns, wall_y - y + 1))
+            chambers.append((x, wall_y + 1, chamber_columns, y + chamber_rows - wall_y - 1))
+        else:
+            # Vertical wall along the right of column wall_x
+            wall_x = x + randrange(chamber_columns - 1)
+            start = 2 * get_padded_index(width, wall_x, y) + 1
+            step = 2 * width
+            walls[start:start + step * chamber_rows:step] = b'1' * chamber_rows
+            walls[start + step * randrange(chamber_rows)] = OPEN
+            chambers.append((x, y, wall_x - x + 1, chamber_rows))
+            chambers.append((wall_x + 1, y, x + chamber_columns - wall_x - 1, chamber_rows))
+    return create_grid(columns, rows, walls, search)
@@ -0,0 +1,185 @@
+""" Generates very large mazes in tiles across a pool of worker processes, without Qt.
+
+The maze is split into tiles of TILE_SIZE by TILE_SIZE cells, and each tile is generated as a perfect maze of its own
+by any of the registered generators, from a seed of its own. A row of tiles forms a band, and each band is generated by
+one worker, which packs the walls of its tiles straight into the wall bitmaps of the maze, held in shared memory. Tiles
+are a multiple of eight rows high, so every band starts on a byte of each bitmap and no two workers write to the same
+byte. Once every band is done, the tiles are joined by opening one wall on the seam between each pair of tiles on a
+random spanning tree of the tiles. As each tile is a tree and the tiles are joined by a tree, the result is a single
+perfect maze.
+
+The tile seeds and the seams are drawn from the seed of the maze, so a seed gives the same maze whatever the number of
+workers, but not the same maze as generating it whole. Only a band of one worker is held in memory at once, besides
+the bitmaps. The bitmaps of a maze generated by more than one worker stay in the shared memory, which is released
+with the maze.
+
+Run from the repository root with, for example:
+python -m mazerunner.generators.TiledGenerator 20000x20000 mazes/giant.maze --workers 8
+"""
+import argparse
+import os
+import random
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from mazerunner.MazeFile import pack_digits, unpack_digits, write_binary, write_text
+from mazerunner.MazeGrid import MazeGrid, get_bitmap_length
+from mazerunner.generators.BatchGenerator import parse_size
+from mazerunner.generators.Generators import DEFAULT_ALGORITHM, GENERATORS, create_seed, generate_maze
+
+# Columns and rows of a tile, a multiple of eight so that bands start on a byte of the wall bitmaps
+TILE_SIZE = 512
+# Number of random bits in the seed of a tile
+TILE_SEED_BITS = 32
+
+# Wall bitmaps and dimensions of the maze written to by this process, set by initialise_worker
+shared_memory = None
+shared_bottom = None
+shared_right = None
+maze_columns = None
+maze_rows = None
+tile_algorithm = None
+tile_size = None
+
+
+def generate_tiled(columns, rows, algorithm=DEFAULT_ALGORITHM, seed=None, search=True, size=TILE_SIZE, workers=1):
+    """ Returns a perfect maze of the given dimensions as a MazeGrid, generated in tiles of size by size cells with the
+    named algorithm, one of the keys of GENERATORS. size must be a multiple of eight. workers is the number of
+    processes to generate the bands of tiles with, if it is 1 they are generated in this process. """
+    if size <= 0 or size % 8:
+        raise ValueError("The tile size must be a positive multiple of eight, got {}".format(size))
+    generator = random.Random(create_seed() if seed is None else seed)
+    tile_columns = -(-columns // size)
+    tile_rows = -(-rows // size)
+    tile_seeds = [[generator.getrandbits(TILE_SEED_BITS) for _ in range(tile_columns)] for _ in range(tile_rows)]
+    length = get_bitmap_length(columns * rows)
+    arguments = (columns, rows, algorithm, size)
+    if workers == 1:
+        grid = MazeGrid(columns, rows, search=False)
+        initialise_bitmaps(grid.bottom, grid.right, *arguments)
+        for band, seeds in enumerate(tile_seeds):
+            generate_band(band, seeds)
+    else:
+        memory = SharedMemory(create=True, size=2 * length)
+        try:
+            with ProcessPoolExecutor(workers, initializer=initialise_worker,
+                                     initargs=(memory.name, length) + arguments) as executor:
+                # Consume the results so that any exception raised by a worker is raised here
+                for _ in executor.map(generate_band, range(tile_rows), tile_seeds):
+                    pass
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+        # The wall bitmaps are views of the shared memory rather than copies. The memory is kept with the grid,
+        # unlinked when the grid is released, and closed once its views are
+        grid = MazeGrid(columns, rows, bitmaps=(memory.buf[:length], memory.buf[length:2 * length]), search=False)
+        grid.shared_memory = memory
+        weakref.finalize(grid, memory.unlink)
+    open_seams(grid, size, generator)
+    if search:
+        grid.reset_search()
+    return grid
+
+
+def initialise_worker(name, length, columns, rows, algorithm, size):
+    """ Attaches this process to the shared memory holding the wall bitmaps, which are length bytes each. """
+    global shared_memory
+    shared_memory = SharedMemory(name)
+    initialise_bitmaps(shared_memory.buf[:length], shared_memory.buf[length:2 * length], columns, rows, algorithm,
+                       size)
+
+
+def initialise_bitmaps(bottom, right, columns, rows, algorithm, size):
+    """ Sets the wall bitmaps and dimensions of the maze written to by generate_band. """
+    global shared_bottom, shared_right, maze_columns, maze_rows, tile_algorithm, tile_size
+    shared_bottom = bottom
+    shared_right = right
+    maze_columns = columns
+    maze_rows = rows
+    tile_algorithm = algorithm
+    tile_size = size
+
+
+def generate_band(band, seeds):
+    """ Generates each tile in the given band, the row of tiles with that index, from its seed and packs the walls of
+    the band into the wall bitmaps. """
+    columns = maze_columns
+    first_row = band * tile_size
+    band_rows = min(tile_size, maze_rows - first_row)
+    # Digits of the walls of the band, laid out as in the maze
+    bottom = bytearray(band_rows * columns)
+    right = bytearray(band_rows * columns)
+    for tile, seed in enumerate(seeds):
+        first_column = tile * tile_size
+        tile_columns = min(tile_size, columns - first_column)
+        grid = generate_maze(tile_columns, band_rows, tile_algorithm, seed, search=False)
+        tile_bottom = unpack_digits(grid.bottom, grid.size)
+        tile_right = unpack_digits(grid.right, grid.size)
+        for y in range(band_rows):
+            start = y * columns + first_column
+            tile_start = y * tile_columns
+            bottom[start:start + tile_columns] = tile_bottom[tile_start:tile_start + tile_columns]
+            right[start:start + tile_columns] = tile_right[tile_start:tile_start + tile_columns]
+    pack_digits(shared_bottom, first_row * columns, bottom)
+    pack_digits(shared_right, first_row * columns, right)
+
+
+def open_seams(grid, size, generator):
+    """ Joins the tiles of the maze into one by opening a wall at a random place on the seam between each pair of
+    adjacent tiles on a random spanning tree of the tiles, found with Kruskal's algorithm. """
+    tile_columns = -(-grid.columns // size)
+    tile_rows = -(-grid.rows // size)
+    # Each seam is a tile and whether it joins the tile to its right or the tile below
+    seams = [(tile, True) for tile in range(tile_columns * tile_rows) if tile % tile_columns < tile_columns - 1]
+    seams += [(tile, False) for tile in range(tile_columns * (tile_rows - 1))]
+    generator.shuffle(seams)
+    parent = list(range(tile_columns * tile_rows))
+    for tile, across in seams:
+        other = tile + 1 if across else tile + tile_columns
+        root = find_root(parent, tile)
+        other_root = find_root(parent, other)
+        if root == other_root:
+            continue
+        parent[root] = other_root
+        first_column = (tile % tile_columns) * size
+        first_row = (tile // tile_columns) * size
+        if across:
+            # A right wall in the last column of the tile
+            y = first_row + int(generator.random() * min(size, grid.rows - first_row))
+            grid.set_right_wall(grid.get_cell_index(first_column + size - 1, y), False)
+        else:
+            # A bottom wall in the last row of the tile
+            x = first_column + int(generator.random() * min(size, grid.columns - first_column))
+            grid.set_bottom_wall(grid.get_cell_index(x, first_row + size - 1), False)
+
+
+def find_root(parent, tile):
+    """ Returns the root of the set holding the tile, halving the path to it. """
+    while parent[tile] != tile:
+        parent[tile] = tile = parent[parent[tile]]
+    return tile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a very large maze in tiles across worker processes.")
+    parser.add_argument('size', type=parse_size, metavar='COLUMNSxROWS', help="maze size")
+    parser.add_argument('filename', help="file the maze is written to, in the binary format unless it ends in .txt")
+    parser.add_argument('--algorithm', choices=list(GENERATORS), default=DEFAULT_ALGORITHM,
+                        help="generator algorithm of the tiles")
+    parser.add_argument('--seed', type=int, help="seed of the maze (default: a new seed)")
+    parser.add_argument('--tile-size', type=int, default=TILE_SIZE, help="columns and rows of a tile")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    args = parser.parse_args()
+
+    columns, rows = args.size
+    grid = generate_tiled(columns, rows, args.algorithm, args.seed, False, args.tile_size, max(1, args.workers))
+    if args.filename.endswith('.txt'):
+        write_text(grid, args.filename)
+    else:
+        write_binary(grid, args.filename)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import random
+from array import array
+
+from mazerunner.generators.PaddedWalls import OPEN, create_cell_states, create_grid, create_walls, \
+    get_offsets, get_padded_index, get_padded_width
+
+IN_MAZE = 1
+BORDER = 2
+
+
+def generate_wilson(columns, rows, seed=None, search=True):
+    """ Returns a perfect maze of the given dimensions as a MazeGrid, generated with Wilson's algorithm, which picks
+    uniformly among all perfect mazes. The maze starts as a single random cell. From each cell not yet in the maze a
+    random walk is taken until it reaches the maze, and the walk with its loops erased is added to the maze.
+
+    Loops are erased without storing the walk. The direction last taken from each cell is recorded, overwriting the
+    direction taken on any earlier visit, so following the directions from the start of the walk traces it without
+    its loops. """
+    generator = random.Random(seed)
+    width = get_padded_width(columns)
+    offsets = get_offsets(width)
+    states = create_cell_states(columns, rows, BORDER)
+    # Offset last taken from each cell by the current walk
+    steps = array('i', [0]) * len(states)
+    walls = create_walls(columns, rows)
+    next_direction = generator.getrandbits
+    states[get_padded_index(width, generator.randrange(columns), generator.randrange(rows))] = IN_MAZE
+    for y in range(rows):
+        row_start = get_padded_index(width, 0, y)
+        for start in range(row_start, row_start + columns):
+            if states[start]:
+                continue
+            cell = start
+            while not states[cell]:
+                offset = offsets[next_direction(2)]
+                if states[cell + offset] != BORDER:
+                    steps[cell] = offset
+                    cell += offset
+            cell = start
+            while not states[cell]:
+                states[cell] = IN_MAZE
+                offset = steps[cell]
+                walls[2 * cell + offset] = OPEN
+                cell += offset
+    return create_grid(columns, rows, walls, search)
@@ -16,9 +16,11 @@ class AStarSolver(InformedSolver):
     def calculate_cost(self, cell):
         """ Calculates the estimated distance from the start cell to the goal cell, via the given cell using manhattan
         distance for the heuristic h(c). """
-        return cell.cost + abs(self.runner.goal_cell.x - cell.x) + abs(self.runner.goal_cell.y - cell.y)
+        x, y = self.grid.get_coordinates(cell)
+        return self.grid.cost[cell] + abs(self.goal_x - x) + abs(self.goal_y - y)
 
     def calculate_cost_euclidean(self, cell):
         """ Calculates the estimated distance from the start cell to the goal cell, via the given cell using euclidean
         distance for the heuristic h(c). """
-        return cell.cost + sqrt((self.runner.goal_cell.x - cell.x) ** 2 + (self.runner.y - cell.y) ** 2)
+        x, y = self.grid.get_coordinates(cell)
+        return self.grid.cost[cell] + sqrt((self.goal_x - x) ** 2 + (self.goal_y - y) ** 2)
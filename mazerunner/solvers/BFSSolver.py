@@ -12,4 +12,4 @@ class BFSSolver(UninformedSolver):
 
     def get_next_cell(self):
         """ Return the cell at the front of the queue. """
-        return self.queue.pop(0)
+        return self.queue.popleft()
@@ -12,4 +12,4 @@ class BiBFSSolver(BidirectionalUninformedSolver):
 
     def get_next_cell(self, queue):
         """ Returns the cell at the front of the queue. """
-        return queue.pop(0)
+        return queue.popleft()
@@ -1,13 +1,22 @@
+from collections import deque
+
+from mazerunner.MazeGrid import VISITED, IN_QUEUE, F_VISITED, B_VISITED, SOLUTION, CHANGED
+
+
 class BidirectionalUninformedSolver:
     """ Solver which implements a Bidirectional Uninformed Search. One search commences forward from the start cell
     and the other backwards from the goal. The search terminates when a cell has been visited by both the forward and
-    backward search. """
+    backward search. Cells are referred to by their index in the runner's grid, the forward search tree is stored in
+    the grid's parent array and the backward search tree in its b_parent array. Each fringe is a deque, which inheriting
+    solvers use as a queue or a stack, and a cell is only added to a fringe the first time that search reaches it in the
+    current search generation of the grid. """
 
     def __init__(self, runner):
         self.runner = runner
+        self.grid = runner.grid
         self.path = []
-        self.f_queue = []
-        self.b_queue = []
+        self.f_queue = deque()
+        self.b_queue = deque()
         # Current and goal cells for forward and backward searches
         self.f_current_cell = self.runner.start_cell
         self.f_goal_cell = self.runner.goal_cell
@@ -23,44 +32,58 @@ class BidirectionalUninformedSolver:
         """ Initialises the start and goal cells for the search. """
         self.f_queue.append(self.f_current_cell)
         self.b_queue.append(self.b_current_cell)
+        # The root of each search tree is reached and is its own parent so it is never added to the queue again
+        grid = self.grid
+        grid.reached[self.f_current_cell] = grid.generation
+        grid.parent[self.f_current_cell] = self.f_current_cell
+        grid.b_reached[self.b_current_cell] = grid.generation
+        grid.b_parent[self.b_current_cell] = self.b_current_cell
 
     def run(self):
         """ Performs the Bidirectional Uninformed Search. The queue behaviour is defined by inheriting solvers. """
-        while True:
-            if not self.runner.running or self.runner.paused:
-                break
-            self.f_current_cell = self.get_next_cell(self.f_queue)
-            self.b_current_cell = self.get_next_cell(self.b_queue)
-
-            self.f_current_cell.f_visited = True
-            self.f_current_cell.visited = True
-            self.f_current_cell.in_queue = False
+        runner = self.runner
+        grid = self.grid
+        flags = grid.flags
+        f_parent = grid.parent
+        b_parent = grid.b_parent
+        f_reached = grid.reached
+        b_reached = grid.b_reached
+        generation = grid.generation
+        f_queue = self.f_queue
+        b_queue = self.b_queue
+        get_next_cell = self.get_next_cell
+        get_neighbours = grid.get_neighbours
+        both_visited = F_VISITED | B_VISITED
+        while runner.running and not runner.paused:
+            f_cell = self.f_current_cell = get_next_cell(f_queue)
+            b_cell = self.b_current_cell = get_next_cell(b_queue)
 
-            self.b_current_cell.b_visited = True
-            self.b_current_cell.visited = True
-            self.b_current_cell.in_queue = False
+            flags[f_cell] = flags[f_cell] & ~IN_QUEUE | F_VISITED | VISITED | CHANGED
+            flags[b_cell] = flags[b_cell] & ~IN_QUEUE | B_VISITED | VISITED | CHANGED
 
             # If the two paths have overlapped, break the loop
-            if self.f_current_cell.both_visited():
-                self.construct_path(self.f_current_cell)
+            if flags[f_cell] & both_visited == both_visited:
+                self.construct_path(f_cell)
                 break
-            elif self.b_current_cell.both_visited():
-                self.construct_path(self.b_current_cell)
+            elif flags[b_cell] & both_visited == both_visited:
+                self.construct_path(b_cell)
                 break
-            else:
-                for cell in self.runner.get_neighbours(self.f_current_cell):
-                    if cell.f_parent is None:
-                        self.f_queue.append(cell)
-                        cell.f_parent = self.f_current_cell
-                        cell.in_queue = True
 
-                for cell in self.runner.get_neighbours(self.b_current_cell):
-                    if cell.b_parent is None:
-                        self.b_queue.append(cell)
-                        cell.b_parent = self.b_current_cell
-                        cell.in_queue = True
+            for neighbour in get_neighbours(f_cell):
+                if f_reached[neighbour] != generation:
+                    f_reached[neighbour] = generation
+                    f_parent[neighbour] = f_cell
+                    f_queue.append(neighbour)
+                    flags[neighbour] |= IN_QUEUE | CHANGED
+
+            for neighbour in get_neighbours(b_cell):
+                if b_reached[neighbour] != generation:
+                    b_reached[neighbour] = generation
+                    b_parent[neighbour] = b_cell
+                    b_queue.append(neighbour)
+                    flags[neighbour] |= IN_QUEUE | CHANGED
 
-            self.runner.display.update_scene()
+            runner.update_display()
 
     def recommence(self):
         """ Recommence the search. """
@@ -70,14 +93,15 @@ class BidirectionalUninformedSolver:
         """ Constructs the solution path by traversing the search tree which was constructed. Bidirectional search exits
         when the two search paths overlap, this method requires that the parameter cell is the cell at which this
         overlap occurs. """
+        grid = self.grid
         # From the middle, iterate through forward parents until the start cell is reached. The path is reversed after
         # being constructed to avoid the added complexity of prepending.
         new_cell = cell
         while not new_cell == self.b_goal_cell:
-            new_cell.solution = True
-            self.path.append(new_cell.f_parent)
-            new_cell = new_cell.f_parent
-        self.b_goal_cell.solution = True
+            grid.set_flag(new_cell, SOLUTION)
+            new_cell = grid.parent[new_cell]
+            self.path.append(new_cell)
+        grid.set_flag(self.b_goal_cell, SOLUTION)
         self.path.reverse()
 
         # Next add the overlapping cell and iterate through backward parents toward the goal. By appending cells here
@@ -85,14 +109,14 @@ class BidirectionalUninformedSolver:
         new_cell = cell
         self.path.append(new_cell)
         while not new_cell == self.f_goal_cell:
-            new_cell.solution = True
-            self.path.append(new_cell.b_parent)
-            new_cell = new_cell.b_parent
-        self.f_goal_cell.solution = True
-        print(self.path)
+            grid.set_flag(new_cell, SOLUTION)
+            new_cell = grid.b_parent[new_cell]
+            self.path.append(new_cell)
+        grid.set_flag(self.f_goal_cell, SOLUTION)
+        print([grid.get_coordinates(cell) for cell in self.path])
         self.runner.solved = True
         self.runner.running = False
-        self.runner.display.update_scene(self.path)
+        self.runner.update_display(self.path)
 
     def get_next_cell(self, queue):
         """ Returns the next cell from the given queue, must be overridden by the class which inherits from this
@@ -12,4 +12,5 @@ class GreedySolver(InformedSolver):
 
     def calculate_cost(self, cell):
         """ Calculates the estimated distance from a cell to the goal cell using manhattan distance. """
-        return abs(self.runner.goal_cell.x - cell.x) + abs(self.runner.goal_cell.y - cell.y)
+        x, y = self.grid.get_coordinates(cell)
+        return abs(self.goal_x - x) + abs(self.goal_y - y)
@@ -1,17 +1,26 @@
-from mazerunner.utils.PriorityQueue import PriorityQueue
+from mazerunner.MazeGrid import VISITED, IN_QUEUE, SOLUTION
+from mazerunner.utils.BucketQueue import BucketQueue
+from mazerunner.utils.IndexedHeap import IndexedHeap
 
 
 class InformedSolver:
     """ Base class for an informed search. The fringe nodes are stored in a priority queue, sorted by an
-    estimation of their cost. The function which defines how the cost is calculated is different for each solver. """
+    estimation of their cost. The function which defines how the cost is calculated is different for each solver.
+    Cells are referred to by their index in the runner's grid and are used directly as the keys of the queue. When the
+    cost function produces integers the queue is a bucket queue, otherwise it is a heap. A cell still in the queue which
+    is reached by a shorter path, which can happen in mazes with loops, takes the new parent and has its key decreased.
+    """
 
     def __init__(self, runner):
         self.runner = runner
+        self.grid = runner.grid
         self.path = []
-        self.queue = PriorityQueue()
+        # The queue is created once the type of the costs is known, in initialise
+        self.queue = None
         # Current and goal cells
         self.current_cell = self.runner.start_cell
         self.goal_cell = self.runner.goal_cell
+        self.goal_x, self.goal_y = self.grid.get_coordinates(self.goal_cell)
 
     def start(self):
         """ Starts the solver."""
@@ -20,29 +29,54 @@ class InformedSolver:
 
     def initialise(self):
         """ Initialises the start and goal cells for the search. """
-        self.queue.put((self.calculate_cost(self.current_cell), self.current_cell))
-        self.current_cell.cost = 0
+        grid = self.grid
+        grid.cost[self.current_cell] = 0
+        # The start cell is reached and is its own parent so it is never added to the queue again
+        grid.reached[self.current_cell] = grid.generation
+        grid.parent[self.current_cell] = self.current_cell
+        cost = self.calculate_cost(self.current_cell)
+        self.queue = self.create_queue(cost)
+        self.queue.put(self.current_cell, cost)
 
     def run(self):
         """ Performs the informed search. The cost function f(c) is defined by inheriting solvers. """
+        grid = self.grid
+        parent = grid.parent
+        cost = grid.cost
+        reached = grid.reached
+        generation = grid.generation
+        queue = self.queue
         while True:
             if not self.runner.running or self.runner.paused:
                 break
-            self.current_cell = self.queue.get()[1]
-            self.current_cell.visited = True
-            self.current_cell.in_queue = False
+            self.current_cell = queue.get()
+            grid.set_flag(self.current_cell, VISITED)
+            grid.clear_flag(self.current_cell, IN_QUEUE)
             if self.current_cell == self.goal_cell:
                 self.construct_path()
                 break
             else:
-                for cell in self.runner.get_neighbours(self.current_cell):
-                    if cell.parent is None:
-                        cell.parent = self.current_cell
-                        # Cost to cell is ignored by greedy search
-                        cell.cost = self.current_cell.cost + 1
-                        self.queue.put((self.calculate_cost(cell), cell))
-                        cell.in_queue = True
-            self.runner.display.update_scene()
+                # Cost to cell is ignored by greedy search
+                cell_cost = cost[self.current_cell] + 1
+                for cell in grid.get_neighbours(self.current_cell):
+                    if reached[cell] != generation:
+                        reached[cell] = generation
+                        parent[cell] = self.current_cell
+                        cost[cell] = cell_cost
+                        queue.put(cell, self.calculate_cost(cell))
+                        grid.set_flag(cell, IN_QUEUE)
+                    elif cell_cost < cost[cell] and queue.contains(cell):
+                        parent[cell] = self.current_cell
+                        cost[cell] = cell_cost
+                        queue.decrease_key(cell, self.calculate_cost(cell))
+            self.runner.update_display()
+
+    def create_queue(self, cost):
+        """ Returns the queue used to store the fringe. Integer costs can index the buckets of a bucket queue, any other
+        costs are ordered by a heap. """
+        if isinstance(cost, int):
+            return BucketQueue()
+        return IndexedHeap()
 
     def recommence(self):
         """ Recommence the search. """
@@ -53,15 +87,15 @@ class InformedSolver:
         self.path.append(self.current_cell)
         cell = self.current_cell
         while not cell == self.runner.start_cell:
-            cell.solution = True
-            self.path.append(cell.parent)
-            cell = cell.parent
-        self.runner.start_cell.solution = True
+            self.grid.set_flag(cell, SOLUTION)
+            cell = self.grid.parent[cell]
+            self.path.append(cell)
+        self.grid.set_flag(self.runner.start_cell, SOLUTION)
         self.path.reverse()
-        print(self.path)
+        print([self.grid.get_coordinates(cell) for cell in self.path])
         self.runner.solved = True
         self.runner.running = False
-        self.runner.display.update_scene(self.path)
+        self.runner.update_display(self.path)
 
     def calculate_cost(self, cell):
         """ Returns the cost of the cell, must be overridden by inheriting solvers. """
@@ -0,0 +1,69 @@
+from mazerunner.MazeGrid import VISITED, SOLUTION
+
+
+class JunctionGraphSolver:
+    """ Solver which searches the junction graph of the maze, where each corridor is contracted into a single edge
+    weighted by its length, rather than expanding every cell. The graph is kept by the grid, so it is only built for
+    the first search of a maze. The route found is expanded back into the full path of cells, and the junctions and
+    dead ends which were expanded are shown as visited. The search is not animated.
+
+    Without a heuristic the graph is searched with Dijkstra's algorithm, which is what a breadth first search of the
+    cells becomes once corridors are weighted edges, so the solution is optimal. """
+
+    def __init__(self, runner):
+        self.runner = runner
+        self.grid = runner.grid
+        self.path = []
+        self.current_cell = self.runner.start_cell
+        self.goal_cell = self.runner.goal_cell
+        self.goal_x, self.goal_y = self.grid.get_coordinates(self.goal_cell)
+
+    def start(self):
+        """ Starts the solver."""
+        grid = self.grid
+        path, expanded = grid.get_junction_graph().find_path(self.current_cell, self.goal_cell,
+                                                               self.get_heuristic())
+        for cell in expanded:
+            grid.set_flag(cell, VISITED)
+        if path is None:
+            print("Path not found")
+            self.runner.running = False
+            self.runner.update_display()
+            return
+        self.construct_path(path)
+
+    def recommence(self):
+        """ The search runs to completion when started, so there is nothing to recommence. """
+        pass
+
+    def construct_path(self, path):
+        """ Marks the solution path, which has been expanded from the route through the junction graph. """
+        grid = self.grid
+        for cell in path:
+            grid.set_flag(cell, SOLUTION)
+        self.path = path
+        print([grid.get_coordinates(cell) for cell in path])
+        self.runner.solved = True
+        self.runner.running = False
+        self.runner.update_display(path)
+
+    def get_heuristic(self):
+        """ Returns the function estimating the steps from a cell to the goal, or None for Dijkstra's algorithm. """
+        return None
+
+
+class JunctionAStarSolver(JunctionGraphSolver):
+    """ Solver which implements an A* search of the junction graph. Each corridor is at least as long as the manhattan
+    distance between its ends, so the manhattan distance to the goal remains admissible and consistent and the
+    solution is optimal. """
+
+    def get_heuristic(self):
+        """ Returns the manhattan distance from a cell to the goal. """
+        columns = self.grid.columns
+        goal_x = self.goal_x
+        goal_y = self.goal_y
+
+        def heuristic(cell):
+            y, x = divmod(cell, columns)
+            return abs(goal_x - x) + abs(goal_y - y)
+        return heuristic
@@ -0,0 +1,100 @@
+from heapq import heappush, heappop
+from operator import attrgetter
+
+from mazerunner.solvers.SampleRoadmap import SampleRoadmap
+from mazerunner.utils.IndexedHeap import IndexedHeap
+
+
+class LazyRoadmap(SampleRoadmap):
+    """ Sample roadmap which defers collision tests until they are needed, as in Lazy PRM. Every pair of nodes within
+    max_distance of each other is connected without being tested, then Dijkstra's algorithm searches the untested
+    graph. Each candidate path is only tested at its first untested edge, which is the edge from the node at the front
+    of the queue to its parent, since every edge before it was tested when its own node was settled. A node is settled
+    once its edge is found to be clear, and as no other node in the queue is closer the path to it is the shortest.
+
+    An edge which crosses a wall is blocked and the search is repaired rather than restarted. Each node keeps a heap of
+    the distances it can be reached with through its settled neighbours, so only the node at the end of the removed
+    edge is queued again, through the next closest of those neighbours, and the search carries on with the rest of the
+    queue as it was. Edges which are never at the end of a candidate path are never tested. """
+
+    def __init__(self, grid, cell_dimension, max_distance):
+        SampleRoadmap.__init__(self, grid, cell_dimension, max_distance)
+        self.nodes = []
+        self.adjacency_list = []
+        # Heap of (distance, parent id) candidates for each node, through the settled nodes next to it
+        self.candidates = []
+        # Edges which cross a wall, as (node id, parent id)
+        self.blocked_edges = set()
+        self.queue = IndexedHeap()
+        # Ids of the nodes whose distance is final
+        self.settled = set()
+        self.collision_checks = 0
+
+    def construct_adjacency_list(self, nodes):
+        """ Returns a list, indexed by node id, of the nodes within max_distance of each node in order of id. None of
+        the edges are tested for collisions. """
+        adjacency_list = [[] for _ in range(len(nodes))]
+        for node, other_node in self.get_candidate_pairs(nodes):
+            adjacency_list[node.id].append(other_node)
+            adjacency_list[other_node.id].append(node)
+        for neighbours in adjacency_list:
+            neighbours.sort(key=attrgetter('id'))
+        self.nodes = nodes
+        self.adjacency_list = adjacency_list
+        self.candidates = [[] for _ in range(len(nodes))]
+        return adjacency_list
+
+    def find_path(self, start_node, goal_node):
+        """ Returns the shortest path of collision free edges from start_node to goal_node as a list of nodes, or None
+        if there is no such path. The distance and parent of each node reached are left set, as by dijkstras_search. """
+        queue = self.queue
+        settled = self.settled
+        adjacency_list = self.adjacency_list
+        candidates = self.candidates
+        start_node.distance = 0
+        queue.put(start_node, 0)
+        while not queue.empty():
+            node = queue.get()
+            if node.parent is not None:
+                self.collision_checks += 1
+                if self.has_path_collision(node.parent, node):
+                    self.block_edge(node)
+                    continue
+            settled.add(node.id)
+            if node is goal_node:
+                return get_path(goal_node)
+            for other_node in adjacency_list[node.id]:
+                if other_node.id not in settled:
+                    distance = node.distance + node.distance_to(other_node)
+                    heappush(candidates[other_node.id], (distance, node.id))
+                    if distance < other_node.distance:
+                        other_node.distance = distance
+                        other_node.parent = node
+                        queue.put(other_node, distance)
+        return None
+
+    def block_edge(self, node):
+        """ Blocks the edge between a node and the settled node it was reached from, then queues the node again through
+        the closest of its other settled neighbours, if it has any. """
+        blocked_edges = self.blocked_edges
+        blocked_edges.add((node.id, node.parent.id))
+        candidates = self.candidates[node.id]
+        while candidates and (node.id, candidates[0][1]) in blocked_edges:
+            heappop(candidates)
+        if candidates:
+            node.distance, parent_id = candidates[0]
+            node.parent = self.nodes[parent_id]
+            self.queue.put(node, node.distance)
+        else:
+            node.distance = float("inf")
+            node.parent = None
+
+
+def get_path(node):
+    """ Returns the path from the root of the shortest path tree to node as a list of nodes. """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = node.parent
+    path.reverse()
+    return path
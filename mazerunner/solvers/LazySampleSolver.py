@@ -0,0 +1,22 @@
+from mazerunner.solvers.LazyRoadmap import LazyRoadmap
+from mazerunner.solvers.RandomSampleSolver import RandomSampleSolver
+
+
+class LazySampleSolver(RandomSampleSolver):
+    """ Random sample solver which builds its graph lazily. Nodes within range of each other are connected without
+    checking for walls, and only the edges on the shortest path found are checked. Edges which cross a wall are removed
+    and the search is repaired until a path clear of walls is found, so most edges are never checked at all. """
+
+    def __init__(self, runner):
+        RandomSampleSolver.__init__(self, runner)
+        self.roadmap = None
+
+    def construct_adjacency_list(self):
+        """ Connects every pair of sample points in range of each other without checking for collisions. """
+        self.roadmap = LazyRoadmap(self.grid, self.runner.display.cell_dimension, self.max_distance)
+        self.adjacency_list = self.roadmap.construct_adjacency_list(self.nodes)
+
+    def dijkstras_search(self):
+        """ Finds the shortest path clear of walls, checking only the edges of candidate paths. """
+        self.roadmap.find_path(self.start_node, self.goal_node)
+        self.construct_path()
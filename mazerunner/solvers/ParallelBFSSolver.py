@@ -0,0 +1,203 @@
+""" Breadth first search which splits the maze into horizontal strips searched by a pool of worker processes.
+
+The distances of every cell are held in shared memory along with the wall bitmaps. Each strip is a range of whole rows
+owned by a single task, which is the only one to write the distances of its cells. The search runs in rounds. In each
+round, every strip which has been sent cells spreads them through its own cells in order of distance, as a breadth
+first search seeded at several distances, and collects the cells of other strips it reaches. Those are sent to their
+strips in the next round, and the search ends once a round sends nothing. A cell reached again at a shorter distance is
+spread again, so the distances converge to those of a breadth first search. In a perfect maze each cell can only be
+reached one way and is never spread twice.
+
+Exchanging cells once per round, rather than once per level, keeps the number of exchanges to the number of times the
+paths cross between strips, as the levels of a maze number in the hundreds of thousands.
+
+BFSSolver follows the first open neighbour, in the order above, right, below and left, of each cell it expands, so its
+path is the shortest path whose sequence of directions comes first in that order. The same path is found by searching
+from the goal and walking from the start to the first neighbour one step closer to the goal each time.
+"""
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import heapify, heappop
+from multiprocessing.shared_memory import SharedMemory
+
+from mazerunner.MazeGrid import VISITED, SOLUTION, CHANGED, get_bitmap_length
+
+# Value of a distance for cells which have not been reached
+UNREACHED = -1
+
+# Distances and wall bitmaps of the maze searched by this process, set by initialise_worker
+shared_memory = None
+shared_distances = None
+shared_bottom = None
+shared_right = None
+maze_columns = None
+maze_size = None
+
+
+class ParallelBFSSolver:
+    """ Solver which finds the distance of every cell from the goal across worker processes, then walks from the start
+    to the goal. The solution is optimal and is the same path as BFSSolver finds. The search is not animated, the cells
+    no further from the goal than the start are shown at once along with the path. """
+
+    def __init__(self, runner, workers=1):
+        self.runner = runner
+        self.grid = runner.grid
+        self.workers = workers
+        self.path = []
+        self.current_cell = self.runner.start_cell
+        self.goal_cell = self.runner.goal_cell
+
+    def start(self):
+        """ Starts the solver."""
+        grid = self.grid
+        distances = get_parallel_distances(grid, self.goal_cell, self.workers)
+        if distances[self.current_cell] < 0:
+            print("Path not found")
+            self.runner.running = False
+            return
+        flags = grid.flags
+        limit = distances[self.current_cell]
+        for index, distance in enumerate(distances):
+            if 0 <= distance <= limit:
+                flags[index] |= VISITED | CHANGED
+        self.construct_path(distances)
+
+    def recommence(self):
+        """ The search runs to completion when started, so there is nothing to recommence. """
+        pass
+
+    def construct_path(self, distances):
+        """ Constructs the solution path by walking from the start to the first open neighbour which is one step closer
+        to the goal, until the goal is reached. """
+        grid = self.grid
+        cell = self.current_cell
+        path = [cell]
+        distance = distances[cell]
+        while distance > 0:
+            distance -= 1
+            for neighbour in grid.compute_neighbours(cell):
+                if distances[neighbour] == distance:
+                    cell = neighbour
+                    break
+            path.append(cell)
+        for cell in path:
+            grid.set_flag(cell, SOLUTION)
+        self.path = path
+        print([grid.get_coordinates(cell) for cell in path])
+        self.runner.solved = True
+        self.runner.running = False
+        self.runner.update_display(path)
+
+
+def get_parallel_distances(grid, start, workers=1):
+    """ Returns an array holding the number of steps from start to each cell, or -1 for cells which cannot be reached,
+    searched in one strip per worker. If workers is 1 the maze is searched as a single strip in this process. """
+    columns = grid.columns
+    size = grid.size
+    strip_size = -(-grid.rows // workers) * columns
+    if workers == 1:
+        distances = array('i', [UNREACHED]) * size
+        initialise_arrays(memoryview(distances), grid.bottom, grid.right, columns, size)
+        search_rounds(start, strip_size, size, map)
+        return distances
+
+    length = get_bitmap_length(size)
+    memory = SharedMemory(create=True, size=4 * size + 2 * length)
+    try:
+        memory.buf[:4 * size] = b'\xff' * (4 * size)
+        memory.buf[4 * size:4 * size + length] = grid.bottom
+        memory.buf[4 * size + length:4 * size + 2 * length] = grid.right
+        with ProcessPoolExecutor(workers, initializer=initialise_worker,
+                                 initargs=(memory.name, columns, size)) as executor:
+            search_rounds(start, strip_size, size, executor.map)
+        distances = array('i')
+        distances.frombytes(memory.buf[:4 * size])
+    finally:
+        memory.close()
+        memory.unlink()
+    return distances
+
+
+def search_rounds(start, strip_size, size, map_function):
+    """ Runs rounds of the search from start, with strips of strip_size cells, until no strip is sent any cells. Each
+    round calls map_function with spread_strip and the arguments of each strip which has been sent cells. """
+    sent = {start // strip_size: [(0, start)]}
+    while sent:
+        strips = sorted(sent)
+        results = map_function(spread_strip, [strip * strip_size for strip in strips],
+                               [min(size, (strip + 1) * strip_size) for strip in strips],
+                               [sent[strip] for strip in strips])
+        sent = {}
+        for reached in results:
+            for distance, cell in reached:
+                sent.setdefault(cell // strip_size, []).append((distance, cell))
+
+
+def initialise_worker(name, columns, size):
+    """ Attaches this process to the shared memory holding the distances and wall bitmaps. """
+    global shared_memory
+    shared_memory = SharedMemory(name)
+    length = get_bitmap_length(size)
+    buffer = shared_memory.buf
+    initialise_arrays(buffer[:4 * size].cast('i'), buffer[4 * size:4 * size + length],
+                      buffer[4 * size + length:4 * size + 2 * length], columns, size)
+
+
+def initialise_arrays(distances, bottom, right, columns, size):
+    """ Sets the distances and wall bitmaps of the maze searched by spread_strip. """
+    global shared_distances, shared_bottom, shared_right, maze_columns, maze_size
+    shared_distances = distances
+    shared_bottom = bottom
+    shared_right = right
+    maze_columns = columns
+    maze_size = size
+
+
+def spread_strip(first, end, cells):
+    """ Spreads the cells sent to the strip of cells from first up to end, a list of (distance, cell) pairs, through
+    the strip in order of distance. Returns a list of (distance, cell) pairs of the cells of other strips which were
+    reached at a shorter distance than they have, with the shortest distance each was reached at. """
+    distances = shared_distances
+    bottom = shared_bottom
+    right = shared_right
+    columns = maze_columns
+    size = maze_size
+    heapify(cells)
+    queue = deque()
+    reached = {}
+    while cells or queue:
+        if queue and (not cells or distances[queue[0]] <= cells[0][0]):
+            cell = queue.popleft()
+            distance = distances[cell]
+        else:
+            distance, cell = heappop(cells)
+            current = distances[cell]
+            if 0 <= current <= distance:
+                continue
+            distances[cell] = distance
+        distance += 1
+        # Same order as MazeGrid.compute_neighbours: above, right, below, left
+        x = cell % columns
+        neighbours = []
+        above = cell - columns
+        if above >= 0 and not bottom[above >> 3] >> (above & 7) & 1:
+            neighbours.append(above)
+        if x < columns - 1 and not right[cell >> 3] >> (cell & 7) & 1:
+            neighbours.append(cell + 1)
+        if cell + columns < size and not bottom[cell >> 3] >> (cell & 7) & 1:
+            neighbours.append(cell + columns)
+        if x > 0 and not right[(cell - 1) >> 3] >> ((cell - 1) & 7) & 1:
+            neighbours.append(cell - 1)
+        for neighbour in neighbours:
+            current = distances[neighbour]
+            if 0 <= current <= distance:
+                continue
+            if first <= neighbour < end:
+                distances[neighbour] = distance
+                queue.append(neighbour)
+            elif reached.get(neighbour, distance + 1) > distance:
+                # The distances of other strips may be changing, but only ever fall, so one already no further is
+                # never sent
+                reached[neighbour] = distance
+    return [(distance, cell) for cell, distance in reached.items()]
@@ -1,11 +1,11 @@
-from math import floor
-from random import randint
-
 from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtGui import QPainterPath
 
 import mazerunner.utils.Config as Config
 from mazerunner.solvers.SampleGraphNode import SampleGraphNode
-from mazerunner.utils.PriorityQueue import PriorityQueue
+from mazerunner.solvers.SampleRoadmap import SampleRoadmap
+from mazerunner.solvers.SampleSequences import sample_points
+from mazerunner.utils.IndexedHeap import IndexedHeap
 
 
 class RandomSampleSolver:
@@ -14,18 +14,21 @@ class RandomSampleSolver:
 
     def __init__(self, runner):
         self.runner = runner
+        self.grid = runner.grid
         self.max_nodes = Config.SAMPLE_MAX_NODES
         self.max_distance = Config.SAMPLE_MAX_DISTANCE
         # Current and goal cells, the cells assigned here are discarded once search is commenced
         self.id_counter = 0
 
+        start_x, start_y = self.grid.get_coordinates(self.runner.start_cell)
+        goal_x, goal_y = self.grid.get_coordinates(self.runner.goal_cell)
         self.start_node = self.create_node(
-            (self.runner.start_cell.x + 0.5) * self.runner.display.cell_dimension,
-            (self.runner.start_cell.y + 0.5) * self.runner.display.cell_dimension)
+            (start_x + 0.5) * self.runner.display.cell_dimension,
+            (start_y + 0.5) * self.runner.display.cell_dimension)
         self.current_node = self.start_node
         self.goal_node = self.create_node(
-            (self.runner.goal_cell.x + 0.5) * self.runner.display.cell_dimension,
-            (self.runner.goal_cell.y + 0.5) * self.runner.display.cell_dimension)
+            (goal_x + 0.5) * self.runner.display.cell_dimension,
+            (goal_y + 0.5) * self.runner.display.cell_dimension)
         self.line_items = []
         self.ellipse_size = 6
         self.ellipse_items = []
@@ -39,7 +42,7 @@ class RandomSampleSolver:
                                            Config.CELL_QUEUE_BRUSH))
         self.nodes = []
         self.adjacency_list = []
-        self.queue = PriorityQueue()
+        self.queue = IndexedHeap()
 
     def create_node(self, x, y):
         """ Creates a new sample node. """
@@ -67,114 +70,44 @@ class RandomSampleSolver:
             self.dijkstras_search()
 
     def sample(self):
-        """ Creates the sample points from which a path will be constructed. """
+        """ Creates the sample points from which a path will be constructed. The points are generated together and drawn
+        as a single item, so the scene is only updated once. """
+        if self.runner.paused:
+            return
         cell_dimension = self.runner.display.cell_dimension
-        while len(self.nodes) < self.max_nodes:
-            if self.runner.paused:
-                break
-            x = randint(0, self.runner.display.columns * cell_dimension)
-            y = randint(0, self.runner.display.rows * cell_dimension)
-            if cell_dimension - (x % cell_dimension) > self.ellipse_size and \
-                    x % cell_dimension > self.ellipse_size and \
-                    cell_dimension - (y % cell_dimension) > self.ellipse_size and \
-                    y % cell_dimension > self.ellipse_size:
-                self.nodes.append(self.create_node(x, y))
-                self.ellipse_items.append(
-                    self.runner.display.addEllipse(x, y, self.ellipse_size, self.ellipse_size,
-                                                   Config.CELL_QUEUE_PEN,
-                                                   Config.CELL_QUEUE_BRUSH))
-                if self.runner.display.render_progress:
-                    self.runner.display.update()
-                QCoreApplication.processEvents()
+        xs, ys = sample_points(self.max_nodes - len(self.nodes), self.grid.columns * cell_dimension,
+                               self.grid.rows * cell_dimension, cell_dimension, self.ellipse_size,
+                               Config.SAMPLE_SEQUENCE)
+        path = QPainterPath()
+        for x, y in zip(xs, ys):
+            self.nodes.append(self.create_node(x, y))
+            path.addEllipse(x, y, self.ellipse_size, self.ellipse_size)
+        self.ellipse_items.append(self.runner.display.addPath(path, Config.CELL_QUEUE_PEN, Config.CELL_QUEUE_BRUSH))
+        if self.runner.display.render_progress:
+            self.runner.display.update()
+        QCoreApplication.processEvents()
 
     def construct_adjacency_list(self):
         """ Constructs an adjacency list from the sample points. """
-        for _ in range(len(self.nodes)):
-            self.adjacency_list.append([])
-        for node in self.nodes:
-            for other_node in self.nodes:
-                if node is not other_node and node.distance_to(other_node) <= self.max_distance:
-                    if not self.has_path_collision(node, other_node):
-                        self.adjacency_list[node.id] += [other_node]
-
-    def has_path_collision(self, node, other_node):
-        """ Returns true if a straight line path connecting node and other_node intersects with a cell wall. """
-        cells_to_check = self.get_cells_to_check(node, other_node)
-        for cell in cells_to_check:
-            if cell.walls['bottom']:
-                if self.check_bottom_intersect(node, other_node, cell):
-                    return True
-            if cell.walls['right']:
-                if self.check_right_wall(node, other_node, cell):
-                    return True
-            if cell.y > 0:
-                cell_above = self.runner.cells[self.runner.get_cell_index(cell.x, cell.y - 1)]
-                if cell_above.walls['bottom']:
-                    if self.check_bottom_intersect(node, other_node, cell_above):
-                        return True
-            if cell.x > 0:
-                cell_to_left = self.runner.cells[self.runner.get_cell_index(cell.x - 1, cell.y)]
-                if cell_to_left.walls['right']:
-                    if self.check_right_wall(node, other_node, cell_to_left):
-                        return True
-        return False
-
-    def check_bottom_intersect(self, node, other_node, cell):
-        """ Generates the positions defining the location of the cell's bottom wall and returns true if the path between
-            two nodes intersects it. """
-        cell_dimension = self.runner.display.cell_dimension
-        wall_x1 = cell.x * cell_dimension
-        wall_x2 = (cell.x + 1) * cell_dimension
-        wall_y1 = (cell.y + 1) * cell_dimension
-        wall_y2 = (cell.y + 1) * cell_dimension
-
-        return intersect((node.x, node.y), (other_node.x, other_node.y), (wall_x1, wall_y1), (wall_x2, wall_y2))
-
-    def check_right_wall(self, node, other_node, cell):
-        """ Generates the positions defining the location of the cell's right wall and returns true if the path between
-            two nodes intersects it. """
-        cell_dimension = self.runner.display.cell_dimension
-        wall_x1 = (cell.x + 1) * cell_dimension
-        wall_x2 = (cell.x + 1) * cell_dimension
-        wall_y1 = cell.y * cell_dimension
-        wall_y2 = (cell.y + 1) * cell_dimension
-        return intersect((node.x, node.y), (other_node.x, other_node.y), (wall_x1, wall_y1), (wall_x2, wall_y2))
-
-    def get_cells_to_check(self, node, other_node):
-        """ Returns a list of cells to check for collisions.
-
-        Consider a path from cell (0,0) to (2, 3), the list of cells returned will those in the range (0-2, 0-3). The
-        same list of cells would also be returned for a path from (2, 3) to (0, 0)"""
-        cell_dimension = self.runner.display.cell_dimension
-        path_x1 = int(floor(node.x / cell_dimension))
-        path_y1 = int(floor(node.y / cell_dimension))
-        path_x2 = int(floor(other_node.x / cell_dimension))
-        path_y2 = int(floor(other_node.y / cell_dimension))
-        x_range = path_x2 - path_x1
-        y_range = path_y2 - path_y1
-        start_x = path_x1 if x_range >= 0 else path_x2
-        start_y = path_y1 if y_range >= 0 else path_y2
-
-        cells = []
-        for x_offset in range(abs(x_range) + 1):
-            for y_offset in range(abs(y_range) + 1):
-                cells.append(self.runner.cells[self.runner.get_cell_index(start_x + x_offset, start_y + y_offset)])
-        return cells
+        roadmap = SampleRoadmap(self.grid, self.runner.display.cell_dimension, self.max_distance,
+                                Config.SAMPLE_BATCH_SIZE, Config.SAMPLE_WORKERS)
+        self.adjacency_list = roadmap.construct_adjacency_list(self.nodes)
 
     def dijkstras_search(self):
-        """ Performs dijkstra's algorithm on the graph to find an optimal path. """
-        self.queue.put(self.current_node)
+        """ Performs dijkstra's algorithm on the graph to find an optimal path. Nodes are keyed by themselves in the
+        queue, so a node which is reached by a shorter path has its priority decreased in place. """
+        self.current_node.distance = 0
+        self.queue.put(self.current_node, 0)
         while not self.queue.empty():
             self.current_node = self.queue.get()
-            self.current_node.distance = 0
+            if self.current_node is self.goal_node:
+                break
             for node in self.adjacency_list[self.current_node.id]:
                 distance = self.current_node.distance + self.current_node.distance_to(node)
                 if distance < node.distance:
                     node.distance = distance
                     node.parent = self.current_node
-                    if self.queue.contains(node):
-                        self.queue.delete(node)
-                    self.queue.put(node)
+                    self.queue.put(node, distance)
         self.construct_path()
 
     def recommence(self):
@@ -212,15 +145,3 @@ class RandomSampleSolver:
         for line in self.line_items:
             self.runner.display.removeItem(line)
         del self.line_items[:]
-
-
-def intersect(a1, a2, b1, b2):
-    """ Returns true if the two line segments with end-points a1, a2 and b1, b2 instersect. Each end-point is a tuple
-    (int, int) representing the (x, y) coordinates of the point. This is an implementation of a post by Bryce Boe
-    available here https://bryceboe.com/2006/10/23/line-segment-intersection-algorithm/ """
-    return ccw(a1, b1, b2) != ccw(a2, b1, b2) and ccw(a1, a2, b1) != ccw(a1, a2, b2)
-
-
-def ccw(a, b, c):
-    """ Returns true if points a, b and c are in counterclockwise order. """
-    return (c[1] - a[1]) * (b[0] - a[0]) > (b[1] - a[1]) * (c[0] - a[0])
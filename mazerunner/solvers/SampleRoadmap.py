@@ -0,0 +1,274 @@
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+from operator import attrgetter
+
+from mazerunner.MazeGrid import MazeGrid
+from mazerunner.utils.SpatialHash import SpatialHash, FORWARD_NEIGHBOURS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class SampleRoadmap:
+    """ Graph whose nodes are sample points in a maze, given in scene coordinates. There is an edge between every two
+    nodes which are no more than max_distance apart and can be connected by a straight line which does not cross a
+    wall. Candidate pairs are found with a spatial hash whose buckets are max_distance wide, so only nodes in the same
+    or adjacent buckets are compared and each pair of nodes is tested once.
+
+    If numpy is available and a batch size is given, the candidate pairs are found and tested for collisions as arrays,
+    batch_size pairs at a time, which bounds the memory used by the collision tests.
+
+    If more than one worker is given, the nodes are split into ranges which are connected in a pool of processes. Each
+    worker receives the walls and the node positions once, when it starts, and returns the edges from the nodes in its
+    ranges to nodes with higher ids.
+
+    Every mode tests each pair from the node with the lower id to the node with the higher id, and the scalar and
+    batched collision tests treat lines through the corners of cells alike, so every mode returns the same adjacency
+    list, with each node's neighbours in order of id. RoadmapBenchmark checks this on points from sample_points. """
+
+    def __init__(self, grid, cell_dimension, max_distance, batch_size=0, workers=1):
+        self.grid = grid
+        self.cell_dimension = cell_dimension
+        self.max_distance = max_distance
+        self.batch_size = batch_size if numpy is not None else 0
+        self.workers = workers
+
+    def construct_adjacency_list(self, nodes):
+        """ Returns a list, indexed by node id, of the nodes connected to each node. """
+        if self.workers > 1 and len(nodes) > 1:
+            return self.construct_adjacency_list_parallel(nodes)
+        if self.batch_size:
+            return self.construct_adjacency_list_batch(nodes)
+        adjacency_list = [[] for _ in range(len(nodes))]
+        for node, other_node in self.get_candidate_pairs(nodes):
+            if not self.has_path_collision(node, other_node):
+                adjacency_list[node.id].append(other_node)
+                adjacency_list[other_node.id].append(node)
+        for neighbours in adjacency_list:
+            neighbours.sort(key=attrgetter('id'))
+        return adjacency_list
+
+    def get_candidate_pairs(self, nodes):
+        """ Yields each unordered pair of nodes which are within max_distance of each other once, with the lower id
+        first as in the other modes, so every pair is tested in the same direction. """
+        spatial_hash = SpatialHash(self.max_distance)
+        for node in nodes:
+            spatial_hash.insert(node, node.x, node.y)
+        for node, other_node in spatial_hash.get_pairs():
+            if node.distance_to(other_node) <= self.max_distance:
+                if other_node.id < node.id:
+                    node, other_node = other_node, node
+                yield node, other_node
+
+    def has_path_collision(self, node, other_node):
+        """ Returns true if a straight line path connecting node and other_node intersects with a cell wall. """
+        cell_dimension = self.cell_dimension
+        return not self.grid.line_of_sight(node.x / cell_dimension, node.y / cell_dimension,
+                                           other_node.x / cell_dimension, other_node.y / cell_dimension)
+
+    def construct_adjacency_list_batch(self, nodes):
+        """ Returns a list, indexed by node id, of the nodes connected to each node. The candidate pairs are tested
+        against the walls in batches and the resulting edge mask is turned into the adjacency list in one pass. The
+        nodes must be ordered by id. """
+        cell_dimension = self.cell_dimension
+        xs = numpy.array([node.x for node in nodes], dtype=float) / cell_dimension
+        ys = numpy.array([node.y for node in nodes], dtype=float) / cell_dimension
+        first, second = find_candidate_pairs(xs, ys, self.max_distance / cell_dimension)
+        bottom_walls, right_walls = unpack_walls(self.grid)
+
+        connected = numpy.empty(len(first), dtype=bool)
+        for start in range(0, len(first), self.batch_size):
+            end = start + self.batch_size
+            a, b = first[start:end], second[start:end]
+            connected[start:end] = ~find_collisions(bottom_walls, right_walls, xs[a], ys[a], xs[b], ys[b])
+        return create_adjacency_list(nodes, first[connected], second[connected])
+
+    def construct_adjacency_list_parallel(self, nodes):
+        """ Returns a list, indexed by node id, of the nodes connected to each node. The nodes are split into a few
+        ranges per worker so that a worker which is given a dense part of the maze does not hold up the others. The
+        nodes must be ordered by id. """
+        grid = self.grid
+        range_size = -(-len(nodes) // (self.workers * RANGES_PER_WORKER))
+        starts = range(0, len(nodes), range_size)
+        ends = [min(start + range_size, len(nodes)) for start in starts]
+
+        arguments = (grid.columns, grid.rows, bytes(grid.bottom), bytes(grid.right), [node.x for node in nodes],
+                     [node.y for node in nodes], self.cell_dimension, self.max_distance, self.batch_size)
+        with ProcessPoolExecutor(self.workers, initializer=initialise_worker, initargs=arguments) as executor:
+            results = list(executor.map(connect_node_range, starts, ends))
+
+        adjacency_list = [[] for _ in range(len(nodes))]
+        # Each edge appears once, from its lower id, so appending them in order of the lower then the higher id leaves
+        # every list sorted by id
+        for edges in results:
+            for node_id, other_id in edges:
+                adjacency_list[other_id].append(nodes[node_id])
+        for edges in results:
+            for node_id, other_id in edges:
+                adjacency_list[node_id].append(nodes[other_id])
+        return adjacency_list
+
+
+# Number of node ranges handed out to each worker when the roadmap is built in parallel
+RANGES_PER_WORKER = 4
+
+# State of a worker process, set up by initialise_worker when the process starts
+worker_state = {}
+
+
+def initialise_worker(columns, rows, bottom, right, xs, ys, cell_dimension, max_distance, batch_size):
+    """ Stores the maze walls and node positions, in scene coordinates, in the worker process and prepares the candidate
+    pairs for connect_node_range in the same way as the serial build. """
+    grid = MazeGrid(columns, rows, bitmaps=(bytearray(bottom), bytearray(right)), search=False)
+    worker_state.update(grid=grid, xs=xs, ys=ys, cell_dimension=cell_dimension, max_distance=max_distance,
+                        batch_size=batch_size)
+    if batch_size:
+        x_array = numpy.array(xs, dtype=float) / cell_dimension
+        y_array = numpy.array(ys, dtype=float) / cell_dimension
+        first, second = find_candidate_pairs(x_array, y_array, max_distance / cell_dimension)
+        order = numpy.lexsort((second, first))
+        worker_state.update(x_array=x_array, y_array=y_array, first=first[order], second=second[order],
+                            walls=unpack_walls(grid))
+    else:
+        spatial_hash = SpatialHash(max_distance)
+        for node_id in range(len(xs)):
+            spatial_hash.insert(node_id, xs[node_id], ys[node_id])
+        worker_state.update(spatial_hash=spatial_hash)
+
+
+def connect_node_range(start, end):
+    """ Returns a list of the edges, as (id, id) pairs in order, from each node with an id in [start, end) to the nodes
+    with higher ids which it can be connected to. Runs in a worker process set up by initialise_worker. """
+    if worker_state['batch_size']:
+        return connect_node_range_batch(start, end)
+    grid = worker_state['grid']
+    xs = worker_state['xs']
+    ys = worker_state['ys']
+    cell_dimension = worker_state['cell_dimension']
+    max_distance = worker_state['max_distance']
+    spatial_hash = worker_state['spatial_hash']
+    edges = []
+    for node_id in range(start, end):
+        x = xs[node_id]
+        y = ys[node_id]
+        for other_id in sorted(spatial_hash.get_nearby(x, y)):
+            if other_id > node_id and sqrt((x - xs[other_id]) ** 2 + (y - ys[other_id]) ** 2) <= max_distance \
+                    and grid.line_of_sight(x / cell_dimension, y / cell_dimension, xs[other_id] / cell_dimension,
+                                           ys[other_id] / cell_dimension):
+                edges.append((node_id, other_id))
+    return edges
+
+
+def connect_node_range_batch(start, end):
+    """ Returns the same edges as connect_node_range, testing the candidate pairs of the range in batches. """
+    xs = worker_state['x_array']
+    ys = worker_state['y_array']
+    first = worker_state['first']
+    second = worker_state['second']
+    bottom_walls, right_walls = worker_state['walls']
+    batch_size = worker_state['batch_size']
+    low, high = numpy.searchsorted(first, [start, end])
+    firsts = []
+    seconds = []
+    for batch_start in range(low, high, batch_size):
+        batch_end = min(batch_start + batch_size, high)
+        a, b = first[batch_start:batch_end], second[batch_start:batch_end]
+        connected = ~find_collisions(bottom_walls, right_walls, xs[a], ys[a], xs[b], ys[b])
+        firsts.extend(a[connected].tolist())
+        seconds.extend(b[connected].tolist())
+    return list(zip(firsts, seconds))
+
+
+def find_candidate_pairs(xs, ys, max_distance):
+    """ Returns two arrays holding the indices of each unordered pair of points which are no more than max_distance
+    apart, with the lower index first. The points are sorted into buckets max_distance wide, then each bucket is paired
+    with itself and the four neighbours in FORWARD_NEIGHBOURS, as in SpatialHash.get_pairs. """
+    count = len(xs)
+    bucket_x = numpy.floor(xs / max_distance).astype(numpy.int64)
+    bucket_y = numpy.floor(ys / max_distance).astype(numpy.int64)
+    # Leave a column of empty buckets on either side so that neighbouring keys never wrap onto another row
+    width = bucket_x.max() + 3 if count else 1
+    keys = (bucket_y + 1) * width + bucket_x + 1
+    order = numpy.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    positions = numpy.arange(count)
+
+    firsts = []
+    seconds = []
+    for dx, dy in [(0, 0)] + FORWARD_NEIGHBOURS:
+        target_keys = sorted_keys + dy * width + dx
+        ends = numpy.searchsorted(sorted_keys, target_keys, side='right')
+        if dx == 0 and dy == 0:
+            # Within a bucket, pair each point with the points after it
+            starts = positions + 1
+        else:
+            starts = numpy.searchsorted(sorted_keys, target_keys, side='left')
+        counts = ends - starts
+        sources = numpy.repeat(positions, counts)
+        offsets = numpy.arange(counts.sum()) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+        targets = numpy.repeat(starts, counts) + offsets
+        a = order[sources]
+        b = order[targets]
+        close = (xs[a] - xs[b]) ** 2 + (ys[a] - ys[b]) ** 2 <= max_distance ** 2
+        firsts.append(a[close])
+        seconds.append(b[close])
+    first = numpy.concatenate(firsts)
+    second = numpy.concatenate(seconds)
+    return numpy.minimum(first, second), numpy.maximum(first, second)
+
+
+def unpack_walls(grid):
+    """ Returns the bottom and right walls of the grid as boolean arrays of shape (rows, columns). """
+    walls = []
+    for bitmap in (grid.bottom, grid.right):
+        bits = numpy.unpackbits(numpy.frombuffer(bitmap, dtype=numpy.uint8), bitorder='little')
+        walls.append(bits[:grid.size].reshape(grid.rows, grid.columns).astype(bool))
+    return walls
+
+
+def find_collisions(bottom_walls, right_walls, x1, y1, x2, y2):
+    """ Returns a boolean array which is true for each segment from (x1, y1) to (x2, y2), in cell units, which crosses
+    a wall. """
+    # Vertical cell edges are right walls indexed by [row, column], horizontal edges are bottom walls which are indexed
+    # by [column, row] once transposed, so the same test applies to both with x and y swapped.
+    return crosses_walls(x1, y1, x2, y2, right_walls) | crosses_walls(y1, x1, y2, x2, bottom_walls.T)
+
+
+def crosses_walls(a1, b1, a2, b2, walls):
+    """ Returns a boolean array which is true for each segment that crosses a wall on one of the lines a = k for
+    integer k. The wall on line a = k at b is walls[floor(b), k - 1]. This follows MazeGrid.crosses_walls step for
+    step, so each segment is found to cross the same walls in either direction and by either build. """
+    limit_b, limit_a = walls.shape
+    swap = a2 < a1
+    a1, b1, a2, b2 = numpy.where(swap, a2, a1), numpy.where(swap, b2, b1), numpy.where(swap, a1, a2), \
+        numpy.where(swap, b1, b2)
+    low = numpy.floor(a1).astype(numpy.int64)
+    crossings = numpy.floor(a2).astype(numpy.int64) - low
+    rise = b2 - b1
+    run = numpy.where(crossings == 0, 1, a2 - a1)
+    collides = numpy.zeros(len(a1), dtype=bool)
+    for step in range(int(crossings.max()) if len(a1) else 0):
+        line = low + step + 1
+        crossing = step < crossings
+        b = b1 + (line - a1) * rise / run
+        cell = numpy.floor(b)
+        column = numpy.minimum(line, limit_a) - 1
+        cell_index = cell.astype(numpy.int64)
+        wall = walls[numpy.clip(cell_index, 0, limit_b - 1), column]
+        # A segment through the end of two walls, at a whole b, is checked against both
+        wall |= (b == cell) & walls[numpy.clip(cell_index - 1, 0, limit_b - 1), column]
+        collides |= crossing & wall
+    return collides
+
+
+def create_adjacency_list(nodes, first, second):
+    """ Returns a list, indexed by node id, of the nodes connected to each node by the edges between first[i] and
+    second[i]. """
+    sources = numpy.concatenate([first, second])
+    targets = numpy.concatenate([second, first])
+    order = numpy.lexsort((targets, sources))
+    bounds = numpy.searchsorted(sources[order], numpy.arange(len(nodes) + 1)).tolist()
+    targets = targets[order].tolist()
+    return [[nodes[target] for target in targets[bounds[i]:bounds[i + 1]]] for i in range(len(nodes))]
@@ -0,0 +1,108 @@
+""" Generates the sample points for the random sample solvers. Points are drawn in batches as arrays, either uniformly
+at random or from a low-discrepancy sequence, and those too close to the edge of a cell are rejected together. """
+from random import randint
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SEQUENCES = ['random', 'halton', 'sobol']
+
+# Number of bits in the Sobol sequence, which gives 2 ** SOBOL_BITS points before it repeats
+SOBOL_BITS = 30
+
+
+def sample_points(count, width, height, cell_dimension, margin, sequence='random', seed=None):
+    """ Returns two lists holding the x and y coordinates of count points in the rectangle from (0, 0) to (width,
+    height) which are more than margin away from the edges of the cell they fall in. The low-discrepancy sequences are
+    shifted by a random offset, so each seed gives different points which are still evenly spread. Without numpy, the
+    points are drawn one at a time, uniformly at random. """
+    if numpy is None:
+        return sample_points_scalar(count, width, height, cell_dimension, margin)
+    generator = numpy.random.default_rng(seed)
+    shift = generator.random(2)
+    xs = []
+    ys = []
+    accepted = 0
+    start = 0
+    while accepted < count:
+        # Draw enough points to fill the remainder at the expected acceptance rate, with some to spare
+        batch_size = max(64, int((count - accepted) / acceptance_rate(cell_dimension, margin) * 1.1))
+        if sequence == 'random':
+            x = generator.integers(0, width, size=batch_size, endpoint=True).astype(float)
+            y = generator.integers(0, height, size=batch_size, endpoint=True).astype(float)
+        else:
+            indices = numpy.arange(start, start + batch_size, dtype=numpy.int64)
+            units = halton(indices) if sequence == 'halton' else sobol(indices)
+            units = (units + shift) % 1.0
+            x = units[:, 0] * width
+            y = units[:, 1] * height
+        start += batch_size
+        keep = is_clear_of_walls(x, cell_dimension, margin) & is_clear_of_walls(y, cell_dimension, margin)
+        x = x[keep][:count - accepted]
+        y = y[keep][:count - accepted]
+        xs.extend(x.tolist())
+        ys.extend(y.tolist())
+        accepted += len(x)
+    return xs, ys
+
+
+def sample_points_scalar(count, width, height, cell_dimension, margin):
+    """ Returns the coordinates of count points drawn one at a time, as sample_points does for the random sequence. """
+    xs = []
+    ys = []
+    while len(xs) < count:
+        x = randint(0, width)
+        y = randint(0, height)
+        if cell_dimension - (x % cell_dimension) > margin and x % cell_dimension > margin and \
+                cell_dimension - (y % cell_dimension) > margin and y % cell_dimension > margin:
+            xs.append(x)
+            ys.append(y)
+    return xs, ys
+
+
+def acceptance_rate(cell_dimension, margin):
+    """ Returns the fraction of points spread evenly over the maze which are far enough from the cell edges. """
+    return max(cell_dimension - 2 * margin - 1, 1) ** 2 / cell_dimension ** 2
+
+
+def is_clear_of_walls(values, cell_dimension, margin):
+    """ Returns a boolean array which is true for each coordinate more than margin away from both edges of its cell. """
+    offsets = values % cell_dimension
+    return (offsets > margin) & (cell_dimension - offsets > margin)
+
+
+def halton(indices):
+    """ Returns an array of shape (len(indices), 2) holding the points of the Halton sequence in bases 2 and 3 at the
+    given indices, in the unit square. """
+    return numpy.stack([radical_inverse(indices, 2), radical_inverse(indices, 3)], axis=1)
+
+
+def radical_inverse(indices, base):
+    """ Returns the radical inverse of each index in the given base, that is the digits of the index mirrored about the
+    radix point. """
+    result = numpy.zeros(len(indices))
+    remaining = indices.copy()
+    scale = 1.0 / base
+    while remaining.any():
+        result += (remaining % base) * scale
+        remaining //= base
+        scale /= base
+    return result
+
+
+def sobol(indices):
+    """ Returns an array of shape (len(indices), 2) holding the points of the two dimensional Sobol sequence at the
+    given indices, in the unit square. The first dimension is the van der Corput sequence in base 2 and the second uses
+    the primitive polynomial x + 1, whose direction numbers satisfy m(k) = 2 m(k - 1) xor m(k - 1) with m(1) = 1. """
+    first = numpy.zeros(len(indices), dtype=numpy.int64)
+    second = numpy.zeros(len(indices), dtype=numpy.int64)
+    direction = 1
+    for bit in range(SOBOL_BITS):
+        # Direction numbers are stored as integers scaled by 2 ** SOBOL_BITS
+        mask = -((indices >> bit) & 1)
+        first ^= mask & (1 << (SOBOL_BITS - 1 - bit))
+        second ^= mask & (direction << (SOBOL_BITS - 1 - bit))
+        direction = (direction << 1) ^ direction
+    return numpy.stack([first, second], axis=1) / float(1 << SOBOL_BITS)
@@ -1,10 +1,18 @@
+from collections import deque
+
+from mazerunner.MazeGrid import VISITED, IN_QUEUE, SOLUTION, CHANGED
+
+
 class UninformedSolver:
-    """ Base class for solvers which perform a search without calculating any heuristic costs. """
+    """ Base class for solvers which perform a search without calculating any heuristic costs. Cells are referred to by
+    their index in the runner's grid. The fringe is a deque, which inheriting solvers use as a queue or a stack, and a
+    cell is only added to it once, the first time it is reached in the current search generation of the grid. """
 
     def __init__(self, runner):
         self.runner = runner
+        self.grid = runner.grid
         self.path = []
-        self.queue = []
+        self.queue = deque()
         # Current and goal cells
         self.current_cell = self.runner.start_cell
         self.goal_cell = self.runner.goal_cell
@@ -16,26 +24,36 @@ class UninformedSolver:
 
     def initialise(self):
         """ Initialises the start and goal cells for the search. """
+        grid = self.grid
         self.queue.append(self.current_cell)
+        # The start cell is reached and is its own parent so it is never added to the queue again
+        grid.reached[self.current_cell] = grid.generation
+        grid.parent[self.current_cell] = self.current_cell
 
     def run(self):
         """ Performs an uninformed search. The queue behaviour is defined by solvers which inherit from this one. """
-        while True:
-            if not self.runner.running or self.runner.paused:
-                break
-            self.current_cell = self.get_next_cell()
-            self.current_cell.visited = True
-            self.current_cell.in_queue = False
-            if self.current_cell == self.goal_cell:
+        runner = self.runner
+        grid = self.grid
+        flags = grid.flags
+        parent = grid.parent
+        reached = grid.reached
+        generation = grid.generation
+        queue = self.queue
+        get_next_cell = self.get_next_cell
+        get_neighbours = grid.get_neighbours
+        while runner.running and not runner.paused:
+            cell = self.current_cell = get_next_cell()
+            flags[cell] = flags[cell] & ~IN_QUEUE | VISITED | CHANGED
+            if cell == self.goal_cell:
                 self.construct_path()
                 break
-            else:
-                for cell in self.runner.get_neighbours(self.current_cell):
-                    if cell.parent is None:
-                        self.queue.append(cell)
-                        cell.parent = self.current_cell
-                        cell.in_queue = True
-            self.runner.display.update_scene()
+            for neighbour in get_neighbours(cell):
+                if reached[neighbour] != generation:
+                    reached[neighbour] = generation
+                    parent[neighbour] = cell
+                    queue.append(neighbour)
+                    flags[neighbour] |= IN_QUEUE | CHANGED
+            runner.update_display()
 
     def recommence(self):
         """ Recommence the search. """
@@ -46,15 +64,15 @@ class UninformedSolver:
         cell = self.current_cell
         self.path.append(cell)
         while not cell == self.runner.start_cell:
-            cell.solution = True
-            self.path.append(cell.parent)
-            cell = cell.parent
-        self.runner.start_cell.solution = True
+            self.grid.set_flag(cell, SOLUTION)
+            cell = self.grid.parent[cell]
+            self.path.append(cell)
+        self.grid.set_flag(self.runner.start_cell, SOLUTION)
         self.path.reverse()
-        print(self.path)
+        print([self.grid.get_coordinates(cell) for cell in self.path])
         self.runner.solved = True
         self.runner.running = False
-        self.runner.display.update_scene(self.path)
+        self.runner.update_display(self.path)
 
     def get_next_cell(self):
         """ Returns the next cell to be visited, must be overridden. """
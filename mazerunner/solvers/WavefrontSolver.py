@@ -0,0 +1,176 @@
+""" Breadth first search which spreads a whole level of the search at once as numpy arrays, rather than expanding one
+cell at a time.
+
+The open neighbours of every cell are found up front with shifted array operations over the unpacked wall bitmaps and
+held in a table of four rows, above, right, below and left, where a wall leads to a sentinel cell which is always
+reached. Each level is then the cells of the table columns of the previous level which have not been reached, and
+the level number is recorded as the distance of each. The path is recovered by gradient descent, stepping from the
+goal to any open neighbour one step closer to the start.
+
+The frontier is held as an array of cell indices rather than as a grid of booleans. Shifting a whole grid costs time
+in proportion to the size of the maze for every level, and a maze has thousands of levels, which made the grid several
+times slower than BFSSolver. Levels of fewer than NARROW_LEVEL cells, such as along the long corridors of a depth
+first maze, are spread in Python, where the overhead of a numpy call per level would outweigh the work. Without numpy,
+the distances are found by MazeStats.get_distances.
+"""
+from array import array
+
+from mazerunner.MazeGrid import VISITED, SOLUTION, CHANGED
+from mazerunner.MazeStats import get_distances
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Number of cells below which a level is spread in Python rather than as arrays
+NARROW_LEVEL = 64
+
+
+class WavefrontSolver:
+    """ Solver which finds the distance from the start cell to every cell up to the goal, one level of the breadth
+    first search at a time, then follows the distances back down from the goal. The solution is optimal. The search is
+    not animated, the cells it reached are shown at once along with the path. """
+
+    def __init__(self, runner):
+        self.runner = runner
+        self.grid = runner.grid
+        self.path = []
+        self.current_cell = self.runner.start_cell
+        self.goal_cell = self.runner.goal_cell
+
+    def start(self):
+        """ Starts the solver."""
+        grid = self.grid
+        if numpy is None:
+            distances = array('i', get_distances(grid, self.current_cell))
+            get_neighbours = grid.get_neighbours
+        else:
+            table = get_neighbour_table(grid)
+            distances = get_wavefront_distances(grid, self.current_cell, self.goal_cell, table)
+            get_neighbours = create_table_lookup(table)
+        if distances[self.goal_cell] < 0:
+            print("Path not found")
+            self.runner.running = False
+            return
+        mark_reached(grid, distances, distances[self.goal_cell])
+        self.construct_path(distances, get_neighbours)
+
+    def recommence(self):
+        """ The search runs to completion when started, so there is nothing to recommence. """
+        pass
+
+    def construct_path(self, distances, get_neighbours):
+        """ Constructs the solution path by descending the distances from the goal to the start. """
+        grid = self.grid
+        cell = self.goal_cell
+        path = [cell]
+        distance = distances[cell]
+        while distance > 0:
+            distance -= 1
+            for neighbour in get_neighbours(cell):
+                if distances[neighbour] == distance:
+                    cell = neighbour
+                    break
+            path.append(cell)
+        path.reverse()
+        for cell in path:
+            grid.set_flag(cell, SOLUTION)
+        self.path = path
+        print([grid.get_coordinates(cell) for cell in path])
+        self.runner.solved = True
+        self.runner.running = False
+        self.runner.update_display(path)
+
+
+def get_wavefront_distances(grid, start, goal=None, table=None):
+    """ Returns a numpy array holding the number of steps from start to each cell, or -1 for cells which cannot be
+    reached, which requires numpy. If a goal is given the search stops at the level which reaches it and cells further
+    away are left at -1. table may be passed if the neighbour table of the grid has already been built. """
+    size = grid.size
+    if table is None:
+        table = get_neighbour_table(grid)
+    flat_table = memoryview(table.reshape(-1))
+    # The sentinel cell, size, which walls lead to, is always reached
+    distances = numpy.full(size + 1, -1, numpy.int32)
+    distances[size] = 0
+    distances[start] = 0
+    distance_view = memoryview(distances)
+    # Position in its level of the last occurrence written for each cell, used to keep one occurrence of each cell
+    claims = numpy.zeros(size + 1, numpy.int32)
+    positions = numpy.arange(size, dtype=numpy.int32)
+    right_row = size + 1
+    below_row = 2 * (size + 1)
+    left_row = 3 * (size + 1)
+    level = [start]
+    distance = 0
+    while len(level) and (goal is None or distance_view[goal] < 0):
+        distance += 1
+        if len(level) < NARROW_LEVEL:
+            next_level = []
+            for cell in level.tolist() if isinstance(level, numpy.ndarray) else level:
+                for neighbour in (flat_table[cell], flat_table[right_row + cell], flat_table[below_row + cell],
+                                  flat_table[left_row + cell]):
+                    if distance_view[neighbour] < 0:
+                        distance_view[neighbour] = distance
+                        next_level.append(neighbour)
+        else:
+            neighbours = table[:, level].reshape(-1)
+            next_level = neighbours[distances[neighbours] < 0]
+            # A cell reached from two cells of the level, which only happens in mazes with loops, appears twice. Only
+            # one position of each cell holds its claim, whichever was written last.
+            level_positions = positions[:len(next_level)]
+            claims[next_level] = level_positions
+            next_level = next_level[claims[next_level] == level_positions]
+            distances[next_level] = distance
+        level = next_level
+    return distances[:size]
+
+
+def get_neighbour_table(grid):
+    """ Returns a numpy array of four rows, holding the open neighbour of each cell above, right, below and left, or
+    the sentinel cell, grid.size, where there is a wall or the edge of the maze. Each row has an extra column for the
+    sentinel cell, whose neighbours are all itself. """
+    columns = grid.columns
+    rows = grid.rows
+    size = grid.size
+    bottom = unpack_bitmap(grid.bottom, size).reshape(rows, columns)
+    right = unpack_bitmap(grid.right, size).reshape(rows, columns)
+    cells = numpy.arange(size, dtype=numpy.int32).reshape(rows, columns)
+    table = numpy.full((4, size + 1), size, numpy.int32)
+    above, to_right, below, to_left = (row[:size].reshape(rows, columns) for row in table)
+    above[1:, :] = numpy.where(bottom[:-1, :], size, cells[:-1, :])
+    to_right[:, :-1] = numpy.where(right[:, :-1], size, cells[:, 1:])
+    below[:-1, :] = numpy.where(bottom[:-1, :], size, cells[1:, :])
+    to_left[:, 1:] = numpy.where(right[:, :-1], size, cells[:, :-1])
+    return table
+
+
+def create_table_lookup(table):
+    """ Returns a function which returns the open neighbours of a cell from the neighbour table. """
+    size = table.shape[1] - 1
+    flat_table = memoryview(table.reshape(-1))
+    stride = size + 1
+
+    def get_neighbours(cell):
+        return [neighbour for neighbour in (flat_table[cell], flat_table[stride + cell], flat_table[2 * stride + cell],
+                                            flat_table[3 * stride + cell]) if neighbour != size]
+    return get_neighbours
+
+
+def mark_reached(grid, distances, distance):
+    """ Marks the cells no further than distance from the start as visited. """
+    if numpy is None:
+        flags = grid.flags
+        for index, cell_distance in enumerate(distances):
+            if 0 <= cell_distance <= distance:
+                flags[index] |= VISITED | CHANGED
+    else:
+        reached = numpy.asarray(distances)
+        flags = numpy.frombuffer(grid.flags, numpy.uint8)
+        flags[(reached >= 0) & (reached <= distance)] |= VISITED | CHANGED
+
+
+def unpack_bitmap(bitmap, size):
+    """ Returns the first size bits of a packed bitmap as a numpy array of booleans. """
+    return numpy.unpackbits(numpy.frombuffer(bitmap, numpy.uint8), count=size, bitorder='little').view(bool)
@@ -0,0 +1,107 @@
+class BucketQueue:
+    """ Priority queue for keys with small non-negative integer priorities, also known as Dial's algorithm. Each
+    priority has a bucket holding the keys with that priority, and a cursor points at the lowest bucket which may be
+    non-empty. Since the cost of a cell only ever differs from that of the cell it was reached from by a small amount,
+    the cursor moves a short distance between calls and put() and get() run in amortised O(1) without comparing keys.
+
+    Keys within a bucket are returned last in, first out. For A* this means that among the cells with equal f(c) the
+    most recently reached, and therefore deepest, cell is expanded first, which reduces the number of expansions.
+
+    Keys which are re-queued with a new priority, or deleted, are left in their old bucket and skipped when reached.
+    """
+
+    def __init__(self):
+        self.buckets = []
+        self.priorities = {}
+        self.minimum = 0
+
+    def put(self, key, priority):
+        """
+        Add the specified key to the priority queue with the given priority. If the key is already in the queue its
+        priority is updated instead. The running time of this operation is O(1) amortised.
+        :param key: The key to add
+        :param priority: The priority of the key, a non-negative integer. Lower priorities are returned first
+        :return: None
+        """
+        if self.priorities.get(key) == priority:
+            return
+        self.priorities[key] = priority
+        buckets = self.buckets
+        if priority >= len(buckets):
+            buckets.extend([None] * (priority + 1 - len(buckets)))
+        bucket = buckets[priority]
+        if bucket is None:
+            buckets[priority] = [key]
+        else:
+            bucket.append(key)
+        if priority < self.minimum:
+            self.minimum = priority
+
+    def get(self):
+        """
+        Returns the most recently added key with the lowest priority and removes it from the queue. The running time of
+        this operation is proportional to the distance the cursor moves.
+        :return: The key with the lowest priority, or None if the queue is empty
+        """
+        buckets = self.buckets
+        priorities = self.priorities
+        while priorities:
+            bucket = buckets[self.minimum]
+            if bucket:
+                key = bucket.pop()
+                # Skip keys which have since been deleted or moved to another bucket
+                if priorities.get(key) == self.minimum:
+                    del priorities[key]
+                    return key
+            else:
+                self.minimum += 1
+        return None
+
+    def decrease_key(self, key, priority):
+        """
+        Lowers the priority of a key which is in the queue. Nothing is changed if the given priority is not lower than
+        the current priority of the key. The running time of this operation is O(1).
+        :param key: The key to update
+        :param priority: The new priority of the key
+        :return: None
+        """
+        if priority < self.priorities[key]:
+            self.put(key, priority)
+
+    def delete(self, key):
+        """
+        Removes the given key from the priority queue, if it is present. The running time of this operation is O(1).
+        :param key: The key to remove
+        :return: None
+        """
+        self.priorities.pop(key, None)
+
+    def contains(self, key):
+        """
+        Returns True if the given key appears in the priority queue. The running time of this operation is O(1).
+        :param key: the key to to be checked for
+        :return: True if the key is contained in this priority queue
+        """
+        return key in self.priorities
+
+    def clear(self):
+        """
+        Removes all keys from this priority queue.
+        :return: None
+        """
+        del self.buckets[:]
+        self.priorities.clear()
+        self.minimum = 0
+
+    def empty(self):
+        """
+        Returns true if this priority queue is empty.
+        :return: True if this priority queue is empty
+        """
+        return not self.priorities
+
+    def __len__(self):
+        return len(self.priorities)
+
+    def __repr__(self):
+        return str(sorted((priority, key) for key, priority in self.priorities.items()))
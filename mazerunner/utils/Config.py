@@ -13,9 +13,23 @@ DEFAULT_MAZE_COLUMNS = 24
 DEFAULT_MAZE_ROWS = 12
 DEFAULT_CELL_DIMENSION = 50
 
+# Format generated mazes are saved in, 'text', 'binary' or 'archive'
+MAZE_FILE_FORMAT = 'text'
+# Name of the archive in the mazes directory which generated mazes are appended to in the 'archive' format
+MAZE_ARCHIVE_NAME = 'mazes'
+
+# Number of processes the parallel breadth first search splits the maze between, 1 searches in the main process
+BFS_WORKERS = 1
+
 # Values for the random sample solver
 SAMPLE_MAX_NODES = 1200
 SAMPLE_MAX_DISTANCE = 100
+# Sequence the sample points are drawn from, one of 'random', 'halton' or 'sobol'
+SAMPLE_SEQUENCE = 'random'
+# Number of candidate edges tested for collisions together when numpy is available, 0 tests them one at a time
+SAMPLE_BATCH_SIZE = 65536
+# Number of processes which build the sample roadmap, 1 builds it in the main process
+SAMPLE_WORKERS = 1
 
 # Pens for drawing cell walls
 CELL_WALL_PEN = QPen(QColor(0, 0, 0), 1)
@@ -0,0 +1,197 @@
+class IndexedHeap:
+    """ Priority queue which is represented as an implicit d-ary heap of keys, each with an associated priority. The
+    keys are ordered according to their priorities, that is p(n) <= p(d) for every node n and its descendants d. Thus,
+    if the queue is non-empty, the key with the lowest priority is stored at keys[0] and is returned by get().
+
+    A position map from each key to its index in the heap is maintained alongside it, so a key can be found without
+    scanning the heap. This allows contains() to run in O(1) and delete() and decrease_key() to run in O(log(n)). A
+    wider heap has a shallower tree, which makes insertions and decreases cheaper at the expense of slightly more
+    comparisons when an item is removed.
+
+    Keys must be hashable and may only appear in the queue once.
+    """
+
+    def __init__(self, arity=4):
+        self.arity = arity
+        self.keys = []
+        self.priorities = []
+        self.positions = {}
+
+    def put(self, key, priority):
+        """
+        Add the specified key to the priority queue with the given priority. If the key is already in the queue its
+        priority is updated instead. The running time of this operation is O(log(n)).
+        :param key: The key to add
+        :param priority: The priority of the key, lower priorities are returned first
+        :return: None
+        """
+        index = self.positions.get(key)
+        if index is None:
+            self.keys.append(key)
+            self.priorities.append(priority)
+            self.sift_up(len(self.keys) - 1)
+        elif priority < self.priorities[index]:
+            self.priorities[index] = priority
+            self.sift_up(index)
+        else:
+            self.priorities[index] = priority
+            self.sift_down(index)
+
+    def get(self):
+        """
+        Returns the key at the front of the priority queue and reorders the heap such that the invariant is maintained.
+        The running time of this operation is O(log(n)).
+        :return: The key with the lowest priority, or None if the queue is empty
+        """
+        if not self.keys:
+            return None
+        key = self.keys[0]
+        del self.positions[key]
+        last_key = self.keys.pop()
+        last_priority = self.priorities.pop()
+        if self.keys:
+            self.keys[0] = last_key
+            self.priorities[0] = last_priority
+            self.sift_down(0)
+        return key
+
+    def peek(self):
+        """
+        Returns the key at the front of the priority queue without removing it. The running time of this operation is
+        O(1).
+        :return: The key with the lowest priority, or None if the queue is empty
+        """
+        return self.keys[0] if self.keys else None
+
+    def decrease_key(self, key, priority):
+        """
+        Lowers the priority of a key which is in the queue. Nothing is changed if the given priority is not lower than
+        the current priority of the key. The running time of this operation is O(log(n)).
+        :param key: The key to update
+        :param priority: The new priority of the key
+        :return: None
+        """
+        index = self.positions[key]
+        if priority < self.priorities[index]:
+            self.priorities[index] = priority
+            self.sift_up(index)
+
+    def delete(self, key):
+        """
+        Removes the given key from the priority queue, if it is present. The running time of this operation is
+        O(log(n)).
+        :param key: The key to remove
+        :return: None
+        """
+        index = self.positions.pop(key, None)
+        if index is None:
+            return None
+        last_key = self.keys.pop()
+        last_priority = self.priorities.pop()
+        if index < len(self.keys):
+            self.keys[index] = last_key
+            self.priorities[index] = last_priority
+            self.positions[last_key] = index
+            self.sift_up(index)
+            self.sift_down(self.positions[last_key])
+
+    def contains(self, key):
+        """
+        Returns True if the given key appears in the priority queue. The running time of this operation is O(1).
+        :param key: the key to to be checked for
+        :return: True if the key is contained in this priority queue
+        """
+        return key in self.positions
+
+    def priority(self, key):
+        """
+        Returns the priority of a key which is in the queue. The running time of this operation is O(1).
+        :param key: The key to look up
+        :return: The priority of the key
+        """
+        return self.priorities[self.positions[key]]
+
+    def sift_up(self, index):
+        """
+        Moves the key at the given index up the heap until its priority is greater than or equal to that of its parent
+        or it becomes the root and as such the heap invariant is preserved.
+        :param index: The index of the key to move
+        :return: None
+        """
+        keys = self.keys
+        priorities = self.priorities
+        positions = self.positions
+        arity = self.arity
+        key = keys[index]
+        priority = priorities[index]
+        while index > 0:
+            parent_index = (index - 1) // arity
+            parent_priority = priorities[parent_index]
+            if not priority < parent_priority:
+                break
+            parent_key = keys[parent_index]
+            keys[index] = parent_key
+            priorities[index] = parent_priority
+            positions[parent_key] = index
+            index = parent_index
+        keys[index] = key
+        priorities[index] = priority
+        positions[key] = index
+
+    def sift_down(self, index):
+        """
+        Moves the key at the given index down the heap until its priority is less than or equal to those of all of its
+        children and as such the heap invariant is preserved.
+        :param index: The index of the key to move
+        :return: None
+        """
+        keys = self.keys
+        priorities = self.priorities
+        positions = self.positions
+        arity = self.arity
+        size = len(keys)
+        key = keys[index]
+        priority = priorities[index]
+        while True:
+            first_child = index * arity + 1
+            if first_child >= size:
+                break
+            # Find the child with the lowest priority
+            child_index = first_child
+            child_priority = priorities[first_child]
+            for other_index in range(first_child + 1, min(first_child + arity, size)):
+                if priorities[other_index] < child_priority:
+                    child_index = other_index
+                    child_priority = priorities[other_index]
+            if not child_priority < priority:
+                break
+            child_key = keys[child_index]
+            keys[index] = child_key
+            priorities[index] = child_priority
+            positions[child_key] = index
+            index = child_index
+        keys[index] = key
+        priorities[index] = priority
+        positions[key] = index
+
+    def clear(self):
+        """
+        Removes all keys from this priority queue.
+        :return: None
+        """
+        del self.keys[:]
+        del self.priorities[:]
+        self.positions.clear()
+
+    def empty(self):
+        """
+        Returns true if this priority queue is empty.
+        :return: True if this priority queue is empty
+        """
+        return not self.keys
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __repr__(self):
+        return str(list(zip(self.priorities, self.keys)))
@@ -0,0 +1,182 @@
+from array import array
+
+from mazerunner.utils.BucketQueue import BucketQueue
+
+# Keys of the start and goal in a search, when they lie part way along a corridor rather than on a node
+START_KEY = -1
+GOAL_KEY = -2
+
+
+class JunctionGraph:
+    """ Weighted graph of the junctions and dead ends of a maze, where each corridor of cells with exactly two open
+    neighbours is contracted into a single edge whose weight is the number of steps along it. The nodes are the cells
+    which do not have two open neighbours, and one cell of any loop which has no such cell. Each edge is stored from
+    both of its ends along with the first cell of the corridor from that end, which is enough to walk the corridor and
+    expand a route through the graph back into a path of cells.
+
+    Nodes are numbered in the order they are found and the edges of node n are held in targets, weights and firsts,
+    from offsets[n] up to offsets[n + 1]. A search from or to a cell part way along a corridor walks to the two ends of
+    its corridor first. Build it through MazeGrid.get_junction_graph, which keeps it until a wall changes.
+    """
+
+    def __init__(self, grid):
+        if grid.adjacency is None:
+            grid.build_adjacency()
+        self.grid = grid
+        grid_offsets = grid.offsets
+        # Node numbers by cell and the cell of each node
+        self.node_ids = {}
+        self.node_cells = array('i')
+        for cell in range(grid.size):
+            if grid_offsets[cell + 1] - grid_offsets[cell] != 2:
+                self.node_ids[cell] = len(self.node_cells)
+                self.node_cells.append(cell)
+        # Edges of each node as (end, weight, first) triples, flattened once every corridor has been walked
+        walked = bytearray(grid.size)
+        edges = [self.walk_edges(cell, walked) for cell in self.node_cells]
+        for cell in range(grid.size):
+            if not walked[cell] and cell not in self.node_ids:
+                # A loop of corridor cells, which is made a node at this cell
+                self.node_ids[cell] = len(self.node_cells)
+                self.node_cells.append(cell)
+                edges.append(self.walk_edges(cell, walked))
+        self.offsets = array('i', [0])
+        self.targets = array('i')
+        self.weights = array('i')
+        self.firsts = array('i')
+        for node_edges in edges:
+            for end, weight, first in node_edges:
+                self.targets.append(self.node_ids[end])
+                self.weights.append(weight)
+                self.firsts.append(first)
+            self.offsets.append(len(self.targets))
+
+    def __len__(self):
+        return len(self.node_cells)
+
+    def walk_edges(self, cell, walked):
+        """ Returns a list of (end, weight, first) triples for each corridor leading from the node at cell, where end
+        is the cell of the node at its other end, weight the number of steps to it and first the first cell of the
+        corridor. The cells of each corridor are marked in walked. """
+        node_ids = self.node_ids
+        offsets = self.grid.offsets
+        adjacency = self.grid.adjacency
+        edges = []
+        for first in adjacency[offsets[cell]:offsets[cell + 1]]:
+            previous = cell
+            current = first
+            weight = 1
+            while current not in node_ids:
+                walked[current] = 1
+                index = offsets[current]
+                next_cell = adjacency[index]
+                if next_cell == previous:
+                    next_cell = adjacency[index + 1]
+                previous = current
+                current = next_cell
+                weight += 1
+            edges.append((current, weight, first))
+        return edges
+
+    def walk(self, cell, first, stop=None, path=None):
+        """ Walks along the corridor from cell through first until a node or the stop cell is reached. Returns that
+        cell, the number of steps taken and the cell stepped from onto it. The cells stepped onto are appended to path
+        if it is given. """
+        node_ids = self.node_ids
+        offsets = self.grid.offsets
+        adjacency = self.grid.adjacency
+        previous = cell
+        cell = first
+        steps = 1
+        if path is not None:
+            path.append(cell)
+        while cell != stop and cell not in node_ids:
+            index = offsets[cell]
+            next_cell = adjacency[index]
+            if next_cell == previous:
+                next_cell = adjacency[index + 1]
+            previous = cell
+            cell = next_cell
+            steps += 1
+            if path is not None:
+                path.append(cell)
+        return cell, steps, previous
+
+    def get_ends(self, cell, stop=None):
+        """ Returns a list of (key, steps, first, last) tuples for the ends of the corridor through cell, where key is
+        the number of the node at that end, first is the first cell stepped onto from cell and last the cell stepped
+        from onto the end. A node is its own end. If the stop cell is on the corridor, it is returned as GOAL_KEY in
+        place of the node beyond it. """
+        if cell in self.node_ids:
+            return [(self.node_ids[cell], 0, None, None)]
+        ends = []
+        for first in self.grid.get_neighbours(cell):
+            end, steps, last = self.walk(cell, first, stop)
+            ends.append((GOAL_KEY if end == stop else self.node_ids[end], steps, first, last))
+        return ends
+
+    def find_path(self, start, goal, heuristic=None):
+        """ Returns the shortest path of cells from start to goal, or None if there is none, along with a list of the
+        cells of the nodes which were expanded. Without a heuristic this is Dijkstra's algorithm, which over corridors
+        weighted by their length expands nodes in the order a breadth first search of the cells would reach them. A
+        heuristic, a function of a cell which never overestimates the steps from it to the goal, makes it an A*
+        search. The priorities are integers, so the queue is a bucket queue. """
+        if start == goal:
+            return [start], []
+        node_cells = self.node_cells
+        offsets = self.offsets
+        targets = self.targets
+        weights = self.weights
+        firsts = self.firsts
+        goal_key = self.node_ids.get(goal, GOAL_KEY)
+        # Steps from each end of the goal's corridor to the goal, and the first cell stepped onto from that end. Both
+        # ends are the same node if the corridor is a loop, which keeps the shorter way round.
+        goal_edges = {}
+        if goal_key == GOAL_KEY:
+            for node, steps, _, last in self.get_ends(goal):
+                if node not in goal_edges or steps < goal_edges[node][0]:
+                    goal_edges[node] = (steps, last)
+        queue = BucketQueue()
+        costs = {}
+        # The key each key was reached from, with the first cell stepped onto from it
+        parents = {}
+
+        def reach(key, cost, parent, first):
+            if key not in costs or cost < costs[key]:
+                costs[key] = cost
+                parents[key] = (parent, first)
+                queue.put(key, cost if key == GOAL_KEY or heuristic is None else cost + heuristic(node_cells[key]))
+
+        for key, steps, first, _ in self.get_ends(start, goal if goal_key == GOAL_KEY else None):
+            reach(key, steps, START_KEY, first)
+        expanded = []
+        while not queue.empty():
+            node = queue.get()
+            if node == goal_key:
+                return self.expand_route(start, goal, goal_key, parents), expanded
+            expanded.append(node_cells[node])
+            cost = costs[node]
+            for index in range(offsets[node], offsets[node + 1]):
+                reach(targets[index], cost + weights[index], node, firsts[index])
+            if node in goal_edges:
+                steps, last = goal_edges[node]
+                reach(GOAL_KEY, cost + steps, node, last)
+        return None, expanded
+
+    def expand_route(self, start, goal, goal_key, parents):
+        """ Returns the path of cells from start to goal, following the parents of the keys back from the goal and
+        walking the corridor to each. """
+        route = []
+        key = goal_key
+        while key != START_KEY:
+            parent, first = parents[key]
+            route.append((parent, first, key))
+            key = parent
+        route.reverse()
+        path = [start]
+        for parent, first, key in route:
+            if first is not None:
+                # Only the goal may lie part way along a corridor, any other key is a node the walk stops at
+                cell = start if parent == START_KEY else self.node_cells[parent]
+                self.walk(cell, first, goal if key == GOAL_KEY else None, path)
+        return path
@@ -0,0 +1,51 @@
+from math import floor
+
+# Offsets of the neighbouring buckets which are paired with a bucket in get_pairs. Only half of the eight neighbours are
+# included so that each pair of buckets is visited once.
+FORWARD_NEIGHBOURS = [(1, -1), (1, 0), (1, 1), (0, 1)]
+
+
+class SpatialHash:
+    """ Uniform grid of square buckets which store items by their position, so that the items near a point can be found
+    without comparing it against every item. If the bucket size is at least the largest distance of interest, every
+    item within that distance of a point lies in the point's bucket or one of the eight buckets around it. """
+
+    def __init__(self, bucket_size):
+        self.bucket_size = bucket_size
+        self.buckets = {}
+
+    def get_bucket(self, x, y):
+        """ Returns the key of the bucket containing the point (x, y). """
+        return floor(x / self.bucket_size), floor(y / self.bucket_size)
+
+    def insert(self, item, x, y):
+        """ Stores the item in the bucket containing the point (x, y). """
+        key = self.get_bucket(x, y)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            self.buckets[key] = [item]
+        else:
+            bucket.append(item)
+
+    def get_nearby(self, x, y):
+        """ Returns a list of the items in the bucket containing (x, y) and the eight buckets around it. """
+        bucket_x, bucket_y = self.get_bucket(x, y)
+        items = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                items.extend(self.buckets.get((bucket_x + dx, bucket_y + dy), ()))
+        return items
+
+    def get_pairs(self):
+        """ Yields every unordered pair of items which lie in the same or adjacent buckets exactly once. """
+        buckets = self.buckets
+        for (bucket_x, bucket_y), bucket in buckets.items():
+            for i, item in enumerate(bucket):
+                for other_item in bucket[i + 1:]:
+                    yield item, other_item
+            for dx, dy in FORWARD_NEIGHBOURS:
+                other_bucket = buckets.get((bucket_x + dx, bucket_y + dy))
+                if other_bucket is not None:
+                    for item in bucket:
+                        for other_item in other_bucket:
+                            yield item, other_item